@@ -75,6 +75,9 @@ from .typecontainer import *
 from .exceptions import *
 from .project import *
 from .basedetection import *
+from .batch import *
+from .flowsummary import *
+from .analysiscache import *
 # We import each of these by name to prevent conflicts between
 # log.py and the function 'log' which we don't import below
 from .log import (
@@ -404,6 +407,7 @@ def load(*args, **kwargs) -> BinaryView:
 	:param bool update_analysis: whether or not to run :func:`update_analysis_and_wait` after opening a :py:class:`BinaryView`, defaults to ``True``
 	:param callback progress_func: optional function to be called with the current progress and total count
 	:param dict options: a dictionary in the form {setting identifier string : object value}
+	:param AnalysisCache cache: optional analysis cache to open the view from or save it into, defaults to :py:func:`AnalysisCache.default`
 	:return: returns a :py:class:`BinaryView` object for the given filename
 	:rtype: :py:class:`BinaryView`
 	:raises Exception: When a BinaryView could not be created
@@ -422,7 +426,13 @@ def load(*args, **kwargs) -> BinaryView:
 		...
 		1
 	"""
-	bv = BinaryView.load(*args, **kwargs)
+	cache = kwargs.pop("cache", None)
+	if cache is None:
+		cache = AnalysisCache.default()
+	if cache is not None:
+		bv = cache.load(*args, **kwargs)
+	else:
+		bv = BinaryView.load(*args, **kwargs)
 	if bv is None:
 		raise Exception("Unable to create new BinaryView")
 	return bv
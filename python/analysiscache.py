@@ -0,0 +1,241 @@
+# Copyright (c) 2024 Vector 35 Inc
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, List, Mapping, Optional, Tuple, Union
+
+import binaryninja
+from .binaryview import BinaryView, ProgressFuncType
+from . import databuffer
+from .log import log_warn
+
+__all__ = ["AnalysisCache"]
+
+CacheSourceType = Union[str, bytes, bytearray, 'databuffer.DataBuffer', 'os.PathLike']
+
+
+class AnalysisCache:
+	"""
+	``AnalysisCache`` is an on-disk cache of analysis databases keyed by content. When a file or byte string is
+	loaded through the cache, the key is computed from the SHA-256 of its contents, the load options and the core
+	version and build. On a hit the cached ``.bndb`` is opened instead of analyzing the input again; on a miss the input
+	is loaded and analyzed as usual and the resulting database is saved into the cache.
+
+	The cache keeps at most ``max_size`` bytes of databases, evicting the least recently used ones, and can be shared
+	by several processes. It is opt-in: pass it to :py:func:`binaryninja.load` with the ``cache`` argument, or make it
+	the default for every call to :py:func:`binaryninja.load` with :py:func:`set_default`.
+
+	.. note:: A view loaded through the cache is backed by the cached database, so ``bv.file.filename`` is the path \
+	of the database. Changes saved to the view are saved to the cache entry.
+
+	:Example:
+
+		>>> cache = AnalysisCache("/var/cache/binja", max_size=50 * 1024**3)
+		>>> with binaryninja.load("/usr/lib/libc.so.6", cache=cache) as bv:  # analyzes and saves
+		... 	pass
+		>>> with binaryninja.load("/usr/lib/libc.so.6", cache=cache) as bv:  # opens the saved database
+		... 	pass
+	"""
+	_default: Optional['AnalysisCache'] = None
+	_stale_lock_seconds = 6 * 60 * 60
+
+	def __init__(self, directory: Union[str, 'os.PathLike'], max_size: Optional[int] = None):
+		self.directory = os.fspath(directory)
+		self.max_size = max_size
+		os.makedirs(self.directory, exist_ok=True)
+
+	def __repr__(self):
+		return f"<AnalysisCache {self.directory}>"
+
+	@classmethod
+	def set_default(cls, cache: Optional['AnalysisCache']) -> None:
+		"""
+		``set_default`` makes ``cache`` the cache used by :py:func:`binaryninja.load` when no ``cache`` argument is
+		given. Pass None to disable caching again.
+
+		:param AnalysisCache cache: cache to use by default, or None
+		"""
+		cls._default = cache
+
+	@classmethod
+	def default(cls) -> Optional['AnalysisCache']:
+		"""``default`` returns the cache set with :py:func:`set_default`, or None"""
+		return cls._default
+
+	@staticmethod
+	def _content_hash(source: CacheSourceType) -> Optional[str]:
+		digest = hashlib.sha256()
+		if isinstance(source, databuffer.DataBuffer):
+			digest.update(bytes(source))
+		elif isinstance(source, (bytes, bytearray)):
+			digest.update(source)
+		else:
+			path = os.fspath(source)
+			if path.endswith(".bndb") or not os.path.isfile(path):
+				return None
+			with open(path, "rb") as f:
+				for chunk in iter(lambda: f.read(1 << 20), b""):
+					digest.update(chunk)
+		return digest.hexdigest()
+
+	def key(self, source: CacheSourceType, options: Mapping[str, Any] = {}) -> Optional[str]:
+		"""
+		``key`` returns the cache key for loading ``source`` with ``options``, or None if ``source`` cannot be cached
+		(a database, a :py:class:`BinaryView` or a project file).
+
+		:param source: path or contents of the file
+		:param dict options: load options
+		:rtype: str
+		"""
+		if not isinstance(source, (str, bytes, bytearray, databuffer.DataBuffer, os.PathLike)):
+			return None
+		content = self._content_hash(source)
+		if content is None:
+			return None
+		settings = json.dumps(options, sort_keys=True, default=str)
+		version = f"{binaryninja.core_version()}:{binaryninja.core_build_id()}"
+		return hashlib.sha256(f"{content}\n{settings}\n{version}".encode("utf-8")).hexdigest()
+
+	def path_for_key(self, key: str) -> str:
+		"""``path_for_key`` returns the path of the database for ``key``, whether or not it exists"""
+		return os.path.join(self.directory, key + ".bndb")
+
+	def entries(self) -> List[Tuple[str, int, float]]:
+		"""
+		``entries`` returns the cached databases as ``(path, size, last use)`` tuples, least recently used first
+
+		:rtype: list(tuple(str, int, float))
+		"""
+		result = []
+		for entry in os.scandir(self.directory):
+			if entry.is_file() and entry.name.endswith(".bndb"):
+				try:
+					stat = entry.stat()
+				except FileNotFoundError:
+					continue
+				result.append((entry.path, stat.st_size, stat.st_mtime))
+		result.sort(key=lambda e: e[2])
+		return result
+
+	@property
+	def size(self) -> int:
+		"""Total size in bytes of the cached databases (read-only)"""
+		return sum(size for _, size, _ in self.entries())
+
+	def evict(self, keep: Optional[str] = None) -> int:
+		"""
+		``evict`` deletes the least recently used databases until the cache is no larger than ``max_size``
+
+		:param str keep: path of a database that must not be deleted
+		:return: number of bytes freed
+		:rtype: int
+		"""
+		if self.max_size is None:
+			return 0
+		entries = self.entries()
+		total = sum(size for _, size, _ in entries)
+		freed = 0
+		for path, size, _ in entries:
+			if total <= self.max_size:
+				break
+			if path == keep or os.path.exists(path + ".lock"):
+				continue
+			try:
+				os.remove(path)
+			except OSError:
+				continue
+			total -= size
+			freed += size
+		return freed
+
+	def clear(self) -> None:
+		"""``clear`` deletes every cached database"""
+		for path, _, _ in self.entries():
+			try:
+				os.remove(path)
+			except OSError:
+				pass
+
+	def _acquire(self, path: str) -> bool:
+		lock = path + ".lock"
+		try:
+			if time.time() - os.stat(lock).st_mtime > self._stale_lock_seconds:
+				os.remove(lock)
+		except OSError:
+			pass
+		try:
+			os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+			return True
+		except FileExistsError:
+			return False
+
+	def _release(self, path: str) -> None:
+		try:
+			os.remove(path + ".lock")
+		except OSError:
+			pass
+
+	def load(
+	    self, source: CacheSourceType, update_analysis: Optional[bool] = True,
+	    progress_func: Optional[ProgressFuncType] = None, options: Mapping[str, Any] = {}
+	) -> Optional[BinaryView]:
+		"""
+		``load`` behaves like :py:func:`BinaryView.load`, opening the cached database for ``source`` if there is one
+		and saving the analyzed view into the cache otherwise. Views are only saved when ``update_analysis`` is set, so
+		the cache never holds partially analyzed databases. Sources that cannot be cached are loaded directly.
+
+		:param source: path or contents of the file to load
+		:param bool update_analysis: whether to run :py:func:`BinaryView.update_analysis_and_wait` after opening
+		:param callback progress_func: optional function to be called with the current progress and total count
+		:param dict options: load options
+		:rtype: BinaryView or None
+		"""
+		key = self.key(source, options)
+		if key is None:
+			return BinaryView.load(source, update_analysis, progress_func, options)
+
+		path = self.path_for_key(key)
+		if os.path.exists(path) and not os.path.exists(path + ".lock"):
+			try:
+				os.utime(path)
+			except OSError:
+				pass
+			bv = BinaryView.load(path, update_analysis, progress_func, options)
+			if bv is not None:
+				return bv
+			log_warn(f"Analysis cache entry {path} could not be opened, analyzing {key} again")
+
+		bv = BinaryView.load(source, update_analysis, progress_func, options)
+		if bv is None or not update_analysis or not self._acquire(path):
+			return bv
+		try:
+			if not bv.create_database(path):
+				log_warn(f"Failed to save analysis cache entry {path}")
+				try:
+					os.remove(path)
+				except OSError:
+					pass
+		finally:
+			self._release(path)
+		self.evict(keep=path)
+		return bv
@@ -0,0 +1,268 @@
+# Copyright (c) 2024 Vector 35 Inc
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import multiprocessing
+import multiprocessing.connection
+import os
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+
+__all__ = ["BatchResult", "analyze_files"]
+
+PathType = Union[str, os.PathLike]
+BatchCallbackType = Callable[['binaryninja.BinaryView'], Any]
+
+
+@dataclass
+class BatchResult:
+	"""
+	``BatchResult`` is produced by :py:func:`analyze_files` for every input file.
+	"""
+	path: str
+	"""Path of the file that was analyzed"""
+
+	result: Any = None
+	"""Return value of the user callback, ``None`` if the file failed"""
+
+	error: Optional[str] = None
+	"""Error message (usually a traceback) if loading, analysis or the callback failed"""
+
+	timed_out: bool = False
+	"""True if the worker was killed because the file exceeded the timeout"""
+
+	elapsed: float = 0.0
+	"""Wall time in seconds spent on the file, including load and analysis"""
+
+	memory_usage: Mapping[str, int] = field(default_factory=dict)
+	"""Core object counts (see :py:func:`binaryninja.get_memory_usage_info`) after the callback ran"""
+
+	@property
+	def ok(self) -> bool:
+		return self.error is None and not self.timed_out
+
+	def __repr__(self):
+		if self.timed_out:
+			return f"<BatchResult {self.path}: timed out after {self.elapsed:.1f}s>"
+		if self.error is not None:
+			return f"<BatchResult {self.path}: failed>"
+		return f"<BatchResult {self.path}: {self.elapsed:.1f}s>"
+
+
+def _resident_memory() -> Optional[int]:
+	# Current (not peak) resident set size, only available where /proc/self/statm exists
+	try:
+		with open("/proc/self/statm") as f:
+			pages = int(f.read().split()[1])
+	except (OSError, ValueError, IndexError):
+		return None
+	return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _should_retire(
+    memory_usage: Mapping[str, int], max_core_objects: Optional[int], max_memory: Optional[int]
+) -> bool:
+	if max_core_objects is not None and sum(memory_usage.values()) > max_core_objects:
+		return True
+	if max_memory is not None:
+		rss = _resident_memory()
+		return rss is not None and rss > max_memory
+	return False
+
+
+def _batch_worker(
+    conn: multiprocessing.connection.Connection, callback: BatchCallbackType, load_kwargs: Dict[str, Any],
+    max_core_objects: Optional[int], max_memory: Optional[int], max_files: Optional[int]
+) -> None:
+	import binaryninja
+	processed = 0
+	while True:
+		path = conn.recv()
+		if path is None:
+			break
+		start = time.perf_counter()
+		result = BatchResult(path)
+		try:
+			with binaryninja.load(path, **load_kwargs) as bv:
+				result.result = callback(bv)
+			result.memory_usage = binaryninja.get_memory_usage_info()
+		except Exception:
+			result.error = traceback.format_exc()
+		result.elapsed = time.perf_counter() - start
+		processed += 1
+
+		retire = max_files is not None and processed >= max_files
+		retire = retire or _should_retire(binaryninja.get_memory_usage_info(), max_core_objects, max_memory)
+		try:
+			conn.send((result, retire))
+		except Exception:
+			# The callback returned something that cannot be pickled
+			result.result = None
+			result.error = traceback.format_exc()
+			conn.send((result, retire))
+		if retire:
+			break
+	conn.close()
+
+
+class _Worker:
+	def __init__(self, context, callback, load_kwargs, max_core_objects, max_memory, max_files):
+		self.conn, child_conn = context.Pipe()
+		self.process = context.Process(
+		    target=_batch_worker, args=(child_conn, callback, load_kwargs, max_core_objects, max_memory, max_files),
+		    daemon=True
+		)
+		self.process.start()
+		child_conn.close()
+		self.path: Optional[str] = None
+		self.started = 0.0
+
+	def submit(self, path: str) -> None:
+		self.path = path
+		self.started = time.perf_counter()
+		self.conn.send(path)
+
+	def stop(self) -> None:
+		try:
+			self.conn.send(None)
+		except (BrokenPipeError, EOFError, OSError):
+			pass
+		self.process.join(5)
+		self.kill()
+
+	def kill(self) -> None:
+		if self.process.is_alive():
+			self.process.kill()
+		self.process.join()
+		self.conn.close()
+
+
+def analyze_files(
+    paths: Iterable[PathType], callback: BatchCallbackType, workers: Optional[int] = None,
+    timeout: Optional[float] = None, max_core_objects: Optional[int] = None, max_memory: Optional[int] = None,
+    max_files_per_worker: Optional[int] = None, update_analysis: bool = True, options: Optional[Mapping[str, Any]] = None
+) -> Iterator[BatchResult]:
+	"""
+	``analyze_files`` loads and analyzes many files in a pool of worker processes. Each worker opens a file with
+	:py:func:`binaryninja.load` (which runs ``update_analysis_and_wait``), passes the resulting
+	:py:class:`~binaryninja.binaryview.BinaryView` to ``callback`` and sends the callback's return value back to the
+	parent. Results are yielded as soon as each file completes, in completion order.
+
+	Workers are started with the ``spawn`` method, so ``callback`` must be picklable (a module level function) and its
+	return value must be picklable too. A worker that exceeds ``timeout`` on a file is killed and replaced, a worker is
+	retired after ``max_files_per_worker`` files or once it holds too much memory after closing a file.
+
+	Memory is measured with :py:func:`binaryninja.get_memory_usage_info`: a worker is retired when the core objects
+	still alive after a file was closed (leaked views, functions, types...) add up to more than ``max_core_objects``.
+	``max_memory`` is a fallback on the worker's current resident memory in bytes.
+
+	.. note:: Scripts using this API must guard their entry point with ``if __name__ == "__main__":`` as required by \
+	the ``spawn`` start method.
+
+	.. note:: ``max_memory`` reads ``/proc/self/statm`` and is ignored on platforms without it, prefer \
+	``max_core_objects`` for a portable limit.
+
+	:param paths: files to analyze
+	:param callback: function run in the worker with the loaded BinaryView, its return value is the result
+	:param int workers: number of worker processes, defaults to ``os.cpu_count()``
+	:param float timeout: per-file timeout in seconds, covering load, analysis and the callback
+	:param int max_core_objects: number of live core objects after which a worker is recycled
+	:param int max_memory: current resident memory in bytes after which a worker is recycled
+	:param int max_files_per_worker: number of files after which a worker is recycled
+	:param bool update_analysis: whether to run analysis after loading, passed to :py:func:`binaryninja.load`
+	:param dict options: load options, passed to :py:func:`binaryninja.load`
+	:return: a generator of :py:class:`BatchResult`, one per input path
+	:rtype: Iterator[BatchResult]
+	:Example:
+
+		>>> # count_functions.py
+		>>> from binaryninja.batch import analyze_files
+		>>> def count_functions(bv):
+		...     return len(bv.functions)
+		>>> if __name__ == "__main__":
+		...     for r in analyze_files(["/bin/ls", "/bin/cat"], count_functions, workers=2, timeout=600):
+		...         print(r.path, r.result if r.ok else r.error)
+		/bin/cat 91
+		/bin/ls 134
+	"""
+	context = multiprocessing.get_context("spawn")
+	pending: List[str] = [os.fspath(p) for p in paths]
+	pending.reverse()
+	if not pending:
+		return
+	if workers is None:
+		workers = os.cpu_count() or 1
+	workers = max(1, min(workers, len(pending)))
+	load_kwargs: Dict[str, Any] = {"update_analysis": update_analysis}
+	if options is not None:
+		load_kwargs["options"] = dict(options)
+
+	def spawn() -> _Worker:
+		return _Worker(context, callback, load_kwargs, max_core_objects, max_memory, max_files_per_worker)
+
+	pool: List[_Worker] = []
+	try:
+		for _ in range(workers):
+			worker = spawn()
+			worker.submit(pending.pop())
+			pool.append(worker)
+
+		while pool:
+			wait_for = None
+			if timeout is not None:
+				now = time.perf_counter()
+				wait_for = max(0.0, min(w.started + timeout - now for w in pool))
+			ready = multiprocessing.connection.wait([w.conn for w in pool], wait_for)
+
+			for worker in list(pool):
+				if worker.conn in ready:
+					try:
+						result, retire = worker.conn.recv()
+						alive = True
+					except (EOFError, OSError):
+						result = BatchResult(worker.path, error="worker process exited unexpectedly")  # type: ignore
+						result.elapsed = time.perf_counter() - worker.started
+						retire, alive = True, False
+				elif timeout is not None and time.perf_counter() - worker.started >= timeout:
+					result = BatchResult(worker.path, timed_out=True, elapsed=time.perf_counter() - worker.started)  # type: ignore
+					retire, alive = True, False
+				else:
+					continue
+				yield result
+
+				if retire:
+					pool.remove(worker)
+					if alive:
+						worker.stop()
+					else:
+						worker.kill()
+					if not pending:
+						continue
+					worker = spawn()
+					pool.append(worker)
+				if pending:
+					worker.submit(pending.pop())
+				else:
+					pool.remove(worker)
+					worker.stop()
+	finally:
+		for worker in pool:
+			worker.kill()
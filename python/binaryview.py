@@ -19,6 +19,8 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import array
+import bisect
 import struct
 import threading
 import queue
@@ -28,10 +30,12 @@ import abc
 import json
 import pprint
 import inspect
+import math
 import os
+import re
 import uuid
 from typing import Callable, Generator, Optional, Union, Tuple, List, Mapping, Any, \
-	Iterator, Iterable, KeysView, ItemsView, ValuesView, Dict, overload
+	Iterator, Iterable, KeysView, ItemsView, ValuesView, Dict, Set, overload
 from dataclasses import dataclass
 from enum import IntFlag
 
@@ -44,7 +48,8 @@ from . import _binaryninjacore as core
 from . import decorators
 from .enums import (
     AnalysisState, SymbolType, Endianness, ModificationStatus, StringType, SegmentFlag, SectionSemantics, FindFlag,
-    TypeClass, BinaryViewEventType, FunctionGraphType, TagReferenceType, TagTypeType, RegisterValueType, DisassemblyOption
+    TypeClass, BinaryViewEventType, FunctionGraphType, TagReferenceType, TagTypeType, RegisterValueType, DisassemblyOption,
+    FunctionUpdateType
 )
 from .exceptions import RelocationWriteException, ILException, ExternalLinkException
 
@@ -437,11 +442,12 @@ class StringReference:
 	    StringType.Utf32String: "utf-32",
 	}
 
-	def __init__(self, bv: 'BinaryView', string_type: StringType, start: int, length: int):
+	def __init__(self, bv: 'BinaryView', string_type: StringType, start: int, length: int, raw: Optional[bytes] = None):
 		self._type = string_type
 		self._start = start
 		self._length = length
 		self._view = bv
+		self._raw = raw
 
 	def __repr__(self):
 		return f"<{self._type.name}: {self._start:#x}, len {self._length:#x}>"
@@ -454,10 +460,12 @@ class StringReference:
 
 	@property
 	def value(self) -> str:
-		return self._view.read(self._start, self._length).decode(self._decodings[self._type])
+		return self.raw.decode(self._decodings[self._type])
 
 	@property
 	def raw(self) -> bytes:
+		if self._raw is not None:
+			return self._raw
 		return self._view.read(self._start, self._length)
 
 	@property
@@ -1815,7 +1823,6 @@ class SymbolMapping(collections.abc.Mapping):  # type: ignore
 
 	"""
 	def __init__(self, view: 'BinaryView'):
-		self._symbol_list = None
 		self._count = None
 		self._symbol_cache: Optional[Mapping[str, List[_types.CoreSymbol]]] = None
 		self._view = view
@@ -1825,10 +1832,6 @@ class SymbolMapping(collections.abc.Mapping):  # type: ignore
 	def __repr__(self):
 		return f"<SymbolMapping {len(self)} symbols: {self._symbol_cache}>"
 
-	def __del__(self):
-		if core is not None and self._symbol_list is not None:
-			core.BNFreeSymbolList(self._symbol_list, len(self))
-
 	def __getitem__(self, key: str) -> Optional[List['_types.CoreSymbol']]:
 		if self._symbol_cache is None:
 			sym = self._view.get_symbols_by_raw_name(key)
@@ -1840,25 +1843,26 @@ class SymbolMapping(collections.abc.Mapping):  # type: ignore
 
 	def _build_symbol_cache(self):
 		count = ctypes.c_ulonglong(0)
-		self._symbol_list = core.BNGetSymbols(self._view.handle, count, None)
-		assert self._symbol_list is not None, "core.BNGetSymbols returned None"
+		symbol_list = core.BNGetSymbols(self._view.handle, count, None)
+		assert symbol_list is not None, "core.BNGetSymbols returned None"
 		self._symbol_cache = {}
 		self._count = count.value
-		for i in range(len(self)):
-			_handle = core.BNNewSymbolReference(self._symbol_list[i])
-			assert _handle is not None, "core.BNNewSymbolReference returned None"
-			sym = _types.CoreSymbol(_handle)
-			try:
-				if sym.raw_name in self._symbol_cache:
-					self._symbol_cache[sym.raw_name].append(sym)
-				else:
-					self._symbol_cache[sym.raw_name] = [sym]
-			except UnicodeDecodeError:
-				mapped_str = sym.raw_bytes.decode('charmap')
-				if mapped_str in self._symbol_cache:
-					self._symbol_cache[mapped_str].append(sym)
+		try:
+			for i in range(count.value):
+				_handle = core.BNNewSymbolReference(symbol_list[i])
+				assert _handle is not None, "core.BNNewSymbolReference returned None"
+				sym = _types.CoreSymbol(_handle)
+				try:
+					name = sym.raw_name
+				except UnicodeDecodeError:
+					name = sym.raw_bytes.decode('charmap')
+				if name in self._symbol_cache:
+					self._symbol_cache[name].append(sym)
 				else:
-					self._symbol_cache[mapped_str] = [sym]
+					self._symbol_cache[name] = [sym]
+		finally:
+			# Every CoreSymbol holds its own reference, so the list can be released right away
+			core.BNFreeSymbolList(symbol_list, count.value)
 
 	def __iter__(self) -> Iterator[str]:
 		if self._symbol_cache is None:
@@ -1912,6 +1916,200 @@ class SymbolMapping(collections.abc.Mapping):  # type: ignore
 			return default
 
 
+class SymbolIndex(BinaryDataNotification):
+	"""
+	``class SymbolIndex`` is a persistent index of every symbol in a :py:class:`BinaryView`. It is built once from the
+	core symbol list and then kept up to date through ``symbol_added``, ``symbol_updated`` and ``symbol_removed``
+	notifications, so repeated queries do not pay for a full rebuild. In addition to lookups by raw name the index
+	supports prefix and address range queries. Use :py:attr:`BinaryView.symbol_index` rather than constructing this
+	class directly: the index is kept in :py:attr:`BinaryView.session_data` so every :py:class:`BinaryView` object
+	for the same view shares one index and one notification. It is unregistered when the view is closed through its
+	context manager, or explicitly with :py:func:`close`.
+
+	:Example:
+
+		>>> bv.symbol_index['_main']
+		[<FunctionSymbol: "_main" @ 0x1dd0>]
+		>>> bv.symbol_index.get_symbols_with_prefix('_pr')
+		[<ImportedFunctionSymbol: "_printf" @ 0x1e7c>]
+		>>> bv.symbol_index.get_symbols_in_range(0x1000, 0x2000)
+		[<FunctionSymbol: "_start" @ 0x1d70>, <FunctionSymbol: "_main" @ 0x1dd0>, ...]
+	"""
+
+	_session_key = "symbol_index"
+
+	def __init__(self, view: 'BinaryView'):
+		super(SymbolIndex, self).__init__(NotificationType.SymbolUpdates)
+		self._view = view
+		self._lock = threading.RLock()
+		self._by_name: Dict[str, List['_types.CoreSymbol']] = {}
+		self._by_address: Dict[int, List['_types.CoreSymbol']] = {}
+		# Name and address each symbol was indexed under, so it can be removed after the core has changed it
+		self._entries: Dict['_types.CoreSymbol', Tuple[str, int]] = {}
+		self._addresses: List[int] = []
+		self._sorted_names: Optional[List[str]] = None
+		self._registered = False
+		# Register before reading the symbol list so nothing defined in between is missed; _add ignores duplicates
+		view.register_notification(self)
+		self._registered = True
+		count = ctypes.c_ulonglong(0)
+		symbol_list = core.BNGetSymbols(view.handle, count, None)
+		assert symbol_list is not None, "core.BNGetSymbols returned None"
+		try:
+			with self._lock:
+				for i in range(count.value):
+					_handle = core.BNNewSymbolReference(symbol_list[i])
+					assert _handle is not None, "core.BNNewSymbolReference returned None"
+					self._add(_types.CoreSymbol(_handle))
+		finally:
+			core.BNFreeSymbolList(symbol_list, count.value)
+
+	def __repr__(self):
+		return f"<SymbolIndex {len(self)} symbols>"
+
+	def __len__(self) -> int:
+		with self._lock:
+			return len(self._entries)
+
+	def __contains__(self, name: str) -> bool:
+		with self._lock:
+			return name in self._by_name
+
+	def __getitem__(self, name: str) -> List['_types.CoreSymbol']:
+		with self._lock:
+			symbols = self._by_name.get(name)
+		if symbols is None:
+			raise KeyError(f"'{name}': symbol not found")
+		return list(symbols)
+
+	def __iter__(self) -> Iterator[str]:
+		with self._lock:
+			names = list(self._by_name)
+		yield from names
+
+	def get(self, name: str, default: Optional[List['_types.CoreSymbol']] = None) -> Optional[List['_types.CoreSymbol']]:
+		try:
+			return self[name]
+		except KeyError:
+			return default
+
+	@staticmethod
+	def _name_of(sym: '_types.CoreSymbol') -> str:
+		try:
+			return sym.raw_name
+		except UnicodeDecodeError:
+			return sym.raw_bytes.decode('charmap')
+
+	def _add(self, sym: '_types.CoreSymbol') -> None:
+		if sym in self._entries:
+			return
+		name = self._name_of(sym)
+		addr = sym.address
+		self._entries[sym] = (name, addr)
+		# Lists are replaced rather than mutated so a list read under the lock stays consistent after it is released
+		if name in self._by_name:
+			self._by_name[name] = self._by_name[name] + [sym]
+		else:
+			self._by_name[name] = [sym]
+			self._sorted_names = None
+		if addr in self._by_address:
+			self._by_address[addr] = self._by_address[addr] + [sym]
+		else:
+			self._by_address[addr] = [sym]
+			bisect.insort(self._addresses, addr)
+
+	def _remove(self, sym: '_types.CoreSymbol') -> None:
+		entry = self._entries.pop(sym, None)
+		if entry is None:
+			return
+		name, addr = entry
+		remaining = [s for s in self._by_name[name] if s != sym]
+		if remaining:
+			self._by_name[name] = remaining
+		else:
+			del self._by_name[name]
+			self._sorted_names = None
+		remaining = [s for s in self._by_address.get(addr, []) if s != sym]
+		if remaining:
+			self._by_address[addr] = remaining
+		elif addr in self._by_address:
+			del self._by_address[addr]
+			i = bisect.bisect_left(self._addresses, addr)
+			if i < len(self._addresses) and self._addresses[i] == addr:
+				del self._addresses[i]
+
+	def symbol_added(self, view: 'BinaryView', sym: '_types.CoreSymbol') -> None:
+		with self._lock:
+			self._add(sym)
+
+	def symbol_updated(self, view: 'BinaryView', sym: '_types.CoreSymbol') -> None:
+		with self._lock:
+			self._remove(sym)
+			self._add(sym)
+
+	def symbol_removed(self, view: 'BinaryView', sym: '_types.CoreSymbol') -> None:
+		with self._lock:
+			self._remove(sym)
+
+	def get_symbols_at(self, addr: int) -> List['_types.CoreSymbol']:
+		"""
+		``get_symbols_at`` returns every indexed symbol defined at ``addr``, in any namespace.
+
+		:param int addr: virtual address to query
+		:return: list of symbols at ``addr``
+		:rtype: list(CoreSymbol)
+		"""
+		with self._lock:
+			return list(self._by_address.get(addr, []))
+
+	def get_symbols_in_range(self, start: int, end: int) -> List['_types.CoreSymbol']:
+		"""
+		``get_symbols_in_range`` returns every indexed symbol whose address lies in ``[start, end)``, ordered by address.
+
+		:param int start: first address of the range
+		:param int end: address one past the end of the range
+		:return: list of symbols in the range
+		:rtype: list(CoreSymbol)
+		"""
+		result = []
+		with self._lock:
+			lo = bisect.bisect_left(self._addresses, start)
+			hi = bisect.bisect_left(self._addresses, end)
+			for addr in self._addresses[lo:hi]:
+				result.extend(self._by_address[addr])
+		return result
+
+	def get_symbols_with_prefix(self, prefix: str) -> List['_types.CoreSymbol']:
+		"""
+		``get_symbols_with_prefix`` returns every indexed symbol whose raw name starts with ``prefix``, ordered by name.
+
+		:param str prefix: raw name prefix to match
+		:return: list of matching symbols
+		:rtype: list(CoreSymbol)
+		"""
+		result = []
+		with self._lock:
+			if self._sorted_names is None:
+				self._sorted_names = sorted(self._by_name)
+			names = self._sorted_names
+			i = bisect.bisect_left(names, prefix)
+			while i < len(names) and names[i].startswith(prefix):
+				result.extend(self._by_name[names[i]])
+				i += 1
+		return result
+
+	def close(self) -> None:
+		"""
+		``close`` stops tracking symbol changes for the view. :py:attr:`BinaryView.symbol_index` builds a fresh index \
+		the next time it is accessed.
+		"""
+		if self._registered:
+			self._view.unregister_notification(self)
+			self._registered = False
+		if self._view.session_data.get(self._session_key) is self:
+			del self._view.session_data[self._session_key]
+
+
 class TypeMapping(collections.abc.Mapping):  # type: ignore
 	"""
 	TypeMapping object is used to improve performance of the `bv.types` API.
@@ -2062,6 +2260,529 @@ class FunctionList:
 		return self._count
 
 
+def _arch_id(arch, arch_ids: Dict[int, int], arch_names: List[str]) -> int:
+	# Maps a core architecture handle to its index in arch_names, appending unseen architectures
+	key = ctypes.addressof(arch.contents)
+	if key not in arch_ids:
+		arch_ids[key] = len(arch_names)
+		arch_names.append(core.BNGetArchitectureName(arch))
+	return arch_ids[key]
+
+
+@dataclass(frozen=True)
+class FunctionTable:
+	"""
+	``FunctionTable`` is a columnar snapshot of every function in a BinaryView. Each column is a flat ``array.array``
+	(or NumPy array, see :py:func:`to_numpy`) where index ``i`` in every column describes the same function. Use
+	:py:func:`BinaryView.function_table` to create one.
+
+	:Example:
+
+		>>> table = bv.function_table()
+		>>> len(table)
+		4817
+		>>> # Find the ten largest functions without creating any Function objects
+		>>> for i in sorted(range(len(table)), key=table.size.__getitem__, reverse=True)[:10]:
+		...   print(hex(table.start[i]), table.name[i], table.size[i])
+	"""
+	start: 'array.array'
+	"""Function start addresses"""
+
+	lowest_address: 'array.array'
+	"""Lowest address contained in each function"""
+
+	highest_address: 'array.array'
+	"""Highest address contained in each function"""
+
+	size: 'array.array'
+	"""Sum of the basic block lengths of each function (see :py:attr:`Function.total_bytes`)"""
+
+	basic_block_count: 'array.array'
+	"""Number of basic blocks in each function"""
+
+	arch_id: 'array.array'
+	"""Index into :py:attr:`arch_names` of each function's architecture"""
+
+	analysis_skipped: 'array.array'
+	"""1 if analysis was skipped for the function, 0 otherwise"""
+
+	name: List[str]
+	"""Raw symbol name of each function"""
+
+	arch_names: List[str]
+	"""Names of the architectures referenced by :py:attr:`arch_id`"""
+
+	def __repr__(self):
+		return f"<FunctionTable {len(self)} functions>"
+
+	def __len__(self) -> int:
+		return len(self.start)
+
+	def to_numpy(self) -> Dict[str, Any]:
+		"""
+		``to_numpy`` converts the numeric columns into NumPy arrays without copying them.
+
+		:return: dict mapping column name to a NumPy array, ``name`` and ``arch_names`` are left as lists
+		:rtype: dict
+		:raises ImportError: if NumPy is not installed
+		"""
+		import numpy
+		result: Dict[str, Any] = {}
+		for column in ("start", "lowest_address", "highest_address", "size", "basic_block_count", "arch_id"):
+			result[column] = numpy.frombuffer(getattr(self, column), dtype=numpy.uint64 if column != "arch_id" else numpy.uint32)
+		result["analysis_skipped"] = numpy.frombuffer(self.analysis_skipped, dtype=numpy.uint8).astype(bool)
+		result["name"] = self.name
+		result["arch_names"] = self.arch_names
+		return result
+
+
+@dataclass(frozen=True)
+class BlockStatistics:
+	"""
+	``BlockStatistics`` holds per-block byte statistics for a range of a BinaryView. Each column is a flat
+	``array.array`` (or NumPy array, see :py:func:`to_numpy`) where index ``i`` in every column describes the same
+	block. Use :py:func:`BinaryView.get_block_statistics` to create one.
+
+	:Example:
+
+		>>> stats = bv.get_block_statistics(bv.start, bv.length, 0x1000)
+		>>> # Report high entropy blocks, which often indicate packed or encrypted data
+		>>> for i in range(len(stats)):
+		...   if stats.entropy[i] > 0.9:
+		...     print(hex(stats.address[i]), stats.entropy[i], stats.printable_ratio[i])
+	"""
+	address: 'array.array'
+	"""Start address of each block"""
+
+	length: 'array.array'
+	"""Number of bytes read for each block, the last block may be shorter than the block size"""
+
+	entropy: 'array.array'
+	"""Shannon entropy of each block, normalized to the range [0, 1] as in :py:func:`BinaryView.get_entropy`"""
+
+	printable_ratio: 'array.array'
+	"""Fraction of bytes in each block that are printable ASCII (0x20-0x7e, tab, line feed or carriage return)"""
+
+	zero_count: 'array.array'
+	"""Number of zero bytes in each block"""
+
+	longest_zero_run: 'array.array'
+	"""Length of the longest run of consecutive zero bytes in each block"""
+
+	histogram: 'array.array'
+	"""Byte value counts, 256 consecutive entries per block (see :py:func:`block_histogram`)"""
+
+	def __repr__(self):
+		return f"<BlockStatistics {len(self)} blocks>"
+
+	def __len__(self) -> int:
+		return len(self.address)
+
+	def block_histogram(self, index: int) -> 'array.array':
+		"""
+		``block_histogram`` returns the 256 byte value counts of block ``index``.
+
+		:param int index: index of the block
+		:rtype: array.array
+		"""
+		if index < 0:
+			index += len(self)
+		if not 0 <= index < len(self):
+			raise IndexError("block index out of range")
+		return self.histogram[index * 256:(index + 1) * 256]
+
+	def to_numpy(self) -> Dict[str, Any]:
+		"""
+		``to_numpy`` converts the columns into NumPy arrays without copying them. ``histogram`` is reshaped to one row \
+		of 256 counts per block.
+
+		:return: dict mapping column name to a NumPy array
+		:rtype: dict
+		:raises ImportError: if NumPy is not installed
+		"""
+		import numpy
+		result: Dict[str, Any] = {}
+		for column in ("address", "length", "zero_count", "longest_zero_run"):
+			result[column] = numpy.frombuffer(getattr(self, column), dtype=numpy.uint64)
+		for column in ("entropy", "printable_ratio"):
+			result[column] = numpy.frombuffer(getattr(self, column), dtype=numpy.float64)
+		result["histogram"] = numpy.frombuffer(self.histogram, dtype=numpy.uint64).reshape(len(self), 256)
+		return result
+
+
+class CallGraph(BinaryDataNotification):
+	"""
+	``CallGraph`` is a whole-program call graph stored as flat edge columns: edge ``i`` is a call from the function
+	starting at ``caller[i]`` to ``callee[i]``, made by the instruction at ``call_site[i]`` whose architecture is
+	``arch_names[arch_id[i]]``. Callees are reported as the addresses the core resolved for each call site, and need
+	not be the start of an existing function (e.g. unresolved imports). Use :py:func:`BinaryView.call_graph` to
+	create one.
+
+	When created with ``track=True`` the graph registers for function notifications and remembers which functions
+	were added, updated or removed; the edges of only those functions are re-extracted the next time the graph is
+	queried. Call :py:func:`close` to stop tracking.
+
+	:Example:
+
+		>>> graph = bv.call_graph()
+		>>> len(graph)
+		12873
+		>>> [hex(a) for a in graph.callers_of(bv.get_symbol_by_raw_name("_malloc").address)][:3]
+		['0x100001a20', '0x100002f10', '0x1000031c4']
+	"""
+	def __init__(self, view: 'BinaryView', track: bool = False):
+		super(CallGraph, self).__init__(NotificationType.FunctionLifetime | NotificationType.FunctionUpdated)
+		self.view = view
+		self._lock = threading.RLock()
+		self._edges: Dict[int, List[Tuple[int, int, int]]] = {}
+		self._arch_names: List[str] = []
+		self._arch_ids: Dict[int, int] = {}
+		self._dirty: Dict[int, Optional['_function.Function']] = {}
+		self._columns: Optional[Tuple['array.array', 'array.array', 'array.array', 'array.array']] = None
+		self._callers: Optional[Dict[int, List[int]]] = None
+		self._tracking = False
+
+		count = ctypes.c_ulonglong(0)
+		funcs = core.BNGetAnalysisFunctionList(view.handle, count)
+		assert funcs is not None, "core.BNGetAnalysisFunctionList returned None"
+		try:
+			for i in range(0, count.value):
+				self._edges[core.BNGetFunctionStart(funcs[i])] = self._extract(funcs[i])
+		finally:
+			core.BNFreeFunctionList(funcs, count.value)
+		if track:
+			view.register_notification(self)
+			self._tracking = True
+
+	def __repr__(self):
+		return f"<CallGraph {len(self)} edges>"
+
+	def __len__(self) -> int:
+		return len(self.caller)
+
+	def _extract(self, func) -> List[Tuple[int, int, int]]:
+		edges = []
+		site_count = ctypes.c_ulonglong(0)
+		sites = core.BNGetFunctionCallSites(func, site_count)
+		assert sites is not None, "core.BNGetFunctionCallSites returned None"
+		try:
+			for i in range(0, site_count.value):
+				arch = sites[i].arch if sites[i].arch else core.BNGetFunctionArchitecture(func)
+				arch_id = _arch_id(arch, self._arch_ids, self._arch_names)
+				callee_count = ctypes.c_ulonglong(0)
+				callees = core.BNGetCallees(self.view.handle, sites[i], callee_count)
+				assert callees is not None, "core.BNGetCallees returned None"
+				try:
+					for j in range(0, callee_count.value):
+						edges.append((callees[j], sites[i].addr, arch_id))
+				finally:
+					core.BNFreeAddressList(callees)
+		finally:
+			core.BNFreeCodeReferences(sites, site_count.value)
+		return edges
+
+	def _refresh(self) -> None:
+		with self._lock:
+			if self._dirty:
+				dirty = self._dirty
+				self._dirty = {}
+				for start, func in dirty.items():
+					if func is None:
+						self._edges.pop(start, None)
+					else:
+						self._edges[start] = self._extract(func.handle)
+				self._columns = None
+				self._callers = None
+			if self._columns is None:
+				caller = array.array("Q")
+				callee = array.array("Q")
+				call_site = array.array("Q")
+				arch_id = array.array("I")
+				for start, edges in self._edges.items():
+					for target, site, arch in edges:
+						caller.append(start)
+						callee.append(target)
+						call_site.append(site)
+						arch_id.append(arch)
+				self._columns = (caller, callee, call_site, arch_id)
+
+	def function_added(self, view: 'BinaryView', func: '_function.Function') -> None:
+		with self._lock:
+			self._dirty[func.start] = func
+
+	def function_updated(self, view: 'BinaryView', func: '_function.Function') -> None:
+		with self._lock:
+			self._dirty[func.start] = func
+
+	def function_removed(self, view: 'BinaryView', func: '_function.Function') -> None:
+		with self._lock:
+			self._dirty[func.start] = None
+
+	def close(self) -> None:
+		"""``close`` stops tracking function changes"""
+		if self._tracking:
+			self.view.unregister_notification(self)
+			self._tracking = False
+
+	@property
+	def caller(self) -> 'array.array':
+		"""Start address of the calling function of each edge"""
+		self._refresh()
+		assert self._columns is not None
+		return self._columns[0]
+
+	@property
+	def callee(self) -> 'array.array':
+		"""Called address of each edge"""
+		self._refresh()
+		assert self._columns is not None
+		return self._columns[1]
+
+	@property
+	def call_site(self) -> 'array.array':
+		"""Address of the calling instruction of each edge"""
+		self._refresh()
+		assert self._columns is not None
+		return self._columns[2]
+
+	@property
+	def arch_id(self) -> 'array.array':
+		"""Index into :py:attr:`arch_names` of the architecture of each call site"""
+		self._refresh()
+		assert self._columns is not None
+		return self._columns[3]
+
+	@property
+	def arch_names(self) -> List[str]:
+		"""Names of the architectures referenced by :py:attr:`arch_id`"""
+		self._refresh()
+		with self._lock:
+			return list(self._arch_names)
+
+	def callees_of(self, start: int) -> List[int]:
+		"""
+		``callees_of`` returns the addresses called by the function starting at ``start``, in call site order.
+
+		:param int start: start address of the calling function
+		:rtype: list(int)
+		"""
+		with self._lock:
+			self._refresh()
+			return [target for target, _, _ in self._edges.get(start, [])]
+
+	def callers_of(self, address: int) -> List[int]:
+		"""
+		``callers_of`` returns the start addresses of the functions calling ``address``, one entry per call site.
+
+		:param int address: called address
+		:rtype: list(int)
+		"""
+		with self._lock:
+			self._refresh()
+			if self._callers is None:
+				callers: Dict[int, List[int]] = {}
+				for start, edges in self._edges.items():
+					for target, _, _ in edges:
+						callers.setdefault(target, []).append(start)
+				self._callers = callers
+			return list(self._callers.get(address, []))
+
+	def to_numpy(self) -> Dict[str, Any]:
+		"""
+		``to_numpy`` converts the edge columns into NumPy arrays without copying them.
+
+		:return: dict mapping column name to a NumPy array, ``arch_names`` is left as a list
+		:rtype: dict
+		:raises ImportError: if NumPy is not installed
+		"""
+		import numpy
+		result: Dict[str, Any] = {}
+		for column in ("caller", "callee", "call_site"):
+			result[column] = numpy.frombuffer(getattr(self, column), dtype=numpy.uint64)
+		result["arch_id"] = numpy.frombuffer(self.arch_id, dtype=numpy.uint32)
+		result["arch_names"] = self.arch_names
+		return result
+
+
+class DirtyFunctionTracker(BinaryDataNotification):
+	"""
+	``DirtyFunctionTracker`` records edits to a view and works out which functions they affect, so that only those
+	functions need to be reanalyzed. Use :py:func:`BinaryView.track_dirty_functions` to start tracking and
+	:py:func:`BinaryView.reanalyze_dirty` to reanalyze the affected functions.
+
+	The following notifications mark functions dirty:
+
+		- ``data_written``: functions containing or referencing the written bytes
+		- ``type_defined``: functions referencing the type, or data variables of the type
+		- ``function_update_requested``: the function itself
+		- ``symbol_updated``: functions at or referencing the symbol's address
+
+	Notifications only record what changed; functions are resolved when :py:func:`dirty_functions` is called, so the
+	tracker adds almost no cost to the edits themselves.
+
+	:Example:
+
+		>>> tracker = bv.track_dirty_functions()
+		>>> bv.define_user_type("foo", Type.structure([(Type.int(4), "x")]))
+		>>> bv.write(here, b"\\x90\\x90")
+		>>> len(tracker.dirty_functions())
+		3
+		>>> bv.reanalyze_dirty()
+	"""
+
+	_session_key = "dirty_function_tracker"
+
+	def __init__(self, view: 'BinaryView'):
+		super(DirtyFunctionTracker, self).__init__(
+		    NotificationType.DataWritten | NotificationType.TypeDefined | NotificationType.FunctionUpdateRequested
+		    | NotificationType.SymbolUpdated
+		)
+		self.view = view
+		self._lock = threading.Lock()
+		# Start addresses of the functions reanalyze is marking, counted so concurrent calls can overlap
+		self._marking: collections.Counter = collections.Counter()
+		self._written: List[Tuple[int, int]] = []
+		self._types: Set[str] = set()
+		self._functions: Dict[int, '_function.Function'] = {}
+		self._symbols: Set[int] = set()
+		self._registered = False
+		view.register_notification(self)
+		self._registered = True
+
+	def __repr__(self):
+		return f"<DirtyFunctionTracker: {len(self._written)} writes, {len(self._types)} types, {len(self._functions)} functions, {len(self._symbols)} symbols>"
+
+	def close(self) -> None:
+		"""``close`` stops tracking edits, calling it again has no effect"""
+		if self._registered:
+			self.view.unregister_notification(self)
+			self._registered = False
+		if self.view.session_data.get(self._session_key) is self:
+			del self.view.session_data[self._session_key]
+
+	def data_written(self, view: 'BinaryView', offset: int, length: int) -> None:
+		with self._lock:
+			self._written.append((offset, length))
+
+	def type_defined(self, view: 'BinaryView', name: '_types.QualifiedName', type: '_types.Type') -> None:
+		with self._lock:
+			self._types.add(str(name))
+
+	def function_update_requested(self, view: 'BinaryView', func: '_function.Function') -> None:
+		with self._lock:
+			if func.start not in self._marking:
+				self._functions[func.start] = func
+
+	def symbol_updated(self, view: 'BinaryView', sym: '_types.CoreSymbol') -> None:
+		with self._lock:
+			self._symbols.add(sym.address)
+
+	def clear(self) -> None:
+		"""``clear`` forgets all recorded edits"""
+		self._take()
+
+	def _take(self) -> Tuple[List[Tuple[int, int]], Set[str], Dict[int, '_function.Function'], Set[int]]:
+		with self._lock:
+			pending = (self._written, self._types, self._functions, self._symbols)
+			self._written, self._types, self._functions, self._symbols = [], set(), {}, set()
+		return pending
+
+	def _pending(self) -> Tuple[List[Tuple[int, int]], Set[str], Dict[int, '_function.Function'], Set[int]]:
+		with self._lock:
+			return list(self._written), set(self._types), dict(self._functions), set(self._symbols)
+
+	def _resolve(self, pending) -> Dict['_function.Function', None]:
+		written, types, functions, symbols = pending
+		# Dicts keep the result ordered and de-duplicated
+		result: Dict['_function.Function', None] = dict.fromkeys(functions.values())
+
+		def add_refs(addr: int, length: Optional[int] = None) -> None:
+			for ref in self.view.get_code_refs(addr, length):
+				if ref.function is not None:
+					result[ref.function] = None
+
+		for offset, length in written:
+			# A function overlapping the write either contains its first byte or has a basic block starting inside it
+			addr = offset
+			while addr < offset + length:
+				result.update(dict.fromkeys(self.view.get_functions_containing(addr)))
+				next_block = self.view.get_next_basic_block_start_after(addr)
+				if next_block <= addr:
+					break
+				addr = next_block
+			add_refs(offset, length)
+		for name in types:
+			for ref in self.view.get_code_refs_for_type(name):
+				if ref.function is not None:
+					result[ref.function] = None
+			for addr in self.view.get_data_refs_for_type(name):
+				add_refs(addr)
+		for addr in symbols:
+			result.update(dict.fromkeys(self.view.get_functions_at(addr)))
+			add_refs(addr)
+		return result
+
+	def _add_callers(self, result: Dict['_function.Function', None], caller_depth: Optional[int]) -> None:
+		frontier = list(result)
+		depth = 0
+		while frontier and (caller_depth is None or depth < caller_depth):
+			next_frontier = []
+			for func in frontier:
+				for caller in func.callers:
+					if caller not in result:
+						result[caller] = None
+						next_frontier.append(caller)
+			frontier = next_frontier
+			depth += 1
+
+	def dirty_functions(self, caller_depth: Optional[int] = 1) -> List['_function.Function']:
+		"""
+		``dirty_functions`` returns the functions affected by the edits recorded since tracking started or since the
+		last :py:func:`reanalyze` or :py:func:`clear`. Callers of affected functions are included up to ``caller_depth``
+		levels, since a changed function can change the analysis of its callers (e.g. through an updated return type).
+
+		:param int caller_depth: number of levels of callers to include, or None for all transitive callers
+		:rtype: list(Function)
+		"""
+		result = self._resolve(self._pending())
+		if caller_depth != 0:
+			self._add_callers(result, caller_depth)
+		return list(result)
+
+	def reanalyze(
+	    self, caller_depth: Optional[int] = 1, update_type: FunctionUpdateType = FunctionUpdateType.UserFunctionUpdate
+	) -> List['_function.Function']:
+		"""
+		``reanalyze`` marks the functions returned by :py:func:`dirty_functions` as requiring updates, clears the
+		recorded edits and starts an analysis update. The directly affected functions also have their callers marked
+		through :py:func:`Function.mark_caller_updates_required`. This function does not wait for the analysis to finish.
+
+		:param int caller_depth: number of levels of callers to include, or None for all transitive callers
+		:param enums.FunctionUpdateType update_type: (optional) Desired update type
+		:return: the functions marked for reanalysis
+		:rtype: list(Function)
+		"""
+		direct = self._resolve(self._take())
+		result = dict(direct)
+		if caller_depth != 0:
+			self._add_callers(result, caller_depth)
+		marking = collections.Counter(func.start for func in result)
+		with self._lock:
+			self._marking.update(marking)
+		try:
+			for func in result:
+				func.mark_updates_required(update_type)
+			if caller_depth != 0:
+				for func in direct:
+					func.mark_caller_updates_required(update_type)
+		finally:
+			with self._lock:
+				self._marking -= marking
+		if result:
+			self.view.update_analysis()
+		return list(result)
+
+
 class AdvancedILFunctionList:
 	"""
 	The purpose of this class is to generate IL functions IL function in the background
@@ -2440,6 +3161,11 @@ class BinaryView:
 		return self
 
 	def __exit__(self, type, value, traceback):
+		# Session-scoped helpers (symbol index, dirty function tracker, flow summary cache) hold notification
+		# registrations on the view, so they are closed along with it
+		for key, helper in list(self.session_data.items()):
+			if getattr(helper, "_session_key", None) == key:
+				helper.close()
 		self.file.close()
 
 	def __del__(self):
@@ -2979,6 +3705,94 @@ class BinaryView:
 		"""returns a FunctionList object (read-only)"""
 		return FunctionList(self)
 
+	def function_table(self) -> FunctionTable:
+		"""
+		``function_table`` builds a :py:class:`FunctionTable` snapshot of every function in the view in a single pass.
+		Function properties are read directly from the core handles, so no :py:class:`~binaryninja.function.Function`
+		or :py:class:`~binaryninja.basicblock.BasicBlock` objects are created. This is considerably faster than
+		iterating ``bv.functions`` when only these basic properties are required.
+
+		:return: a columnar snapshot of the functions in the view
+		:rtype: FunctionTable
+		:Example:
+
+			>>> table = bv.function_table()
+			>>> table.name[0], hex(table.start[0]), table.size[0]
+			('_init', '0x1000', 27)
+			>>> columns = table.to_numpy()
+			>>> columns["start"][columns["basic_block_count"] > 100]
+			array([4198400, 4203520], dtype=uint64)
+		"""
+		start = array.array("Q")
+		lowest = array.array("Q")
+		highest = array.array("Q")
+		size = array.array("Q")
+		block_count = array.array("Q")
+		arch_id = array.array("I")
+		skipped = array.array("B")
+		names: List[str] = []
+		arch_names: List[str] = []
+		arch_ids: Dict[int, int] = {}
+
+		count = ctypes.c_ulonglong(0)
+		funcs = core.BNGetAnalysisFunctionList(self.handle, count)
+		assert funcs is not None, "core.BNGetAnalysisFunctionList returned None"
+		try:
+			for i in range(0, count.value):
+				func = funcs[i]
+				start.append(core.BNGetFunctionStart(func))
+				lowest.append(core.BNGetFunctionLowestAddress(func))
+				highest.append(core.BNGetFunctionHighestAddress(func))
+				skipped.append(1 if core.BNIsFunctionAnalysisSkipped(func) else 0)
+
+				arch = core.BNGetFunctionArchitecture(func)
+				assert arch is not None, "core.BNGetFunctionArchitecture returned None"
+				arch_id.append(_arch_id(arch, arch_ids, arch_names))
+
+				sym = core.BNGetFunctionSymbol(func)
+				assert sym is not None, "core.BNGetFunctionSymbol returned None"
+				try:
+					names.append(core.BNGetSymbolRawName(sym))
+				except UnicodeDecodeError:
+					names.append(_types.CoreSymbol(core.BNNewSymbolReference(sym)).raw_bytes.decode("charmap"))
+				finally:
+					core.BNFreeSymbol(sym)
+
+				block_total = 0
+				blocks_count = ctypes.c_ulonglong(0)
+				blocks = core.BNGetFunctionBasicBlockList(func, blocks_count)
+				assert blocks is not None, "core.BNGetFunctionBasicBlockList returned None"
+				try:
+					for j in range(0, blocks_count.value):
+						block_total += core.BNGetBasicBlockLength(blocks[j])
+				finally:
+					core.BNFreeBasicBlockList(blocks, blocks_count.value)
+				size.append(block_total)
+				block_count.append(blocks_count.value)
+		finally:
+			core.BNFreeFunctionList(funcs, count.value)
+
+		return FunctionTable(start, lowest, highest, size, block_count, arch_id, skipped, names, arch_names)
+
+	def call_graph(self, track: bool = False) -> CallGraph:
+		"""
+		``call_graph`` extracts every call edge in the view in a single pass over the functions' call sites. Edges are
+		stored as integer columns, so no :py:class:`~binaryninja.function.Function` or
+		:py:class:`ReferenceSource` objects are created, unlike walking :py:attr:`Function.callees` or
+		:py:attr:`Function.callers` for every function.
+
+		:param bool track: keep the graph up to date by re-extracting the edges of functions reported by \
+		``function_added``, ``function_updated`` and ``function_removed`` notifications
+		:return: the call graph of the view
+		:rtype: CallGraph
+		:Example:
+
+			>>> graph = bv.call_graph()
+			>>> for i in range(3):
+			...   print(hex(graph.caller[i]), hex(graph.call_site[i]), hex(graph.callee[i]))
+		"""
+		return CallGraph(self, track)
+
 	def mlil_functions(
 	    self, preload_limit: Optional[int] = None,
 		function_generator: Optional[Generator['_function.Function', None, None]] = None
@@ -3087,6 +3901,30 @@ class BinaryView:
 		"""
 		return SymbolMapping(self)
 
+	@property
+	def symbol_index(self) -> SymbolIndex:
+		"""
+		Persistent index of all symbols in the view (read-only). The index is built on first access and then kept \
+		up to date incrementally through symbol notifications, so it is cheap to query repeatedly, and supports prefix \
+		and address range lookups. The index is opt-in: until it is first accessed no symbol notification is \
+		registered, and :py:attr:`symbols` never uses it. It is shared by all :py:class:`BinaryView` objects for this \
+		view, call :py:func:`SymbolIndex.close` to stop tracking.
+
+		:Example:
+
+			>>> bv.symbol_index.get_symbols_with_prefix('_ma')
+			[<FunctionSymbol: "_main" @ 0x1dd0>]
+			>>> bv.symbol_index.get_symbols_at(0x1dd0)
+			[<FunctionSymbol: "_main" @ 0x1dd0>]
+
+		:rtype: SymbolIndex
+		"""
+		index = self.session_data.get(SymbolIndex._session_key)
+		if index is None:
+			index = SymbolIndex(self)
+			self.session_data[SymbolIndex._session_key] = index
+		return index
+
 	@staticmethod
 	def internal_namespace() -> '_types.NameSpace':
 		"""Internal namespace for the current BinaryView"""
@@ -4122,6 +4960,36 @@ class BinaryView:
 		buf = databuffer.DataBuffer(handle=core.BNReadViewBuffer(self.handle, addr, length))
 		return bytes(buf)
 
+	def read_into(self, addr: int, buffer: Any) -> int:
+		r"""
+		``read_into`` reads data from virtual address ``addr`` directly into the writable, contiguous ``buffer`` (e.g. a
+		``bytearray``, ``memoryview``, ``array.array`` or NumPy array), filling at most ``len(buffer)`` bytes. Unlike
+		:py:func:`read` no intermediate ``DataBuffer`` or ``bytes`` objects are created, so a buffer can be reused for
+		bulk reads of large regions.
+
+		:param int addr: virtual address to read from.
+		:param buffer: writable object supporting the buffer protocol to receive the data.
+		:return: the number of bytes read, which is less than the buffer size on error or if the data runs out
+		:rtype: int
+		:Example:
+
+			>>> buf = bytearray(0x1000)
+			>>> bv.read_into(bv.start, buf)
+			4096
+			>>> bytes(buf[:4])
+			b'Ïúíþ'
+		"""
+		if addr < 0:
+			raise ValueError("address must be positive")
+		view = buffer.memoryview() if isinstance(buffer, databuffer.DataBuffer) else memoryview(buffer)
+		if view.readonly:
+			raise TypeError("buffer must be writable")
+		length = view.nbytes
+		if length == 0:
+			return 0
+		dest = (ctypes.c_ubyte * length).from_buffer(view.cast('B'))
+		return core.BNReadViewData(self.handle, dest, addr, length)
+
 	def read_int(self, address: int, size: int, sign: bool = True, endian: Optional[Endianness] = None) -> int:
 		_endian = self.endianness
 		if endian is not None:
@@ -4245,6 +5113,58 @@ class BinaryView:
 			result.append(float(data[i]))
 		return result
 
+	def get_block_statistics(self, addr: int, length: int, block_size: int = 0) -> BlockStatistics:
+		"""
+		``get_block_statistics`` computes entropy, byte histograms, printable ratio and zero-run statistics for every \
+		``block_size`` chunk of the ``length`` bytes starting at ``addr``. The range is read once, and the results are \
+		returned as a columnar :py:class:`BlockStatistics` rather than as one list per statistic. This is much faster \
+		than calling :py:func:`get_entropy` once per block, e.g. when building an entropy map of a whole file.
+
+		:param int addr: virtual address
+		:param int length: total length in bytes
+		:param int block_size: optional block size, defaults to a single block covering the whole range
+		:return: per-block statistics
+		:rtype: BlockStatistics
+		:Example:
+
+			>>> stats = bv.get_block_statistics(bv.start, bv.length, 0x1000)
+			>>> max(range(len(stats)), key=stats.entropy.__getitem__)
+			12
+		"""
+		if block_size < 0:
+			raise ValueError("block_size must not be negative")
+		address = array.array('Q')
+		lengths = array.array('Q')
+		entropy = array.array('d')
+		printable_ratio = array.array('d')
+		zero_count = array.array('Q')
+		longest_zero_run = array.array('Q')
+		histogram = array.array('Q')
+		if length <= 0:
+			return BlockStatistics(address, lengths, entropy, printable_ratio, zero_count, longest_zero_run, histogram)
+		if block_size == 0:
+			block_size = length
+		data = self.read(addr, length)
+		printable = [0x09, 0x0a, 0x0d] + list(range(0x20, 0x7f))
+		zero_run = re.compile(b'\x00+')
+		for offset in range(0, len(data), block_size):
+			block = data[offset:offset + block_size]
+			total = len(block)
+			counts = [0] * 256
+			# H = log2(n) - sum(c * log2(c)) / n, accumulated while filling the histogram
+			weighted = 0.0
+			for value, count in collections.Counter(block).items():
+				counts[value] = count
+				weighted += count * math.log2(count)
+			address.append(addr + offset)
+			lengths.append(total)
+			entropy.append(max(0.0, math.log2(total) - weighted / total) / 8)
+			printable_ratio.append(sum(counts[c] for c in printable) / total)
+			zero_count.append(counts[0])
+			longest_zero_run.append(max((m.end() - m.start() for m in zero_run.finditer(block)), default=0) if counts[0] else 0)
+			histogram.extend(counts)
+		return BlockStatistics(address, lengths, entropy, printable_ratio, zero_count, longest_zero_run, histogram)
+
 	def get_modification(self, addr: int, length: Optional[int] = None) -> List[ModificationStatus]:
 		"""
 		``get_modification`` returns the modified bytes of up to ``length`` bytes from virtual address ``addr``, or if
@@ -6963,6 +7883,67 @@ class BinaryView:
 		finally:
 			core.BNFreeStringReferenceList(strings)
 
+	def iter_strings(
+	    self, start: Optional[int] = None, length: Optional[int] = None, chunk_size: int = 0x100000,
+	    prefetch: bool = False
+	) -> Generator['StringReference', None, None]:
+		"""
+		``iter_strings`` is a streaming variant of :py:func:`get_strings`. It walks the allocated ranges of the view in
+		``chunk_size`` byte windows and only fetches the strings of one window at a time, so the first results are
+		available immediately, memory stays bounded and iteration can be stopped early.
+
+		When ``prefetch`` is set, the bytes of all strings in a window are read with a single view read and attached
+		to the yielded :py:class:`StringReference` objects, so accessing ``value`` or ``raw`` does not read the view
+		again.
+
+		:param int start: optional virtual address to start from, defaults to the start of the binary
+		:param int length: optional length of the range to search, defaults to the rest of the binary
+		:param int chunk_size: size in bytes of each window passed to the core
+		:param bool prefetch: read the string contents in bulk for each window
+		:return: a generator of the strings in address order
+		:rtype: Generator[StringReference, None, None]
+		:Example:
+
+			>>> for s in bv.iter_strings(prefetch=True):
+			...   if "password" in s.value:
+			...     print(s)
+			...     break
+			<AsciiString: 0x100003f20, len 0x10>
+		"""
+		if chunk_size <= 0:
+			raise ValueError("chunk_size must be greater than zero")
+		if start is None:
+			start = self.start
+		end = self.end if length is None else start + length
+		for allocated in self.allocated_ranges:
+			chunk_start = max(start, allocated.start)
+			range_end = min(end, allocated.end)
+			while chunk_start < range_end:
+				chunk_end = min(chunk_start + chunk_size, range_end)
+				count = ctypes.c_ulonglong(0)
+				strings = core.BNGetStringsInRange(self.handle, chunk_start, chunk_end - chunk_start, count)
+				assert strings is not None, "core.BNGetStringsInRange returned None"
+				try:
+					# Strings spanning a window boundary are only reported by the window they start in
+					found = [(StringType(strings[i].type), strings[i].start, strings[i].length)
+					         for i in range(0, count.value) if chunk_start <= strings[i].start < chunk_end]
+				finally:
+					core.BNFreeStringReferenceList(strings)
+
+				if prefetch and found:
+					data_start = min(s[1] for s in found)
+					data = self.read(data_start, max(s[1] + s[2] for s in found) - data_start)
+					for string_type, string_start, string_length in found:
+						offset = string_start - data_start
+						raw = data[offset:offset + string_length]
+						yield StringReference(
+						    self, string_type, string_start, string_length, raw if len(raw) == string_length else None
+						)
+				else:
+					for string_type, string_start, string_length in found:
+						yield StringReference(self, string_type, string_start, string_length)
+				chunk_start = chunk_end
+
 	def get_string_at(self, addr: int, partial: bool = False) -> Optional['StringReference']:
 		"""
 		``get_string_at`` returns the string that falls on given virtual address.
@@ -8776,6 +9757,212 @@ to a the type "tagRECT" found in the typelibrary "winX64common"
 
 			return self.QueueGenerator(t, results)
 
+	@staticmethod
+	def _byte_pattern_mask(pattern: Union[bytes, bytearray, str, Tuple[bytes, bytes]]) -> Tuple[bytes, bytes]:
+		if isinstance(pattern, str):
+			digits = "".join(pattern.split())
+			if len(digits) == 0 or len(digits) % 2 != 0:
+				raise ValueError(f"pattern {pattern!r} must contain an even, non-zero number of hex digits or '?'")
+			value = bytearray()
+			mask = bytearray()
+			for i in range(0, len(digits), 2):
+				v = 0
+				m = 0
+				for ch in digits[i:i + 2]:
+					v <<= 4
+					m <<= 4
+					if ch != '?':
+						v |= int(ch, 16)
+						m |= 0xf
+				value.append(v)
+				mask.append(m)
+		elif isinstance(pattern, tuple):
+			value, mask = bytes(pattern[0]), bytes(pattern[1])
+			if len(value) != len(mask):
+				raise ValueError("pattern data and mask must have the same length")
+		elif isinstance(pattern, (bytes, bytearray)):
+			value = bytes(pattern)
+			mask = b'\xff' * len(value)
+		else:
+			raise TypeError("pattern must be bytes, a hex string, or a (data, mask) tuple")
+		if len(value) == 0:
+			raise ValueError("pattern must not be empty")
+		return bytes(value), bytes(mask)
+
+	class _PatternAutomaton:
+		"""
+		Aho-Corasick automaton over the longest run of fully fixed bytes (the anchor) of each pattern. The remaining
+		masked bytes are checked with per-position 256 entry acceptance tables once the anchor has been found. Patterns
+		without any fixed byte are checked at every position.
+		"""
+		def __init__(self, patterns: List[Tuple[bytes, bytes]], ignore_case: bool):
+			def fold(b: int) -> int:
+				return b | 0x20 if ignore_case and 0x41 <= b <= 0x5a else b
+
+			self.lengths = [len(value) for value, _ in patterns]
+			self.checks: List[List[Tuple[int, bytes]]] = []
+			self.unanchored: List[int] = []
+			goto: List[Dict[int, int]] = [{}]
+			outputs: List[List[Tuple[int, int]]] = [[]]
+			for index, (value, mask) in enumerate(patterns):
+				anchor_start, anchor_len, run = 0, 0, 0
+				for i, m in enumerate(mask):
+					run = run + 1 if m == 0xff else 0
+					if run > anchor_len:
+						anchor_start, anchor_len = i + 1 - run, run
+				checks = []
+				for i, (v, m) in enumerate(zip(value, mask)):
+					if m == 0 or anchor_start <= i < anchor_start + anchor_len:
+						continue
+					checks.append((i, bytes(1 if fold(b) & m == fold(v) & m or b & m == v & m else 0 for b in range(256))))
+				self.checks.append(checks)
+				if anchor_len == 0:
+					self.unanchored.append(index)
+					continue
+				state = 0
+				for b in value[anchor_start:anchor_start + anchor_len]:
+					b = fold(b)
+					if b not in goto[state]:
+						goto.append({})
+						outputs.append([])
+						goto[state][b] = len(goto) - 1
+					state = goto[state][b]
+				# A match of this anchor ending at position p means the pattern starts at p + 1 - end
+				outputs[state].append((index, anchor_start + anchor_len))
+
+			# Breadth first construction of the full transition table, stored flat with states premultiplied by 256
+			fail = [0] * len(goto)
+			delta = [0] * (len(goto) * 256)
+			order = deque()
+			for b, child in goto[0].items():
+				delta[b] = child * 256
+				order.append(child)
+			while order:
+				state = order.popleft()
+				outputs[state] = outputs[state] + outputs[fail[state]]
+				for b in range(256):
+					child = goto[state].get(b)
+					if child is None:
+						delta[state * 256 + b] = delta[fail[state] * 256 + b]
+					else:
+						fail[child] = delta[fail[state] * 256 + b] // 256
+						delta[state * 256 + b] = child * 256
+						order.append(child)
+			if ignore_case:
+				for state in range(len(goto)):
+					for b in range(0x41, 0x5b):
+						delta[state * 256 + b] = delta[state * 256 + (b | 0x20)]
+			self.delta = delta
+			self.outputs = [tuple(out) for out in outputs]
+
+		def scan(self, data: bytearray, length: int, limit: int) -> List[Tuple[int, int]]:
+			"""``scan`` returns sorted ``(offset, pattern_index)`` for the matches starting before ``limit``"""
+			delta = self.delta
+			outputs = self.outputs
+			lengths = self.lengths
+			checks = self.checks
+			found = []
+			state = 0
+			for pos in range(length):
+				state = delta[state + data[pos]]
+				hits = outputs[state >> 8]
+				if hits:
+					for index, end in hits:
+						offset = pos + 1 - end
+						if offset < limit and offset + lengths[index] <= length and \
+						    all(table[data[offset + i]] for i, table in checks[index]):
+							found.append((offset, index))
+			for index in self.unanchored:
+				for offset in range(min(limit, length - lengths[index] + 1)):
+					if all(table[data[offset + i]] for i, table in checks[index]):
+						found.append((offset, index))
+			found.sort()
+			return found
+
+	def find_all_patterns(
+	    self, patterns: Iterable[Union[bytes, bytearray, str, Tuple[bytes, bytes]]], start: Optional[int] = None,
+	    end: Optional[int] = None, ignore_case: bool = False, batch_size: int = 4096, chunk_size: int = 0x1000000
+	) -> Generator[List[Tuple[int, int, bytes]], None, None]:
+		"""
+		``find_all_patterns`` searches for a whole set of fixed-length byte patterns in a single pass over the segments \
+		between ``start`` and ``end``. The patterns are compiled once into an Aho-Corasick automaton which is run over \
+		the view data read into a single reused buffer with :py:func:`read_into`. Unlike :py:func:`find_all_data` \
+		matches are not delivered one callback at a time; instead the generator yields lists of up to ``batch_size`` \
+		``(address, pattern_index, data)`` tuples ordered by address. Matches may overlap, several patterns may match \
+		at the same address, and matches may span adjacent segments.
+
+		Each pattern can be given as:
+
+			- ``bytes``, matched exactly
+			- a string of hexadecimal digits where whitespace is ignored and ``?`` is a wildcard nibble, as in :py:func:`search`
+			- a ``(data, mask)`` tuple of equal-length ``bytes``, where only the bits set in ``mask`` must match
+
+		.. note:: The automaton is keyed on the longest run of fully fixed bytes in each pattern. Patterns without any \
+		fixed byte have to be checked at every address and are much slower to search for.
+
+		:param patterns: the patterns to search for
+		:param int start: virtual address to start searching from (default: start of the view)
+		:param int end: virtual address to end the search, exclusive (default: end of the view)
+		:param bool ignore_case: whether ASCII letters match regardless of case (default: False)
+		:param int batch_size: maximum number of matches yielded at once (default: 4096)
+		:param int chunk_size: number of bytes read from the view at a time (default: 16MiB)
+		:return: a generator of lists of ``(address, pattern_index, data)`` tuples
+		:rtype: Generator[List[Tuple[int, int, bytes]], None, None]
+		:Example:
+
+			>>> for batch in bv.find_all_patterns([b"\\x55\\x48\\x89\\xe5", "e8 ?? ?? ?? ??", (b"\\x00\\x10", b"\\x00\\xf0")]):
+			... 	for addr, index, data in batch:
+			... 		print(hex(addr), index, data.hex())
+			...
+			0x100000f50 0 554889e5
+			>>>
+		"""
+		if batch_size <= 0 or chunk_size <= 0:
+			raise ValueError("batch_size and chunk_size must be positive")
+		compiled = [self._byte_pattern_mask(p) for p in patterns]
+		if len(compiled) == 0:
+			return
+		if start is None:
+			start = self.start
+		if end is None:
+			end = self.end
+		automaton = BinaryView._PatternAutomaton(compiled, ignore_case)
+		overlap = max(automaton.lengths) - 1
+
+		# Adjacent segments are merged so that matches crossing a segment boundary are found
+		ranges = []
+		bounds = [(segment.start, segment.end) for segment in self.segments] or [(start, end)]
+		for lo, hi in sorted(bounds):
+			lo = max(start, lo)
+			hi = min(end, hi)
+			if lo >= hi:
+				continue
+			if ranges and lo <= ranges[-1][1]:
+				ranges[-1] = (ranges[-1][0], max(hi, ranges[-1][1]))
+			else:
+				ranges.append((lo, hi))
+
+		# Consecutive windows overlap by the longest pattern length minus one so that every match lies entirely within
+		# the window in which it starts
+		buf = bytearray(chunk_size + overlap)
+		window = memoryview(buf)
+		batch = []
+		for lo, hi in ranges:
+			pos = lo
+			while pos < hi:
+				length = self.read_into(pos, window[:min(chunk_size + overlap, hi - pos)])
+				if length == 0:
+					break
+				limit = min(chunk_size, length)
+				for offset, index in automaton.scan(buf, length, limit):
+					batch.append((pos + offset, index, bytes(buf[offset:offset + automaton.lengths[index]])))
+					if len(batch) == batch_size:
+						yield batch
+						batch = []
+				pos += limit
+		if batch:
+			yield batch
+
 	def _LinearDisassemblyLine_convertor(
 	    self, lines: core.BNLinearDisassemblyLineHandle
 	) -> 'lineardisassembly.LinearDisassemblyLine':
@@ -9026,6 +10213,40 @@ to a the type "tagRECT" found in the typelibrary "winX64common"
 		"""
 		core.BNReanalyzeAllFunctions(self.handle)
 
+	def track_dirty_functions(self) -> DirtyFunctionTracker:
+		"""
+		``track_dirty_functions`` starts recording which functions are affected by edits to the view, such as writes,
+		type definitions and symbol changes, so that :py:func:`reanalyze_dirty` can reanalyze only those functions.
+		The tracker is shared by all :py:class:`BinaryView` objects for this view; calling this again returns the
+		existing tracker.
+
+		:rtype: DirtyFunctionTracker
+		"""
+		tracker = self.session_data.get(DirtyFunctionTracker._session_key)
+		if tracker is None:
+			tracker = DirtyFunctionTracker(self)
+			self.session_data[DirtyFunctionTracker._session_key] = tracker
+		return tracker
+
+	def reanalyze_dirty(
+	    self, caller_depth: Optional[int] = 1, update_type: FunctionUpdateType = FunctionUpdateType.UserFunctionUpdate
+	) -> List['_function.Function']:
+		"""
+		``reanalyze_dirty`` reanalyzes only the functions affected by edits since :py:func:`track_dirty_functions` was
+		called, or since the previous ``reanalyze_dirty``, instead of every function as :py:func:`reanalyze` does. See
+		:py:func:`DirtyFunctionTracker.reanalyze`. This function does not wait for the analysis to finish.
+
+		:param int caller_depth: number of levels of callers to include, or None for all transitive callers
+		:param enums.FunctionUpdateType update_type: (optional) Desired update type
+		:return: the functions marked for reanalysis
+		:rtype: list(Function)
+		:raises ValueError: if dirty function tracking was not started
+		"""
+		tracker = self.session_data.get(DirtyFunctionTracker._session_key)
+		if tracker is None:
+			raise ValueError("Dirty function tracking was not started, call track_dirty_functions first")
+		return tracker.reanalyze(caller_depth, update_type)
+
 	@property
 	def workflow(self) -> Optional['_workflow.Workflow']:
 		handle = core.BNGetWorkflowForBinaryView(self.handle)
@@ -10545,6 +11766,236 @@ class StructuredDataView(object):
 		return rv
 
 
+class _TypedRecordPlan:
+	"""
+	Decoding plan for a fixed-layout :py:class:`~binaryninja.types.Type`. The type is flattened once into leaf fields
+	that are unpacked together with a single ``struct.Struct`` per record, and a tree of small builder functions
+	reassembles the leaves into the same values ``TypedDataAccessor.value`` produces.
+	"""
+	_int_codes = {1: 'b', 2: 'h', 4: 'i', 8: 'q'}
+	_float_codes = {2: 'e', 4: 'f', 8: 'd'}
+
+	def __init__(self, _type: '_types.Type', view: 'BinaryView', endian: Endianness):
+		self.view = view
+		self.endian = endian
+		self._prefix = "<" if endian == Endianness.LittleEndian else ">"
+		self._text_encoding = f"utf-16-{'le' if endian == Endianness.LittleEndian else 'be'}"
+		self._leaves: List[Tuple[int, str, int]] = []
+		self._positions: List[int] = []
+		self.type = self._resolve(_type)
+		self.size = len(self.type)
+		self._build = self._compile(self.type, 0)
+		order = sorted(range(len(self._leaves)), key=lambda i: self._leaves[i][0])
+		fmt = self._prefix
+		end = 0
+		overlapping = False
+		for i in order:
+			offset, code, width = self._leaves[i]
+			if offset < end:
+				overlapping = True
+				break
+			if offset > end:
+				fmt += f"{offset - end}x"
+			fmt += code
+			end = offset + width
+		if overlapping:
+			# Unions overlap, so each leaf is unpacked separately at its own offset
+			self._struct = None
+			self._leaf_structs = [(offset, struct.Struct(self._prefix + code)) for offset, code, _ in self._leaves]
+			self._positions[:] = range(len(self._leaves))
+		else:
+			self._struct = struct.Struct(fmt)
+			self._leaf_structs = []
+			for position, i in enumerate(order):
+				self._positions[i] = position
+
+	def _resolve(self, _type: '_types.Type') -> '_types.Type':
+		if not isinstance(_type, _types.Type):
+			raise TypeError(f"Attempting to decode TypeBuilder of type {type(_type)}")
+		if isinstance(_type, _types.NamedTypeReferenceType):
+			target = _type.target(self.view)
+			if target is None:
+				raise ValueError(f"Couldn't find target for type {_type}")
+			return target
+		return _type
+
+	def _leaf(self, offset: int, code: str, width: int) -> int:
+		self._leaves.append((offset, code, width))
+		self._positions.append(len(self._positions))
+		return len(self._leaves) - 1
+
+	def _compile_int(self, offset: int, width: int, signed: bool) -> Callable[[Tuple], int]:
+		positions = self._positions
+		if width in self._int_codes:
+			code = self._int_codes[width] if signed else self._int_codes[width].upper()
+			i = self._leaf(offset, code, width)
+			return lambda values: values[positions[i]]
+		i = self._leaf(offset, f"{width}s", width)
+		byteorder = TypedDataAccessor.byte_order(self.endian)
+		return lambda values: int.from_bytes(values[positions[i]], byteorder=byteorder, signed=signed)  # type: ignore
+
+	def _compile(self, _type: '_types.Type', offset: int) -> Callable[[Tuple], Any]:
+		_type = self._resolve(_type)
+		positions = self._positions
+		if isinstance(_type, (_types.VoidType, _types.FunctionType)):
+			return lambda values: None
+		elif isinstance(_type, _types.BoolType):
+			get_int = self._compile_int(offset, _type.width, False)
+			return lambda values: bool(get_int(values))
+		elif isinstance(_type, _types.EnumerationType):
+			get_int = self._compile_int(offset, _type.width, bool(_type.signed))
+			members: Dict[int, Any] = {}
+			for member in _type.members:
+				members.setdefault(int(member), member)
+
+			def build_enum(values: Tuple) -> Any:
+				value = get_int(values)
+				return members.get(value, value)
+
+			return build_enum
+		elif isinstance(_type, _types.IntegerType):
+			return self._compile_int(offset, _type.width, bool(_type.signed))
+		elif isinstance(_type, _types.PointerType):
+			return self._compile_int(offset, _type.width, False)
+		elif isinstance(_type, _types.FloatType):
+			if _type.width not in self._float_codes:
+				raise ValueError(f"Could not convert to float with width {_type.width}")
+			i = self._leaf(offset, self._float_codes[_type.width], _type.width)
+			return lambda values: values[positions[i]]
+		elif isinstance(_type, _types.WideCharType):
+			i = self._leaf(offset, f"{_type.width}s", _type.width)
+			encoding = self._text_encoding
+			return lambda values: values[positions[i]].decode(encoding)
+		elif isinstance(_type, _types.StructureType):
+			fields = [(member.name, self._compile(member.type, offset + member.offset)) for member in _type.members]
+			return lambda values: {name: build(values) for name, build in fields}
+		elif isinstance(_type, _types.ArrayType):
+			element_type = _type.element_type
+			if element_type is None:
+				raise ValueError("Can not get value for Array type with no element type")
+			if element_type.width == 1 and element_type.type_class == TypeClass.IntegerTypeClass:
+				i = self._leaf(offset, f"{len(_type)}s", len(_type))
+				return lambda values: values[positions[i]]
+			if element_type.width == 2 and element_type.type_class == TypeClass.WideCharTypeClass:
+				i = self._leaf(offset, f"{len(_type)}s", len(_type))
+				encoding = self._text_encoding
+				return lambda values: values[positions[i]].decode(encoding)
+			elements = [self._compile(element_type, offset + n * element_type.width) for n in range(_type.count)]
+			return lambda values: [build(values) for build in elements]
+		else:
+			raise TypeError(f"Unhandled `Type` {type(_type)}")
+
+	def unpack(self, data: Union[bytes, memoryview], offset: int = 0) -> Any:
+		if self._struct is not None:
+			values = self._struct.unpack_from(data, offset)
+		else:
+			values = tuple(leaf.unpack_from(data, offset + leaf_offset)[0] for leaf_offset, leaf in self._leaf_structs)
+		return self._build(values)
+
+	def numpy_dtype(self) -> Any:
+		import numpy
+		return numpy.dtype(self._numpy_dtype(self.type))
+
+	def _numpy_dtype(self, _type: '_types.Type') -> Any:
+		import numpy
+		_type = self._resolve(_type)
+		width = _type.width
+		if isinstance(_type, _types.EnumerationType) and width in self._int_codes:
+			# Enumerations are stored as their raw values, NumPy has no notion of the member names
+			return numpy.dtype(f"{self._prefix}{'i' if _type.signed else 'u'}{width}")
+		elif isinstance(_type, (_types.IntegerType, _types.BoolType, _types.PointerType)) and width in self._int_codes:
+			signed = isinstance(_type, _types.IntegerType) and bool(_type.signed)
+			return numpy.dtype(f"{self._prefix}{'i' if signed else 'u'}{width}")
+		elif isinstance(_type, _types.WideCharType) and width in (2, 4):
+			return numpy.dtype(f"{self._prefix}u{width}")
+		elif isinstance(_type, _types.FloatType) and width in self._float_codes:
+			return numpy.dtype(f"{self._prefix}f{width}")
+		elif isinstance(_type, _types.StructureType):
+			members = [m for m in _type.members if m.type.width > 0]
+			return numpy.dtype({
+			    "names": [m.name for m in members],
+			    "formats": [self._numpy_dtype(m.type) for m in members],
+			    "offsets": [m.offset for m in members],
+			    "itemsize": width
+			})
+		elif isinstance(_type, _types.ArrayType) and _type.element_type is not None and _type.count > 0:
+			element_type = self._resolve(_type.element_type)
+			if element_type.width == 1 and element_type.type_class == TypeClass.IntegerTypeClass:
+				return numpy.dtype(f"S{width}")
+			return numpy.dtype((self._numpy_dtype(element_type), (_type.count, )))
+		return numpy.dtype(f"V{width}")
+
+
+class TypedRecordArray(collections.abc.Sequence):  # type: ignore
+	"""
+	``TypedRecordArray`` is a lazily decoded sequence of ``count`` consecutive records of the same type. The whole
+	region is read from the view once, and each record is decoded on access using a plan compiled once for the type.
+	Records decode to the same values as :py:attr:`TypedDataAccessor.value`: structures become dicts, enumerations
+	become :py:class:`~binaryninja.types.EnumerationMember` objects where possible and pointers are left as integers.
+	Use :py:func:`TypedDataAccessor.records` to create one.
+
+	:Example:
+
+		>>> records = bv.typed_data_accessor(0x100003f00, bv.parse_type_string("struct reloc[1024]")[0]).records()
+		>>> records[0]
+		{'r_offset': 4198400, 'r_info': 17179869191}
+		>>> table = records.to_numpy()
+		>>> table["r_offset"][:4]
+		array([4198400, 4198408, 4198416, 4198424], dtype=uint64)
+	"""
+	def __init__(self, plan: _TypedRecordPlan, address: int, count: int):
+		self._plan = plan
+		self.address = address
+		self.stride = plan.size
+		self.data = plan.view.read(address, count * self.stride)
+		self._count = len(self.data) // self.stride if self.stride else count
+
+	def __repr__(self):
+		return f"<TypedRecordArray {self._plan.type} x {len(self)} @ {self.address:#x}>"
+
+	def __len__(self) -> int:
+		return self._count
+
+	@overload
+	def __getitem__(self, index: int) -> Any:
+		...
+
+	@overload
+	def __getitem__(self, index: slice) -> List[Any]:
+		...
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return [self._plan.unpack(self.data, i * self.stride) for i in range(*index.indices(len(self)))]
+		if index < 0:
+			index += len(self)
+		if not 0 <= index < len(self):
+			raise IndexError("record index out of range")
+		return self._plan.unpack(self.data, index * self.stride)
+
+	def __iter__(self) -> Iterator[Any]:
+		unpack = self._plan.unpack
+		for i in range(len(self)):
+			yield unpack(self.data, i * self.stride)
+
+	@property
+	def type(self) -> '_types.Type':
+		"""Type of each record, with named type references resolved (read-only)"""
+		return self._plan.type
+
+	def to_numpy(self) -> Any:
+		"""
+		``to_numpy`` returns the records as a NumPy structured array sharing memory with the data read from the view.
+		Integral, pointer, boolean and float fields map to the matching NumPy scalar types, byte arrays map to ``S``
+		fields and any other leaf is exposed as raw ``V`` bytes.
+
+		:rtype: numpy.ndarray
+		:raises ImportError: if NumPy is not installed
+		"""
+		import numpy
+		return numpy.frombuffer(self.data, dtype=self._plan.numpy_dtype(), count=len(self))
+
+
 @dataclass
 class TypedDataAccessor:
 	type: '_types.Type'
@@ -10715,6 +12166,37 @@ class TypedDataAccessor:
 		else:
 			raise TypeError(f"Unhandled `Type` {type(_type)}")
 
+	def records(self, count: Optional[int] = None) -> TypedRecordArray:
+		"""
+		``records`` decodes many records of the same type in bulk. If the accessor's type is an array, its elements
+		are decoded, otherwise ``count`` consecutive values of the accessor's type starting at its address are. The
+		type is compiled once into a decoding plan and the whole region is read in a single call, which is much faster
+		than walking ``self[i].value`` for large tables.
+
+		:param int count: number of records to decode, defaults to the length of the array type
+		:return: a lazily decoded sequence of records
+		:rtype: TypedRecordArray
+		:Example:
+
+			>>> accessor = bv.typed_data_accessor(0x100003f00, Type.array(Type.int(8, False), 4))
+			>>> list(accessor.records())
+			[4198400, 4198408, 4198416, 4198424]
+		"""
+		_type = self.type
+		if isinstance(_type, _types.NamedTypeReferenceType):
+			target = _type.target(self.view)
+			if target is None:
+				raise ValueError(f"Couldn't get target of type {_type}")
+			_type = target
+		if count is None:
+			if not isinstance(_type, _types.ArrayType) or _type.element_type is None:
+				raise ValueError("count is required unless the accessor's type is an array")
+			count = _type.count
+			_type = _type.element_type
+		if count < 0:
+			raise ValueError("count must not be negative")
+		return TypedRecordArray(_TypedRecordPlan(_type, self.view, self.endian), self.address, count)
+
 	def as_uuid(self, ms_format: bool = True) -> uuid.UUID:
 		"""
 		Converts the object to a UUID object using Microsoft byte ordering.
@@ -18,7 +18,11 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from dataclasses import dataclass
+import array
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Container, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
 from .flowgraph import FlowGraph, FlowGraphNode
 from .enums import BranchType
 from .interaction import show_graph_report
@@ -55,6 +59,38 @@ class BaseILInstruction:
 	def show_hierarchy_graph(cls):
 		show_graph_report(f"{cls.__name__}", cls.add_subgraph(FlowGraph(), {}))
 
+	def walk(
+	    self, cb: Optional[Callable[..., Any]] = None, post_cb: Optional[Callable[..., Any]] = None,
+	    operations: Optional[Container] = None, skip_operations: Optional[Container] = None
+	) -> Iterator[Any]:
+		"""
+		``walk`` is a non-recursive variant of ``traverse`` with operation filters and pruning, see :py:func:`traverse_il`
+
+		:Example:
+			>>> ops = {MediumLevelILOperation.MLIL_LOAD, MediumLevelILOperation.MLIL_STORE}
+			>>> list(inst.walk(lambda i: i.address, operations=ops))
+		"""
+		yield from traverse_il([self], cb, post_cb, operations, skip_operations)
+
+
+class BaseILFunction:
+	def _traverse_roots(self) -> List[BaseILInstruction]:
+		return list(self.instructions)  # type: ignore
+
+	def walk(
+	    self, cb: Optional[Callable[..., Any]] = None, post_cb: Optional[Callable[..., Any]] = None,
+	    operations: Optional[Container] = None, skip_operations: Optional[Container] = None
+	) -> Iterator[Any]:
+		"""
+		``walk`` runs :py:func:`traverse_il` over every instruction of the function
+
+		:Example:
+			>>> # Call destinations, without looking inside the calls themselves
+			>>> calls = {MediumLevelILOperation.MLIL_CALL}
+			>>> list(current_il_function.walk(lambda i: i.dest, operations=calls, skip_operations=calls))
+		"""
+		yield from traverse_il(self._traverse_roots(), cb, post_cb, operations, skip_operations)
+
 
 @dataclass(frozen=True, repr=False, eq=False)
 class Constant(BaseILInstruction):
@@ -204,3 +240,259 @@ class SSAVariableInstruction(SSA, VariableInstruction):
 @dataclass(frozen=True, repr=False, eq=False)
 class AliasedVariableInstruction(VariableInstruction):
 	pass
+
+
+class ILTraverseAction(Enum):
+	"""
+	Signals which can be returned from a :py:func:`traverse_il` callback to steer the traversal. Any other return
+	value is yielded to the caller as usual (``None`` is never yielded).
+	"""
+	PruneChildren = 0
+	"""Do not descend into the operands of the current instruction"""
+
+	Stop = 1
+	"""End the traversal immediately"""
+
+
+# Names of the operands of each instruction class that hold IL instructions, recorded the first time a class is seen
+_il_instruction_operands: Dict[type, Tuple[str, ...]] = {}
+
+
+def _il_children(instr: BaseILInstruction) -> List[BaseILInstruction]:
+	names = _il_instruction_operands.get(type(instr))
+	if names is None:
+		names = tuple(
+		    name for name, _, operand_type in instr.detailed_operands  # type: ignore
+		    if operand_type.endswith("ILInstruction") or operand_type.endswith("ILInstruction]")
+		)
+		_il_instruction_operands[type(instr)] = names
+	result = []
+	for name in names:
+		op = getattr(instr, name)
+		if isinstance(op, BaseILInstruction):
+			result.append(op)
+		elif isinstance(op, list) and all(isinstance(i, BaseILInstruction) for i in op):
+			result.extend(op)
+	return result
+
+
+def traverse_il(
+    roots: Iterable[BaseILInstruction], cb: Optional[Callable[..., Any]] = None,
+    post_cb: Optional[Callable[..., Any]] = None, operations: Optional[Container] = None,
+    skip_operations: Optional[Container] = None, args: Tuple[Any, ...] = (), kwargs: Optional[dict] = None
+) -> Iterator[Any]:
+	"""
+	``traverse_il`` walks one or more IL instruction trees depth-first using an explicit stack, so arbitrarily deep
+	trees do not run into Python's recursion limit. This is the engine behind the ``traverse`` and ``walk`` methods of
+	the LLIL, MLIL and HLIL instruction and function classes.
+
+	:param roots: instructions to start from, visited in order
+	:param cb: pre-order callback, called as ``cb(instr, *args, **kwargs)``. Its result is yielded unless it is \
+	``None`` or an :py:class:`ILTraverseAction`
+	:param post_cb: post-order callback, called after all operands of an instruction have been visited
+	:param operations: if given, callbacks are only invoked for instructions whose ``operation`` is in this container. \
+	This does not reduce the decoding cost, every instruction of the tree is still created to be visited; use \
+	``skip_operations`` or :py:attr:`ILTraverseAction.PruneChildren` to avoid descending into subtrees
+	:param skip_operations: instructions whose ``operation`` is in this container are visited but not descended into
+	:param args: extra positional arguments passed to the callbacks
+	:param kwargs: extra keyword arguments passed to the callbacks
+	:return: an iterator of the non-``None`` callback results
+	:rtype: Iterator[Any]
+	:Example:
+
+		>>> # Collect call destinations without visiting the inside of any call
+		>>> calls = {MediumLevelILOperation.MLIL_CALL, MediumLevelILOperation.MLIL_TAILCALL}
+		>>> list(traverse_il(current_mlil.instructions, lambda i: i.dest, operations=calls, skip_operations=calls))
+		[<MediumLevelILConstPtr: 0x1040>]
+	"""
+	if kwargs is None:
+		kwargs = {}
+	stack: List[Tuple[BaseILInstruction, bool]] = [(root, False) for root in reversed(list(roots))]
+	while stack:
+		instr, exiting = stack.pop()
+		if exiting:
+			if (result := post_cb(instr, *args, **kwargs)) is not None:  # type: ignore
+				yield result
+			continue
+
+		prune = False
+		matched = operations is None or instr.operation in operations  # type: ignore
+		if matched and cb is not None:
+			result = cb(instr, *args, **kwargs)
+			if result is ILTraverseAction.Stop:
+				return
+			elif result is ILTraverseAction.PruneChildren:
+				prune = True
+			elif result is not None:
+				yield result
+		if matched and post_cb is not None:
+			stack.append((instr, True))
+		if prune or (skip_operations is not None and instr.operation in skip_operations):  # type: ignore
+			continue
+		children = _il_children(instr)
+		for child in reversed(children):
+			stack.append((child, False))
+
+
+@dataclass(frozen=True)
+class SSADefUseGraph:
+	"""
+	``SSADefUseGraph`` is a compact, whole-function snapshot of the SSA definitions and uses of an MLIL or HLIL SSA
+	function, created by ``ssa_def_use_graph``. Every SSA variable version is an entry ``i`` described by the columns
+	``var_id[i]`` (an index into :py:attr:`variables`), ``version[i]`` and ``definition[i]``; its uses are
+	``uses[use_offsets[i]:use_offsets[i + 1]]``. Memory versions are stored the same way in the ``memory_*`` columns.
+	Definitions and uses are instruction indices for MLIL and expression indices for HLIL, with ``-1`` marking a
+	version without a definition. All columns are ``array.array`` objects, so data-flow passes can run over them
+	without further calls into the core.
+
+	:Example:
+
+		>>> graph = current_mlil.ssa_def_use_graph()
+		>>> for i in range(len(graph)):
+		...   print(graph.ssa_var(i), graph.definition[i], list(graph.uses_of(i)))
+		<SSAVariable: arg1 version 0> -1 [3, 7]
+		...
+		>>> networkx.DiGraph(graph.adjacency())
+	"""
+	il_function: Any
+	variables: List[Any]
+	var_id: 'array.array'
+	version: 'array.array'
+	definition: 'array.array'
+	use_offsets: 'array.array'
+	uses: 'array.array'
+	memory_version: 'array.array'
+	memory_definition: 'array.array'
+	memory_use_offsets: 'array.array'
+	memory_uses: 'array.array'
+	_index: Dict[Tuple[Any, int], int] = field(init=False, repr=False, compare=False)
+
+	def __post_init__(self):
+		# Reverse index from (Variable, version) to entry, built once so index_of is a dict lookup
+		index = {(self.variables[var_index], version): i for i, (var_index, version) in enumerate(zip(self.var_id, self.version))}
+		object.__setattr__(self, "_index", index)
+
+	def __repr__(self):
+		return f"<SSADefUseGraph {len(self)} SSA variables, {len(self.memory_version)} memory versions>"
+
+	def __len__(self) -> int:
+		return len(self.var_id)
+
+	def uses_of(self, index: int) -> 'array.array':
+		"""``uses_of`` returns the instruction indices using SSA variable entry ``index``"""
+		return self.uses[self.use_offsets[index]:self.use_offsets[index + 1]]
+
+	def memory_uses_of(self, index: int) -> 'array.array':
+		"""``memory_uses_of`` returns the instruction indices using memory version entry ``index``"""
+		return self.memory_uses[self.memory_use_offsets[index]:self.memory_use_offsets[index + 1]]
+
+	def ssa_var(self, index: int) -> Any:
+		"""``ssa_var`` returns the :py:class:`~binaryninja.mediumlevelil.SSAVariable` described by entry ``index``"""
+		from .mediumlevelil import SSAVariable
+		return SSAVariable(self.variables[self.var_id[index]], self.version[index])
+
+	def index_of(self, ssa_var: Any) -> int:
+		"""
+		``index_of`` returns the entry describing ``ssa_var``
+
+		:raises KeyError: if the SSA variable is not part of the graph
+		"""
+		i = self._index.get((ssa_var.var, ssa_var.version))
+		if i is None:
+			raise KeyError(f"{ssa_var} not found")
+		return i
+
+	def adjacency(self, memory: bool = True) -> Dict[int, Dict[int, Dict[str, List[int]]]]:
+		"""
+		``adjacency`` builds a dict-of-dicts adjacency structure from defining to using instructions, which can be
+		passed directly to ``networkx.DiGraph``. Each edge carries a ``vars`` list of SSA variable entries and, when
+		``memory`` is set, a ``memory`` list of memory version entries flowing along it.
+
+		:param bool memory: include edges for memory versions
+		:rtype: dict
+		"""
+		result: Dict[int, Dict[int, Dict[str, List[int]]]] = {}
+		columns = [("vars", self.definition, self.use_offsets, self.uses)]
+		if memory:
+			columns.append(("memory", self.memory_definition, self.memory_use_offsets, self.memory_uses))
+		for key, definitions, offsets, uses in columns:
+			for i, def_index in enumerate(definitions):
+				if def_index < 0:
+					continue
+				edges = result.setdefault(def_index, {})
+				for use_index in uses[offsets[i]:offsets[i + 1]]:
+					result.setdefault(use_index, {})
+					edge = edges.setdefault(use_index, {"vars": [], "memory": []})
+					edge[key].append(i)
+		return result
+
+
+def ssa_memory_versions(
+    expr_count: int, get_operands: Callable[[int], Tuple[int, Any]], get_operand_list: Callable[[int, int], List[int]],
+    memory_operands: Mapping[Any, Tuple[Tuple[int, bool], ...]]
+) -> List[int]:
+	"""
+	``ssa_memory_versions`` returns, in ascending order, every memory version defined or used by the ``expr_count``
+	SSA expressions of a function, plus the initial version 0. Versions are not guaranteed to be consecutive.
+
+	No instruction objects are built: ``get_operands`` returns the raw ``(operation, operands)`` of an expression index,
+	``memory_operands`` maps each operation with memory operands to ``(operand_index, is_list)`` pairs, and
+	``get_operand_list`` reads list operands by expression and operand index.
+	"""
+	versions = {0}
+	for expr_index in range(expr_count):
+		operation, operands = get_operands(expr_index)
+		slots = memory_operands.get(operation)
+		if slots is None:
+			continue
+		for operand_index, is_list in slots:
+			if is_list:
+				versions.update(get_operand_list(expr_index, operand_index))
+			else:
+				versions.add(operands[operand_index])
+	return sorted(versions)
+
+
+def build_ssa_def_use_graph(
+    il_function: Any, variables: Iterable[Tuple[Any, Any, Iterable[int]]], get_definition: Callable[[Any, int], int],
+    get_uses: Callable[[Any, int], List[int]], memory_versions: Iterable[int], get_memory_definition: Callable[[int], int],
+    get_memory_uses: Callable[[int], List[int]], index_count: int
+) -> SSADefUseGraph:
+	"""
+	Shared builder for ``ssa_def_use_graph``. ``variables`` yields ``(Variable, core_variable, versions)`` tuples, the
+	variable getters are called with the core variable, ``memory_versions`` lists the memory versions present in the
+	function (see :py:func:`ssa_memory_versions`), and all getters return raw core indices, where any index at or
+	above ``index_count`` means "no definition".
+	"""
+	var_list = []
+	var_id = array.array('I')
+	version = array.array('I')
+	definition = array.array('q')
+	use_offsets = array.array('Q', [0])
+	uses = array.array('Q')
+	for var, core_var, versions in variables:
+		var_index = len(var_list)
+		var_list.append(var)
+		for v in versions:
+			var_id.append(var_index)
+			version.append(v)
+			d = get_definition(core_var, v)
+			definition.append(d if d < index_count else -1)
+			uses.extend(get_uses(core_var, v))
+			use_offsets.append(len(uses))
+
+	memory_version = array.array('I')
+	memory_definition = array.array('q')
+	memory_use_offsets = array.array('Q', [0])
+	memory_uses = array.array('Q')
+	for v in memory_versions:
+		d = get_memory_definition(v)
+		memory_version.append(v)
+		memory_definition.append(d if d < index_count else -1)
+		memory_uses.extend(get_memory_uses(v))
+		memory_use_offsets.append(len(memory_uses))
+
+	return SSADefUseGraph(
+	    il_function, var_list, var_id, version, definition, use_offsets, uses, memory_version, memory_definition,
+	    memory_use_offsets, memory_uses
+	)
@@ -19,7 +19,8 @@
 # IN THE SOFTWARE.
 
 import ctypes
-from typing import Optional, Union
+import weakref
+from typing import List, Optional, Union
 
 # Binary Ninja components
 from . import _binaryninjacore as core
@@ -29,6 +30,7 @@ DataBufferInputType = Union[str, bytes, 'DataBuffer', int]
 
 class DataBuffer:
 	def __init__(self, contents: Union[str, bytes, 'DataBuffer', int] = b"", handle=None):
+		self._exports: List[weakref.ref] = []
 		if handle is not None:
 			self.handle = core.handle_of_type(handle, core.BNDataBuffer)
 		elif isinstance(contents, int):
@@ -53,6 +55,47 @@ class DataBuffer:
 	def __len__(self):
 		return int(core.BNGetDataBufferLength(self.handle))
 
+	def _export(self) -> ctypes.Array:
+		length = len(self)
+		if length == 0:
+			contents = (ctypes.c_ubyte * 0)()
+		else:
+			data = core.BNGetDataBufferContents(self.handle)
+			assert data is not None, "core.BNGetDataBufferContents returned None"
+			contents = (ctypes.c_ubyte * length).from_address(data)
+		# The array pins this DataBuffer so the core-owned memory outlives every view onto it
+		contents._data_buffer = self
+		self._exports = [ref for ref in self._exports if ref() is not None]
+		self._exports.append(weakref.ref(contents))
+		return contents
+
+	def _check_resizable(self) -> None:
+		if any(ref() is not None for ref in self._exports):
+			raise BufferError("cannot resize a DataBuffer while a memoryview of it exists")
+
+	def __buffer__(self, flags: int) -> memoryview:
+		# Only consulted by Python 3.12+ (PEP 688), use memoryview() for code that must run on older versions
+		return memoryview(self._export()).cast('B')
+
+	def memoryview(self) -> memoryview:
+		"""
+		``memoryview`` returns a writable ``memoryview`` of the buffer contents without copying them. The view keeps
+		the DataBuffer alive; the buffer cannot be resized while any view of it exists.
+
+		.. note:: On Python 3.12 and later a DataBuffer can also be passed directly to ``memoryview()`` and other \
+		buffer protocol consumers. This method is the portable entry point that works on every supported version.
+
+		:Example:
+
+			>>> buf = DataBuffer(b"\\x7fELF")
+			>>> view = buf.memoryview()
+			>>> bytes(view[1:])
+			b'ELF'
+			>>> numpy.frombuffer(view, dtype=numpy.uint8)
+			array([127,  69,  76,  70], dtype=uint8)
+		"""
+		return memoryview(self._export()).cast('B')
+
 	def __getitem__(self, i) -> bytes:
 		if isinstance(i, tuple):
 			result = bytes()
@@ -72,7 +115,7 @@ class DataBuffer:
 				ctypes.memmove(buf, data, stop - start)
 				return buf.raw
 			else:
-				return bytes(self)[i]
+				return bytes(self.memoryview()[i])
 		elif i < 0:
 			if i >= -len(self):
 				return core.BNGetDataBufferByte(self.handle, int(len(self) + i)).to_bytes(1, "little")
@@ -92,6 +135,7 @@ class DataBuffer:
 			if stop < start:
 				stop = start
 			if len(value) != (stop - start):
+				self._check_resizable()
 				data = bytes(self)
 				data = data[0:start] + value + data[stop:]
 				core.BNSetDataBufferContents(self.handle, data, len(data))
@@ -131,11 +175,12 @@ class DataBuffer:
 		return buf.raw.decode('utf8')
 
 	def __bytes__(self):
-		buf = ctypes.create_string_buffer(len(self))
+		length = len(self)
+		if length == 0:
+			return b""
 		data = core.BNGetDataBufferContents(self.handle)
 		assert data is not None, "core.BNGetDataBufferContents returned None"
-		ctypes.memmove(buf, data, len(self))
-		return buf.raw
+		return ctypes.string_at(data, length)
 
 	def __eq__(self, other: 'DataBuffer') -> bool:
 		# Not cryptographically secure
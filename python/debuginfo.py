@@ -19,7 +19,9 @@
 # IN THE SOFTWARE.
 
 import ctypes
-from typing import Optional, List, Iterator, Callable, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Iterator, Callable, Tuple, Iterable, Set
 import traceback
 from dataclasses import dataclass
 
@@ -542,3 +544,166 @@ class DebugInfo(object):
 		if isinstance(address, int) and isinstance(new_type, _types.Type):
 			return core.BNAddDebugDataVariable(self.handle, address, new_type.handle, name, component_list, len(components))
 		return NotImplemented
+
+
+@dataclass
+class DebugInfoParseResult:
+	"""
+	``DebugInfoParseResult`` is the output of one parser run by :py:func:`parse_debug_info_parallel`, along with its
+	timings
+	"""
+	parser: DebugInfoParser
+	debug_info: Optional[DebugInfo] = None
+	parse_time: float = 0.0
+	"""Seconds spent in the parser"""
+	merge_time: float = 0.0
+	"""Seconds spent removing entries overridden by higher priority parsers"""
+	apply_time: float = 0.0
+	"""Seconds spent in :py:func:`BinaryView.apply_debug_info`"""
+	removed: int = 0
+	"""Number of types, functions and data variables overridden by higher priority parsers"""
+	error: Optional[str] = None
+
+	def __repr__(self) -> str:
+		return f"<debug-info result: {self.parser.name}, parse {self.parse_time:.3f}s, merge {self.merge_time:.3f}s, apply {self.apply_time:.3f}s>"
+
+
+def parse_debug_info_parallel(
+    view: 'binaryview.BinaryView', debug_view: Optional['binaryview.BinaryView'] = None,
+    parsers: Optional[Iterable[DebugInfoParser]] = None, threads: Optional[int] = None
+) -> List[DebugInfoParseResult]:
+	"""
+	``parse_debug_info_parallel`` runs several debug-info parsers concurrently, each into its own ``DebugInfo``.
+	Parsers that raise or fail are reported through :py:attr:`DebugInfoParseResult.error` instead of stopping the
+	others.
+
+	:param view: view the debug info is for
+	:param debug_view: view of the file containing the debug info, ``view`` if None
+	:param parsers: parsers to run, :py:func:`DebugInfoParser.get_parsers_for_view` if None
+	:param int threads: number of parsers to run at once, one thread per parser if None
+	:return: results in the order of ``parsers``
+	"""
+	if debug_view is None:
+		debug_view = view
+	if parsers is None:
+		parsers = DebugInfoParser.get_parsers_for_view(view)
+	parsers = list(parsers)
+
+	def run(parser: DebugInfoParser) -> DebugInfoParseResult:
+		result = DebugInfoParseResult(parser)
+		start = time.perf_counter()
+		try:
+			result.debug_info = parser.parse_debug_info(view, debug_view)
+			if result.debug_info is None:
+				result.error = f"{parser.name} failed to parse debug info"
+		except Exception:
+			result.error = traceback.format_exc()
+		result.parse_time = time.perf_counter() - start
+		return result
+
+	if not parsers:
+		return []
+	with ThreadPoolExecutor(threads if threads is not None else len(parsers)) as pool:
+		return list(pool.map(run, parsers))
+
+
+def merge_debug_info(results: List[DebugInfoParseResult], priority: Optional[List[str]] = None) -> List[DebugInfoParseResult]:
+	"""
+	``merge_debug_info`` resolves conflicts between the results of :py:func:`parse_debug_info_parallel`. Types are
+	matched by name and functions and data variables by address; only the entry of the highest priority parser is
+	kept and the others are removed from their ``DebugInfo``.
+
+	:param results: parse results
+	:param priority: parser names from highest to lowest priority; unlisted parsers come after, in ``results`` order
+	:return: the successful results ordered from highest to lowest priority
+	"""
+	if priority is None:
+		priority = []
+	rank = {name: i for i, name in enumerate(priority)}
+	ordered = sorted(
+	    (result for result in results if result.debug_info is not None),
+	    key=lambda result: rank.get(result.parser.name, len(rank))
+	)
+	type_names: Set[str] = set()
+	function_addresses: Set[int] = set()
+	data_addresses: Set[int] = set()
+	for result in ordered:
+		start = time.perf_counter()
+		name = result.parser.name
+		debug_info = result.debug_info
+		assert debug_info is not None
+		own_types = set()
+		for type_name, _ in debug_info.types_from_parser(name):
+			if type_name in type_names:
+				debug_info.remove_type_by_name(name, type_name)
+				result.removed += 1
+			else:
+				own_types.add(type_name)
+		own_functions = set()
+		overridden = []
+		for index, function in enumerate(debug_info.functions_from_parser(name)):
+			if not function.address:
+				continue
+			if function.address in function_addresses:
+				overridden.append(index)
+			else:
+				own_functions.add(function.address)
+		# Remove from the end so earlier indices stay valid
+		for index in reversed(overridden):
+			debug_info.remove_function_by_index(name, index)
+		result.removed += len(overridden)
+		own_data = set()
+		for var in debug_info.data_variables_from_parser(name):
+			if var.address in data_addresses:
+				debug_info.remove_data_variable_by_address(name, var.address)
+				result.removed += 1
+			else:
+				own_data.add(var.address)
+		type_names |= own_types
+		function_addresses |= own_functions
+		data_addresses |= own_data
+		result.merge_time = time.perf_counter() - start
+	return ordered
+
+
+def apply_debug_info_parallel(
+    view: 'binaryview.BinaryView', debug_view: Optional['binaryview.BinaryView'] = None,
+    parsers: Optional[Iterable[DebugInfoParser]] = None, priority: Optional[List[str]] = None,
+    threads: Optional[int] = None
+) -> List[DebugInfoParseResult]:
+	"""
+	``apply_debug_info_parallel`` parses debug info with every valid parser concurrently, merges the results with
+	:py:func:`merge_debug_info` and applies them to ``view``, one :py:func:`BinaryView.apply_debug_info` call per
+	parser from lowest to highest priority. Afterwards :py:attr:`BinaryView.debug_info` is the ``DebugInfo`` of the
+	highest priority parser; the others are available from the returned results.
+
+	The calls cannot be batched into one. Each parser needs its own ``DebugInfo`` so that parsers can run
+	concurrently. The core applies one ``DebugInfo`` per call and cannot combine several of them. After the merge
+	the ``DebugInfo`` objects no longer overlap, so no entry is applied twice.
+
+	:param view: view to apply debug info to
+	:param debug_view: view of the file containing the debug info, ``view`` if None
+	:param parsers: parsers to run, :py:func:`DebugInfoParser.get_parsers_for_view` if None
+	:param priority: parser names from highest to lowest priority
+	:param int threads: number of parsers to run at once, one thread per parser if None
+	:return: all results, with per-parser timings, in the order of ``parsers``
+
+	:Example:
+
+		>>> results = apply_debug_info_parallel(bv, priority=["PDB", "DWARF"])
+		>>> for result in results:
+		...     print(result)
+		<debug-info result: PDB, parse 4.210s, merge 0.310s, apply 2.002s>
+		<debug-info result: DWARF, parse 3.871s, merge 0.452s, apply 1.187s>
+	"""
+	results = parse_debug_info_parallel(view, debug_view, parsers, threads)
+	for result in results:
+		if result.error is not None:
+			log_error(f"Debug info parser {result.parser.name} failed: {result.error}")
+	# One call per DebugInfo, see above; the highest priority one is applied last so it ends up as view.debug_info
+	for result in reversed(merge_debug_info(results, priority)):
+		assert result.debug_info is not None
+		start = time.perf_counter()
+		view.apply_debug_info(result.debug_info)
+		result.apply_time = time.perf_counter() - start
+	return results
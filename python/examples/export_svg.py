@@ -1,4 +1,5 @@
 # from binaryninja import *
+import json
 import os
 import webbrowser
 import time
@@ -6,11 +7,12 @@ import sys
 from pathlib import Path
 from urllib.request import pathname2url
 
-from binaryninja.interaction import get_save_filename_input, show_message_box, TextLineField, ChoiceField, SaveFileNameField, get_form_input
+from binaryninja.interaction import get_save_filename_input, show_message_box, TextLineField, ChoiceField, SaveFileNameField, DirectoryNameField, get_form_input
 from binaryninja.settings import Settings
 from binaryninja.enums import MessageBoxButtonSet, MessageBoxIcon, MessageBoxButtonResult, InstructionTextTokenType, BranchType, DisassemblyOption, FunctionGraphType, ThemeColor
 from binaryninja.function import DisassemblySettings
-from binaryninja.plugin import PluginCommand
+from binaryninja.flowgraph import export_function_graphs
+from binaryninja.plugin import PluginCommand, BackgroundTaskThread
 from binaryninjaui import getThemeColor, getTokenColor, UIContext
 
 colors = {
@@ -111,7 +113,7 @@ def rgbStr(tokenType):
 	b = color.getRgb()[2]
 	return f"rgb({r}, {g}, {b})"
 
-def render_svg(function, offset, mode, form, showOpcodes, showAddresses, origname):
+def graph_settings(form, showOpcodes, showAddresses):
 	settings = DisassemblySettings()
 	if showOpcodes:
 		settings.set_option(DisassemblyOption.ShowOpcode, True)
@@ -137,14 +139,12 @@ def render_svg(function, offset, mode, form, showOpcodes, showAddresses, orignam
 		graph_type = FunctionGraphType.HighLevelILSSAFormFunctionGraph
 	else:
 		graph_type = FunctionGraphType.NormalFunctionGraph
-	graph = function.create_graph(graph_type=graph_type, settings=settings)
-	graph.layout_and_wait()
-	heightconst = 15
-	ratio = 0.48
-	widthconst = heightconst * ratio
+	return graph_type, settings
 
-	output = f'''<html>
-	<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="{graph.width * widthconst + 20}" height="{graph.height * heightconst + 20}">
+
+def svg_style():
+	# Theme colors are looked up once per export rather than once per function
+	return f'''
 		<style type="text/css">
 			@import url(https://fonts.googleapis.com/css?family=Source+Code+Pro);
 			body {{
@@ -262,7 +262,47 @@ def render_svg(function, offset, mode, form, showOpcodes, showAddresses, orignam
 				fill: {rgbStr('TextToken')};
 			}}
 		</style>
-		<defs>
+	'''
+
+
+def block_highlights(graph):
+	highlights = {}
+	for i, block in enumerate(graph):
+		try:
+			bb = block.basic_block
+			if hasattr(bb.highlight, 'color'):
+				color_code = bb.highlight.color
+				color_str = bb.highlight._standard_color_to_str(color_code)
+				if color_str in colors:
+					highlights[i] = colors[color_str]
+			else:
+				highlights[i] = [bb.highlight.red, bb.highlight.green, bb.highlight.blue]
+		except:
+			pass
+	return highlights
+
+
+def render_svg(function, offset, mode, form, showOpcodes, showAddresses, origname):
+	graph_type, settings = graph_settings(form, showOpcodes, showAddresses)
+	graph = function.create_graph(graph_type=graph_type, settings=settings)
+	graph.layout_and_wait()
+	return render_exported_svg(
+	  graph.export(tokens=True), svg_style(), offset, form, origname, block_highlights(graph),
+	  lambda address: instruction_data_flow(function, address)
+	)
+
+
+def render_exported_svg(graph, style, offset, form, origname, highlights=None, hover=None):
+	'''Render the result of FlowGraph.export(tokens=True) as an HTML page containing an SVG'''
+	heightconst = 15
+	ratio = 0.48
+	widthconst = heightconst * ratio
+	if highlights is None:
+		highlights = {}
+
+	output = f'''<html>
+	<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="{graph['width'] * widthconst + 20}" height="{graph['height'] * heightconst + 20}">
+{style}		<defs>
 			<marker id="arrow-TrueBranch" class="arrow TrueBranch" viewBox="0 0 10 10" refX="10" refY="5" markerUnits="strokeWidth" markerWidth="8" markerHeight="6" orient="auto">
 				<path d="M 0 0 L 10 5 L 0 10 z" />
 			</marker>
@@ -279,63 +319,52 @@ def render_svg(function, offset, mode, form, showOpcodes, showAddresses, orignam
 		<g id="functiongraph0" class="functiongraph">
 			<title>Function Graph 0</title>
 	'''
-	edges = ''
-	for i, block in enumerate(graph):
+	for i, block in enumerate(graph['nodes']):
 
 		# Calculate basic block location and coordinates
-		x = ((block.x) * widthconst)
-		y = ((block.y) * heightconst)
-		width = ((block.width) * widthconst)
-		height = ((block.height) * heightconst)
+		x = ((block['x']) * widthconst)
+		y = ((block['y']) * heightconst)
+		width = ((block['width']) * widthconst)
+		height = ((block['height']) * heightconst)
 
 		# Render block
 		output += f'		<g id="basicblock{i}">\n'
 		output += f'			<title>Basic Block {i}</title>\n'
-		rgb = colors['none']
-		try:
-			bb = block.basic_block
-			if hasattr(bb.highlight, 'color'):
-				color_code = bb.highlight.color
-				color_str = bb.highlight._standard_color_to_str(color_code)
-				if color_str in colors:
-					rgb = colors[color_str]
-			else:
-				rgb = [bb.highlight.red, bb.highlight.green, bb.highlight.blue]
-		except:
-			pass
+		rgb = highlights.get(i, colors['none'])
 		output += f'			<rect class="basicblock" x="{x}" y="{y}" height="{height + 12}" width="{width + 16}" fill="rgb({rgb[0]},{rgb[1]},{rgb[2]})"/>\n'
 
 		# Render instructions, unfortunately tspans don't allow copying/pasting more
 		# than one line at a time, need SVG 1.2 textarea tags for that it looks like
 
 		output += f'			<text x="{x}" y="{y + (i+1) * heightconst}">\n'
-		for i, line in enumerate(block.lines):
-			output += f'				<tspan id="instr-{hex(line.address)[:-1]}" x="{x + 6}" y="{y + 6 + (i + 0.7) * heightconst}">'
-			hover = instruction_data_flow(function, line.address)
-			output += f'<title>{hover}</title>'
-			for token in line.tokens:
+		for i, line in enumerate(block['lines']):
+			output += f'				<tspan id="instr-{hex(line["address"])[:-1]}" x="{x + 6}" y="{y + 6 + (i + 0.7) * heightconst}">'
+			if hover is not None:
+				output += f'<title>{hover(line["address"])}</title>'
+			for token_type, text in line['tokens']:
 				# TODO: add hover for hex, function, and reg tokens
-				output += f'<tspan class="{InstructionTextTokenType(token.type).name}">{escape(token.text)}</tspan>'
+				output += f'<tspan class="{token_type}">{escape(text)}</tspan>'
 			output += '</tspan>\n'
 		output += '			</text>\n'
 		output += '		</g>\n'
 
-		# Edges are rendered in a seperate chunk so they have priority over the
-		# basic blocks or else they'd render below them
-
-		for edge in block.outgoing_edges:
-			points = ""
-			x, y = edge.points[0]
-			points += str(x * widthconst) + "," + str(y * heightconst + 12) + " "
-			for x, y in edge.points[1:-1]:
-				points += str(x * widthconst) + "," + str(y * heightconst) + " "
-			x, y = edge.points[-1]
-			points += str(x * widthconst) + "," + str(y * heightconst + 0) + " "
-			edgeType=BranchType(edge.type).name
-			if edge.back_edge:
-				edges += f'		<polyline class="back_edge {edgeType}" points="{points}" marker-end="url(#arrow-{edgeType})"/>\n'
-			else:
-				edges += f'		<polyline class="edge {edgeType}" points="{points}" marker-end="url(#arrow-{edgeType})"/>\n'
+	# Edges are rendered in a seperate chunk so they have priority over the
+	# basic blocks or else they'd render below them
+
+	edges = ''
+	for edge in graph['edges']:
+		points = ""
+		x, y = edge['points'][0]
+		points += str(x * widthconst) + "," + str(y * heightconst + 12) + " "
+		for x, y in edge['points'][1:-1]:
+			points += str(x * widthconst) + "," + str(y * heightconst) + " "
+		x, y = edge['points'][-1]
+		points += str(x * widthconst) + "," + str(y * heightconst + 0) + " "
+		edgeType=edge['type']
+		if edge['back_edge']:
+			edges += f'		<polyline class="back_edge {edgeType}" points="{points}" marker-end="url(#arrow-{edgeType})"/>\n'
+		else:
+			edges += f'		<polyline class="edge {edgeType}" points="{points}" marker-end="url(#arrow-{edgeType})"/>\n'
 	output += ' ' + edges + '\n'
 	output += '	</g>\n'
 	output += '</svg>\n'
@@ -346,4 +375,50 @@ def render_svg(function, offset, mode, form, showOpcodes, showAddresses, orignam
 	return output
 
 
+class ExportAllTask(BackgroundTaskThread):
+	def __init__(self, bv, form, output_dir, write_svg, write_json):
+		BackgroundTaskThread.__init__(self, "Exporting function graphs...", True)
+		self.bv = bv
+		self.form = form
+		self.output_dir = Path(output_dir)
+		self.write_svg = write_svg
+		self.write_json = write_json
+
+	def run(self):
+		origname = os.path.basename(self.bv.file.filename)
+		style = svg_style() if self.write_svg else None
+		graph_type, settings = graph_settings(self.form, False, True)
+		functions = list(self.bv.functions)
+		graphs = export_function_graphs(functions, graph_type, settings, tokens=self.write_svg)
+		try:
+			for done, (function, graph) in enumerate(graphs):
+				if self.cancelled:
+					break
+				self.progress = f"Exporting function graphs ({done + 1}/{len(functions)})..."
+				offset = function.symbol.name if function.symbol else "%x" % function.start
+				name = f'binaryninja-{origname}-{function.start:x}'
+				if self.write_json:
+					graph['function'] = offset
+					with open(self.output_dir / f'{name}.json', 'w') as output:
+						json.dump(graph, output)
+				if self.write_svg:
+					with open(self.output_dir / f'{name}.html', 'w') as output:
+						output.write(render_exported_svg(graph, style, offset, self.form, origname))
+		finally:
+			graphs.close()
+
+
+def save_all_svg(bv):
+	formChoices = ["Assembly", "LLIL", "MLIL", "HLIL"]
+	formChoiceField = ChoiceField("Form", formChoices)
+	outputChoices = ["SVG", "JSON", "SVG and JSON"]
+	outputChoiceField = ChoiceField("Output", outputChoices)
+	directoryField = DirectoryNameField("Output directory", os.path.dirname(bv.file.filename))
+	if not get_form_input([formChoiceField, outputChoiceField, directoryField], "Export All Graphs") or not directoryField.result:
+		return
+	output = outputChoices[outputChoiceField.result]
+	ExportAllTask(bv, formChoices[formChoiceField.result], directoryField.result, "SVG" in output, "JSON" in output).start()
+
+
 PluginCommand.register_for_function("Export to SVG", "Exports an SVG of the current function", save_svg)
+PluginCommand.register("Export All Functions to SVG", "Exports an SVG and/or JSON graph of every function", save_all_svg)
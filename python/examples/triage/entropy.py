@@ -17,8 +17,10 @@ class EntropyThread(threading.Thread):
 
 	def run(self):
 		width = self.image.width()
-		for i in range(0, width):
-			v = int(self.data.get_entropy(self.data.start + i * self.block_size, self.block_size)[0] * 255)
+		block_size = int(self.block_size)
+		stats = self.data.get_block_statistics(self.data.start, width * block_size, block_size)
+		for i in range(0, min(width, len(stats))):
+			v = int(stats.entropy[i] * 255)
 			if v >= 240:
 				color = binaryninjaui.getThemeColor(ThemeColor.YellowStandardHighlightColor)
 				self.image.setPixelColor(i, 0, color)
@@ -19,15 +19,18 @@
 # IN THE SOFTWARE.
 
 import ctypes
+import os
+import queue
 import threading
 import traceback
-from typing import Optional
+from typing import Optional, Iterable, Generator, Tuple, Dict, Any
 
 # Binary Ninja components
 import binaryninja
 from . import _binaryninjacore as core
 from .enums import (
-    BranchType, InstructionTextTokenType, HighlightStandardColor, FlowGraphOption, EdgePenStyle, ThemeColor
+    BranchType, InstructionTextTokenType, HighlightStandardColor, FlowGraphOption, EdgePenStyle, ThemeColor,
+    FunctionGraphType
 )
 from . import function
 from . import binaryview
@@ -787,6 +790,96 @@ class FlowGraph:
 		core.BNFreeFlowGraphNodeList(nodes, count.value)
 		return result
 
+	def export(self, tokens: bool = False) -> Dict[str, Any]:
+		"""
+		``export`` returns the whole laid out graph as plain data in a single pass over the core's node list, instead
+		of creating :py:class:`FlowGraphNode`, :py:class:`FlowGraphEdge` and token objects for every node, edge and line.
+		The result only contains lists, dicts, strings and numbers, so it can be passed directly to :py:func:`json.dump`.
+
+		The result has the keys ``width``, ``height``, ``nodes`` and ``edges``. Each node has its ``index``, ``x``,
+		``y``, ``width``, ``height``, the ``start`` and ``end`` of its basic block (None if it has none), and its
+		``lines``. Each line has an ``address``, the IL ``instr_index`` (None for disassembly) and the rendered
+		``text``. Each edge has the ``source`` and ``target`` node indices, the branch ``type`` name, ``back_edge``
+		and the ``points`` of the edge as ``[x, y]`` pairs.
+
+		Call :py:func:`layout_and_wait` first, otherwise the coordinates are not valid.
+
+		:param bool tokens: also include the ``tokens`` of each line as ``[type name, text]`` pairs
+		:rtype: dict
+		"""
+		count = ctypes.c_ulonglong()
+		nodes = core.BNGetFlowGraphNodes(self.handle, count)
+		assert nodes is not None, "core.BNGetFlowGraphNodes returned None"
+		result_nodes = []
+		result_edges = []
+		try:
+			index = {ctypes.addressof(nodes[i].contents): i for i in range(0, count.value)}
+			for i in range(0, count.value):
+				node = nodes[i]
+				start = None
+				end = None
+				block = core.BNGetFlowGraphBasicBlock(node)
+				if block:
+					start = core.BNGetBasicBlockStart(block)
+					end = core.BNGetBasicBlockEnd(block)
+					core.BNFreeBasicBlock(block)
+
+				line_count = ctypes.c_ulonglong()
+				lines = core.BNGetFlowGraphNodeLines(node, line_count)
+				assert lines is not None, "core.BNGetFlowGraphNodeLines returned None"
+				node_lines = []
+				try:
+					for j in range(0, line_count.value):
+						line = lines[j]
+						parts = []
+						for k in range(0, line.count):
+							text = line.tokens[k].text
+							if not isinstance(text, str):
+								text = text.decode("utf-8")
+							parts.append(text)
+						entry = {
+						    "address": line.addr,
+						    "instr_index": line.instrIndex if line.instrIndex != 0xffffffffffffffff else None,
+						    "text": "".join(parts)
+						}
+						if tokens:
+							entry["tokens"] = [
+							    [InstructionTextTokenType(line.tokens[k].type).name, parts[k]] for k in range(0, line.count)
+							]
+						node_lines.append(entry)
+				finally:
+					core.BNFreeDisassemblyTextLines(lines, line_count.value)
+
+				edge_count = ctypes.c_ulonglong()
+				edges = core.BNGetFlowGraphNodeOutgoingEdges(node, edge_count)
+				assert edges is not None, "core.BNGetFlowGraphNodeOutgoingEdges returned None"
+				try:
+					for j in range(0, edge_count.value):
+						edge = edges[j]
+						result_edges.append({
+						    "source": i,
+						    "target": index.get(ctypes.addressof(edge.target.contents)) if edge.target else None,
+						    "type": BranchType(edge.type).name,
+						    "back_edge": edge.backEdge,
+						    "points": [[edge.points[k].x, edge.points[k].y] for k in range(0, edge.pointCount)]
+						})
+				finally:
+					core.BNFreeFlowGraphNodeEdgeList(edges, edge_count.value)
+
+				result_nodes.append({
+				    "index": i,
+				    "x": core.BNGetFlowGraphNodeX(node),
+				    "y": core.BNGetFlowGraphNodeY(node),
+				    "width": core.BNGetFlowGraphNodeWidth(node),
+				    "height": core.BNGetFlowGraphNodeHeight(node),
+				    "start": start,
+				    "end": end,
+				    "lines": node_lines
+				})
+		finally:
+			core.BNFreeFlowGraphNodeList(nodes, count.value)
+		return {"width": self.width, "height": self.height, "nodes": result_nodes, "edges": result_edges}
+
 	def append(self, node):
 		"""
 		``append`` adds a node to a flow graph.
@@ -835,3 +928,61 @@ class CoreFlowGraph(FlowGraph):
 		if not graph:
 			return None
 		return CoreFlowGraph(graph)
+
+
+def export_function_graphs(
+    functions: Iterable['function.Function'], graph_type: FunctionGraphType = FunctionGraphType.NormalFunctionGraph,
+    settings: Optional['function.DisassemblySettings'] = None, tokens: bool = False, max_pending: Optional[int] = None
+) -> Generator[Tuple['function.Function', Dict[str, Any]], None, None]:
+	"""
+	``export_function_graphs`` lays out the graphs of many functions concurrently and yields each function with its
+	:py:func:`FlowGraph.export` result as soon as its layout completes, so results are not in input order. Up to
+	``max_pending`` layouts are in flight at once; the core performs them on its worker threads, and each graph is
+	exported on the thread that completed its layout.
+
+	:param functions: functions to export
+	:param FunctionGraphType graph_type: type of graph to create for each function
+	:param DisassemblySettings settings: optional disassembly settings for the graphs
+	:param bool tokens: include line tokens, see :py:func:`FlowGraph.export`
+	:param int max_pending: maximum number of layouts in flight, defaults to twice ``os.cpu_count()``
+	:rtype: Generator[Tuple[Function, dict], None, None]
+	:Example:
+
+		>>> for func, graph in export_function_graphs(bv.functions, FunctionGraphType.HighLevelILFunctionGraph):
+		... 	with open(f"{func.start:x}.json", "w") as f:
+		... 		json.dump(graph, f)
+	"""
+	if max_pending is None:
+		max_pending = 2 * (os.cpu_count() or 1)
+	results: 'queue.Queue[Tuple[int, Optional[Dict[str, Any]]]]' = queue.Queue()
+	pending: Dict[int, Tuple['function.Function', FlowGraph, FlowGraphLayoutRequest]] = {}
+
+	def complete(key: int, graph: FlowGraph) -> None:
+		try:
+			results.put((key, graph.export(tokens)))
+		except:
+			log_error(traceback.format_exc())
+			results.put((key, None))
+
+	def collect():
+		key, data = results.get()
+		func, _, _ = pending.pop(key)
+		return func, data
+
+	try:
+		for key, func in enumerate(functions):
+			while len(pending) >= max_pending:
+				func_done, data = collect()
+				if data is not None:
+					yield func_done, data
+			graph = func.create_graph(graph_type, settings)
+			# complete() only queues the result, pending is read on this thread once the request is stored
+			pending[key] = (func, graph, graph.layout(lambda key=key, graph=graph: complete(key, graph)))
+		while pending:
+			func_done, data = collect()
+			if data is not None:
+				yield func_done, data
+	finally:
+		for _, _, request in pending.values():
+			if request is not None:
+				request.abort()
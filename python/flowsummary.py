@@ -0,0 +1,301 @@
+# Copyright (c) 2024 Vector 35 Inc
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import ctypes
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from . import _binaryninjacore as core
+from .binaryview import BinaryDataNotification, BinaryView, NotificationType
+from .commonil import Call, Constant, Store, Tailcall
+from .exceptions import ILException
+from .mediumlevelil import MediumLevelILFunction, MediumLevelILRet, SSAVariable
+from . import function as _function
+from . import variable
+
+__all__ = ["FunctionFlowSummary", "FlowSummaryCache"]
+
+SSAVariableKey = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class FunctionFlowSummary:
+	"""
+	``FunctionFlowSummary`` describes where the values of a function's parameters can flow, computed from the SSA
+	form of its medium level IL. Parameters are identified by their index in :py:attr:`Function.parameter_vars`.
+	Summaries are created by :py:class:`FlowSummaryCache`.
+	"""
+	start: int
+	"""Start address of the summarized function"""
+
+	parameter_count: int
+	"""Number of parameters of the function"""
+
+	returns: FrozenSet[int] = frozenset()
+	"""Parameters whose value may flow into a return value"""
+
+	memory: FrozenSet[int] = frozenset()
+	"""Parameters whose value may be stored to memory"""
+
+	global_stores: Dict[int, FrozenSet[int]] = field(default_factory=dict)
+	"""Constant addresses each parameter's value may be stored to"""
+
+	callees: FrozenSet[int] = frozenset()
+	"""Start addresses of the directly called functions whose summaries were used"""
+
+	approximate: bool = False
+	"""True if a callee summary was unavailable (indirect or recursive calls, missing IL) and was assumed to pass
+	arguments through to its return value"""
+
+	def __repr__(self):
+		return f"<FunctionFlowSummary {self.start:#x}: returns {sorted(self.returns)}, memory {sorted(self.memory)}>"
+
+
+class FlowSummaryCache(BinaryDataNotification):
+	"""
+	``FlowSummaryCache`` computes :py:class:`FunctionFlowSummary` objects bottom-up over the call graph and keeps
+	them for the lifetime of the view. Call sites are resolved using the summaries of the callees, so a function is
+	only walked once no matter how many call sites reference it. When a function is updated or removed its summary
+	and the summaries of all of its (transitive) callers are discarded and recomputed on the next query.
+
+	Use :py:func:`for_view` to get the cache shared by all users of a view, which lives in
+	:py:attr:`BinaryView.session_data` and is closed when the view is used as a context manager and exits.
+
+	:Example:
+
+		>>> cache = FlowSummaryCache.for_view(bv)
+		>>> cache.get(bv.get_function_at(0x401000))
+		<FunctionFlowSummary 0x401000: returns [0], memory [1]>
+	"""
+	_session_key = "flow_summary_cache"
+
+	def __init__(self, view: BinaryView):
+		super(FlowSummaryCache, self).__init__(NotificationType.FunctionUpdated | NotificationType.FunctionLifetime)
+		self.view = view
+		self._lock = threading.RLock()
+		self._summaries: Dict[int, FunctionFlowSummary] = {}
+		self._callers: Dict[int, Set[int]] = {}
+		self._generation = 0
+		self._registered = False
+		view.register_notification(self)
+		self._registered = True
+
+	def __repr__(self):
+		return f"<FlowSummaryCache {len(self)} summaries>"
+
+	def __len__(self) -> int:
+		return len(self._summaries)
+
+	def __contains__(self, func: '_function.Function') -> bool:
+		return func.start in self._summaries
+
+	@classmethod
+	def for_view(cls, view: BinaryView) -> 'FlowSummaryCache':
+		"""
+		``for_view`` returns the cache stored in ``view.session_data``, creating and registering it on first use.
+
+		:param BinaryView view: view to get the cache for
+		:rtype: FlowSummaryCache
+		"""
+		cache = view.session_data.get(cls._session_key)
+		if cache is None:
+			cache = cls(view)
+			view.session_data[cls._session_key] = cache
+		return cache
+
+	def close(self) -> None:
+		"""``close`` unregisters the cache from the view and drops all summaries"""
+		if self._registered:
+			self.view.unregister_notification(self)
+			self._registered = False
+		if self.view.session_data.get(self._session_key) is self:
+			del self.view.session_data[self._session_key]
+		self.invalidate()
+
+	def invalidate(self, func: Optional['_function.Function'] = None) -> None:
+		"""
+		``invalidate`` discards the summary of ``func`` and of every function that transitively calls it, or all
+		summaries if ``func`` is None.
+
+		:param Function func: function whose summary is stale
+		"""
+		with self._lock:
+			self._generation += 1
+			if func is None:
+				self._summaries.clear()
+				self._callers.clear()
+				return
+			pending = [func.start]
+			while pending:
+				start = pending.pop()
+				if self._summaries.pop(start, None) is not None:
+					pending.extend(self._callers.pop(start, ()))
+
+	def function_updated(self, view: BinaryView, func: '_function.Function') -> None:
+		self.invalidate(func)
+
+	def function_removed(self, view: BinaryView, func: '_function.Function') -> None:
+		self.invalidate(func)
+
+	def get(self, func: '_function.Function') -> FunctionFlowSummary:
+		"""
+		``get`` returns the summary of ``func``, first computing the summaries of any of its callees that are not
+		cached yet. Calls that form a cycle are treated like unknown callees, see :py:attr:`FunctionFlowSummary.approximate`.
+
+		:param Function func: function to summarize
+		:rtype: FunctionFlowSummary
+		"""
+		with self._lock:
+			summary = self._summaries.get(func.start)
+			generation = self._generation
+		if summary is not None:
+			return summary
+		# The lock is not held while walking IL, since notifications are delivered with the core's global lock held
+		computed: Dict[int, FunctionFlowSummary] = {}
+		in_progress: Set[int] = set()
+		stack: List[Tuple['_function.Function', bool]] = [(func, False)]
+		while stack:
+			current, expanded = stack.pop()
+			if self._lookup(current.start, computed) is not None:
+				continue
+			if expanded:
+				computed[current.start] = self._summarize(current, computed)
+				in_progress.discard(current.start)
+				continue
+			if current.start in in_progress:
+				continue
+			in_progress.add(current.start)
+			stack.append((current, True))
+			# Only callees that still need a summary are turned into Function objects
+			for address in current.callee_addresses:
+				if address not in in_progress and self._lookup(address, computed) is None:
+					callee = self.view.get_function_at(address)
+					if callee is not None:
+						stack.append((callee, False))
+		with self._lock:
+			# Anything computed while a function was invalidated may be stale, so it is returned but not cached
+			if generation == self._generation:
+				for start, summary in computed.items():
+					self._summaries[start] = summary
+					for callee in summary.callees:
+						self._callers.setdefault(callee, set()).add(start)
+		return computed[func.start]
+
+	def _lookup(self, start: int, computed: Dict[int, FunctionFlowSummary]) -> Optional[FunctionFlowSummary]:
+		summary = computed.get(start)
+		if summary is None:
+			summary = self._summaries.get(start)
+		return summary
+
+	def _summarize(self, func: '_function.Function', computed: Dict[int, FunctionFlowSummary]) -> FunctionFlowSummary:
+		params = func.parameter_vars.vars
+		try:
+			ssa = func.mlil.ssa_form
+		except ILException:
+			ssa = None
+		if ssa is None:
+			return FunctionFlowSummary(func.start, len(params), approximate=True)
+		returns: Set[int] = set()
+		memory: Set[int] = set()
+		global_stores: Dict[int, Set[int]] = {}
+		callees: Set[int] = set()
+		approximate = False
+		for index, var in enumerate(params):
+			seen: Set[SSAVariableKey] = set()
+			worklist = self._entry_versions(ssa, var)
+			while worklist:
+				ssa_var = worklist.pop()
+				key = (ssa_var.var.identifier, ssa_var.version)
+				if key in seen:
+					continue
+				seen.add(key)
+				for instr in ssa.get_ssa_var_uses(ssa_var):
+					if isinstance(instr, MediumLevelILRet):
+						returns.add(index)
+					elif isinstance(instr, Store):
+						if self._reads(instr.src, key):
+							memory.add(index)
+							if isinstance(instr.dest, Constant):
+								address = instr.dest.constant + getattr(instr, "offset", 0)
+								global_stores.setdefault(index, set()).add(address)
+					elif isinstance(instr, Call):
+						positions = [i for i, param in enumerate(instr.params) if self._reads(param, key)]
+						if not positions:
+							continue
+						summary = self._callee_summary(instr, computed)
+						if summary is None:
+							approximate = True
+							flows_to_output = True
+						else:
+							callees.add(summary.start)
+							approximate = approximate or summary.approximate
+							flows_to_output = any(i in summary.returns for i in positions)
+							if any(i in summary.memory for i in positions):
+								memory.add(index)
+							for i in positions:
+								for address in summary.global_stores.get(i, ()):
+									global_stores.setdefault(index, set()).add(address)
+						if flows_to_output:
+							if isinstance(instr, Tailcall):
+								returns.add(index)
+							worklist.extend(v for v in instr.vars_written if isinstance(v, SSAVariable))
+					else:
+						worklist.extend(v for v in instr.vars_written if isinstance(v, SSAVariable))
+		return FunctionFlowSummary(
+		    func.start, len(params), frozenset(returns), frozenset(memory),
+		    {index: frozenset(addresses) for index, addresses in global_stores.items()}, frozenset(callees), approximate
+		)
+
+	@staticmethod
+	def _entry_versions(ssa: MediumLevelILFunction, var: 'variable.Variable') -> List[SSAVariable]:
+		# The incoming value of a parameter is every SSA version without a defining instruction. That is usually only
+		# version 0, but not when the parameter variable is merged with or re-versioned by other definitions.
+		count = ctypes.c_ulonglong()
+		core_var = var.to_BNVariable()
+		versions = core.BNGetMediumLevelILVariableSSAVersions(ssa.handle, core_var, count)
+		assert versions is not None, "core.BNGetMediumLevelILVariableSSAVersions returned None"
+		try:
+			candidates = versions[:count.value]
+		finally:
+			core.BNFreeILInstructionList(versions)
+		instruction_count = core.BNGetMediumLevelILInstructionCount(ssa.handle)
+		entry = [
+		    SSAVariable(var, version) for version in candidates
+		    if core.BNGetMediumLevelILSSAVarDefinition(ssa.handle, core_var, version) >= instruction_count
+		]
+		return entry or [SSAVariable(var, 0)]
+
+	@staticmethod
+	def _reads(expr, key: SSAVariableKey) -> bool:
+		if isinstance(expr, SSAVariable):
+			return (expr.var.identifier, expr.version) == key
+		return any(
+		    isinstance(v, SSAVariable) and (v.var.identifier, v.version) == key for v in getattr(expr, "vars_read", ())
+		)
+
+	def _callee_summary(self, instr, computed: Dict[int, FunctionFlowSummary]) -> Optional[FunctionFlowSummary]:
+		dest = getattr(instr, "dest", None)
+		if not isinstance(dest, Constant):
+			return None
+		callee = self.view.get_function_at(dest.constant)
+		if callee is None:
+			return None
+		return self._lookup(callee.start, computed)
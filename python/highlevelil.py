@@ -20,7 +20,7 @@
 
 import ctypes
 import struct
-from typing import Optional, Generator, List, Union, NewType, Tuple, ClassVar, Mapping, Set, Callable, Any, Iterator, overload
+from typing import Optional, Generator, List, Union, NewType, Tuple, ClassVar, Dict, Mapping, Set, Callable, Any, Iterator, overload
 from dataclasses import dataclass
 from enum import Enum
 
@@ -43,7 +43,8 @@ from .interaction import show_graph_report
 from .commonil import (
     BaseILInstruction, Tailcall, Syscall, Localcall, Comparison, Signed, UnaryOperation, BinaryOperation, SSA, Phi,
     Loop, ControlFlow, Memory, Constant, Arithmetic, DoublePrecision, Terminal, FloatingPoint, Intrinsic, Return,
-    VariableInstruction, SSAVariableInstruction, SetVar
+    VariableInstruction, SSAVariableInstruction, SetVar, BaseILFunction, traverse_il, SSADefUseGraph, build_ssa_def_use_graph,
+    ssa_memory_versions
 )
 from . import deprecation
 
@@ -806,14 +807,7 @@ class HighLevelILInstruction(BaseILInstruction):
 			>>> for result in inst.traverse(get_constant_less_than_value, 10):
 			... 	print(f"Found a constant {result} < 10 in {repr(inst)}")
 		"""
-		if (result := cb(self, *args, **kwargs)) is not None:
-			yield result
-		for _, op, _ in self.detailed_operands:
-			if isinstance(op, HighLevelILInstruction):
-				yield from op.traverse(cb, *args, **kwargs)
-			elif isinstance(op, list) and all(isinstance(i, HighLevelILInstruction) for i in op):
-				for i in op:
-					yield from i.traverse(cb, *args, **kwargs) # type: ignore
+		yield from traverse_il([self], cb, args=args, kwargs=kwargs)
 
 	@deprecation.deprecated(deprecated_in="4.0.4907", details="Use :py:func:`HighLevelILInstruction.traverse` instead.")
 	def visit_all(self, cb: HighLevelILVisitorCallback,
@@ -2387,6 +2381,20 @@ ILInstruction = {
 }
 
 
+# Operand indices of the memory versions of each SSA operation, as ``(operand_index, is_list)`` pairs
+_HLIL_MEMORY_OPERANDS: Dict[HighLevelILOperation, Tuple[Tuple[int, bool], ...]] = {
+    HighLevelILOperation.HLIL_ASSIGN_MEM_SSA: ((1, False), (3, False)),
+    HighLevelILOperation.HLIL_ASSIGN_UNPACK_MEM_SSA: ((2, False), (4, False)),
+    HighLevelILOperation.HLIL_ARRAY_INDEX_SSA: ((1, False), ),
+    HighLevelILOperation.HLIL_DEREF_SSA: ((1, False), ),
+    HighLevelILOperation.HLIL_DEREF_FIELD_SSA: ((1, False), ),
+    HighLevelILOperation.HLIL_CALL_SSA: ((3, False), (4, False)),
+    HighLevelILOperation.HLIL_SYSCALL_SSA: ((2, False), (3, False)),
+    HighLevelILOperation.HLIL_INTRINSIC_SSA: ((3, False), (4, False)),
+    HighLevelILOperation.HLIL_MEM_PHI: ((0, False), (1, True)),
+}
+
+
 class HighLevelILExpr:
 	"""
 	``class HighLevelILExpr`` hold the index of IL Expressions.
@@ -2406,7 +2414,7 @@ class HighLevelILExpr:
 		return self._index
 
 
-class HighLevelILFunction:
+class HighLevelILFunction(BaseILFunction):
 	"""
 	``class HighLevelILFunction`` contains the a HighLevelILInstruction object that makes up the abstract syntax tree of
 	a function.
@@ -2578,13 +2586,15 @@ class HighLevelILFunction:
 			>>> for result in current_il_function.traverse(find_non_constant_memcpy, target_address):
 			... 	print(f"Found suspicious memcpy: {repr(i)}")
 		"""
+		yield from traverse_il(self._traverse_roots(), cb, args=args, kwargs=kwargs)
+
+	def _traverse_roots(self) -> List['HighLevelILInstruction']:
 		root = self.root
 		if root is None:
 			raise ValueError("HighLevelILFunction has no root")
 		if not isinstance(root, HighLevelILBlock):
-			root = [root]
-		for instr in root:
-			yield from instr.traverse(cb, *args, **kwargs)
+			return [root]
+		return list(root)
 
 	@deprecation.deprecated(deprecated_in="4.0.4907", details="Use :py:func:`HighLevelILFunction.traverse` instead.")
 	def visit(self, cb: HighLevelILVisitorCallback) -> bool:
@@ -2736,6 +2746,73 @@ class HighLevelILFunction:
 		core.BNFreeILInstructionList(instrs)
 		return result
 
+	def ssa_def_use_graph(self) -> SSADefUseGraph:
+		"""
+		``ssa_def_use_graph`` collects the definition and uses of every SSA variable version and memory version of the
+		SSA form of this function in one pass. Definitions and uses are stored as raw expression indices in flat arrays
+		rather than wrapped in instruction objects, so repeated data-flow queries can be answered without calling
+		:py:func:`get_ssa_var_definition` and :py:func:`get_ssa_var_uses` for each variable.
+
+		:return: def-use graph of the SSA form of this function
+		:rtype: SSADefUseGraph
+		:Example:
+
+			>>> graph = current_hlil.ssa_def_use_graph()
+			>>> i = graph.index_of(current_hlil.ssa_vars[0])
+			>>> graph.definition[i], list(graph.uses_of(i))
+		"""
+		ssa = self.ssa_form
+
+		def index_list(instrs, count: ctypes.c_ulonglong) -> List[int]:
+			assert instrs is not None, "core returned None for an SSA use list"
+			try:
+				return instrs[:count.value]
+			finally:
+				core.BNFreeILInstructionList(instrs)
+
+		def var_uses(core_var, version: int) -> List[int]:
+			count = ctypes.c_ulonglong()
+			return index_list(core.BNGetHighLevelILSSAVarUses(ssa.handle, core_var, version, count), count)
+
+		def memory_uses(version: int) -> List[int]:
+			count = ctypes.c_ulonglong()
+			return index_list(core.BNGetHighLevelILSSAMemoryUses(ssa.handle, version, count), count)
+
+		def raw_operands(expr_index: int) -> Tuple[int, Any]:
+			expr = core.BNGetHighLevelILByIndex(ssa.handle, expr_index, True)
+			return expr.operation, expr.operands
+
+		def operand_list(expr_index: int, operand_index: int) -> List[int]:
+			count = ctypes.c_ulonglong()
+			operands = core.BNHighLevelILGetOperandList(ssa.handle, expr_index, operand_index, count)
+			assert operands is not None, "core.BNHighLevelILGetOperandList returned None"
+			try:
+				return operands[:count.value]
+			finally:
+				core.BNHighLevelILFreeOperandList(operands)
+
+		variable_count = ctypes.c_ulonglong()
+		core_variables = core.BNGetHighLevelILVariables(ssa.handle, variable_count)
+		assert core_variables is not None, "core.BNGetHighLevelILVariables returned None"
+		try:
+			variables = []
+			for var_i in range(variable_count.value):
+				core_var = core_variables[var_i]
+				version_count = ctypes.c_ulonglong()
+				versions = core.BNGetHighLevelILVariableSSAVersions(ssa.handle, core_var, version_count)
+				variables.append((
+				    variable.Variable(ssa, core_var.type, core_var.index, core_var.storage), core_var,
+				    index_list(versions, version_count)
+				))
+			return build_ssa_def_use_graph(
+			    ssa, variables, lambda core_var, version: core.BNGetHighLevelILSSAVarDefinition(ssa.handle, core_var, version),
+			    var_uses, ssa_memory_versions(core.BNGetHighLevelILExprCount(ssa.handle), raw_operands, operand_list, _HLIL_MEMORY_OPERANDS),
+			    lambda version: core.BNGetHighLevelILSSAMemoryDefinition(ssa.handle, version), memory_uses,
+			    core.BNGetHighLevelILExprCount(ssa.handle)
+			)
+		finally:
+			core.BNFreeVariableList(core_variables)
+
 	def is_ssa_var_live(self, ssa_var: 'mediumlevelil.SSAVariable') -> bool:
 		"""
 		``is_ssa_var_live`` determines if ``ssa_var`` is live at any point in the function
@@ -19,7 +19,11 @@
 # IN THE SOFTWARE.
 
 import ctypes
-from typing import Optional, List
+import json
+import shutil
+import tempfile
+import threading
+from typing import Optional, List, Callable, TextIO
 
 import binaryninja
 from . import _binaryninjacore as core
@@ -27,7 +31,7 @@ from . import highlight
 from . import function as _function
 from . import basicblock
 from . import binaryview
-from .enums import LinearViewObjectIdentifierType
+from .enums import LinearViewObjectIdentifierType, LinearDisassemblyLineType
 
 
 class LinearDisassemblyLine:
@@ -635,3 +639,161 @@ class LinearViewCursor:
 	@staticmethod
 	def compare(a, b):
 		return core.BNCompareLinearViewCursors(a.handle, b.handle)
+
+
+class LinearDisassemblyExporter:
+	"""
+	``LinearDisassemblyExporter`` writes the linear view of a :py:class:`~binaryninja.binaryview.BinaryView` to a
+	file object in batches of ``batch_size`` lines, so memory use stays bounded regardless of the size of the view.
+
+	With ``text_only`` (the default) line text is joined directly from the core's tokens and no
+	:py:class:`LinearDisassemblyLine`, :py:class:`~binaryninja.function.Function` or token objects are created. Set it
+	to False to include per-token data in ``jsonl`` output.
+
+	``format`` is either ``text``, one line of output per disassembly line, or ``jsonl``, one JSON object per line with
+	the ``address``, the line ``type`` and its ``text`` (and ``tokens`` when not ``text_only``).
+
+	``root`` creates the linear view object to walk and defaults to :py:func:`LinearViewObject.disassembly`; any of the
+	other :py:class:`LinearViewObject` factories with the same signature, such as :py:func:`LinearViewObject.hlil`,
+	can be used.
+
+	:Example:
+
+		>>> exporter = LinearDisassemblyExporter(bv, format="jsonl", root=LinearViewObject.mlil)
+		>>> with open("/tmp/listing.jsonl", "w") as f:
+		... 	exporter.export(f, threads=8)
+		1402311
+	"""
+	def __init__(
+	    self, view: 'binaryview.BinaryView', settings: Optional['_function.DisassemblySettings'] = None,
+	    format: str = "text", text_only: bool = True, batch_size: int = 4096,
+	    root: Optional[Callable[['binaryview.BinaryView', Optional['_function.DisassemblySettings']], 'LinearViewObject']] = None
+	):
+		if format not in ("text", "jsonl"):
+			raise ValueError(f"Unknown export format '{format}', expected 'text' or 'jsonl'")
+		if batch_size <= 0:
+			raise ValueError("batch_size must be positive")
+		self.view = view
+		self.settings = settings
+		self.format = format
+		self.text_only = text_only
+		self.batch_size = batch_size
+		self.root = root if root is not None else LinearViewObject.disassembly
+
+	def _cursor(self, addr: Optional[int] = None) -> 'LinearViewCursor':
+		cursor = LinearViewCursor(self.root(self.view, self.settings))
+		if addr is not None:
+			cursor.seek_to_address(addr)
+		return cursor
+
+	def _format_text(self, lines, count: int, out: List[str]) -> None:
+		for i in range(0, count):
+			contents = lines[i].contents
+			parts = []
+			for j in range(0, contents.count):
+				text = contents.tokens[j].text
+				if not isinstance(text, str):
+					text = text.decode("utf-8")
+				parts.append(text)
+			text = "".join(parts)
+			if self.format == "text":
+				out.append(text + "\n")
+			else:
+				record = {"address": contents.addr, "type": LinearDisassemblyLineType(lines[i].type).name, "text": text}
+				out.append(json.dumps(record) + "\n")
+
+	def _format_objects(self, lines: List['LinearDisassemblyLine'], out: List[str]) -> None:
+		for line in lines:
+			if self.format == "text":
+				out.append(str(line) + "\n")
+				continue
+			record = {
+			    "address": line.contents.address, "type": LinearDisassemblyLineType(line.type).name, "text": str(line),
+			    "tokens": [[token.type.name, token.text, token.value] for token in line.contents.tokens]
+			}
+			out.append(json.dumps(record) + "\n")
+
+	def _write(self, output: TextIO, cursor: 'LinearViewCursor', end: Optional['LinearViewCursor'] = None) -> int:
+		written = 0
+		batch: List[str] = []
+		while not cursor.after_end:
+			if end is not None and LinearViewCursor.compare(cursor, end) >= 0:
+				break
+			count = ctypes.c_ulonglong(0)
+			lines = core.BNGetLinearViewCursorLines(cursor.handle, count)
+			if self.text_only:
+				assert lines is not None, "core.BNGetLinearViewCursorLines returned None"
+				try:
+					self._format_text(lines, count.value, batch)
+				finally:
+					core.BNFreeLinearDisassemblyLines(lines, count.value)
+			else:
+				self._format_objects(LinearViewCursor._make_lines(lines, count.value), batch)
+			if len(batch) >= self.batch_size:
+				output.write("".join(batch))
+				written += len(batch)
+				batch = []
+			if not cursor.next():
+				break
+		output.write("".join(batch))
+		return written + len(batch)
+
+	def _boundaries(self, threads: int) -> List[int]:
+		# Split at function starts, which are positions a cursor stepping with next() also lands on, so no lines are
+		# emitted by two workers
+		starts = sorted({func.start for func in self.view.functions})
+		if len(starts) < threads:
+			return starts[1:]
+		step = len(starts) / threads
+		return sorted({starts[int(i * step)] for i in range(1, threads)})
+
+	def export(self, output: TextIO, threads: int = 1) -> int:
+		"""
+		``export`` writes the whole linear view to ``output``.
+
+		With ``threads`` greater than one, the view is split into that many disjoint address ranges at function
+		boundaries. Each range is written to a temporary file by its own thread and the files are then copied to
+		``output`` in order, so the result is identical to a single threaded export.
+
+		:param output: text file object to write to
+		:param int threads: number of ranges to export concurrently
+		:return: number of lines written
+		:rtype: int
+		"""
+		boundaries = self._boundaries(threads) if threads > 1 else []
+		if not boundaries:
+			cursor = self._cursor()
+			cursor.seek_to_begin()
+			return self._write(output, cursor)
+
+		starts = [None] + boundaries
+		ends = boundaries + [None]
+		parts = [tempfile.TemporaryFile("w+", encoding="utf-8") for _ in starts]
+		counts = [0] * len(starts)
+		errors: List[BaseException] = []
+
+		def run(i: int) -> None:
+			try:
+				cursor = self._cursor(starts[i])
+				if starts[i] is None:
+					cursor.seek_to_begin()
+				end = self._cursor(ends[i]) if ends[i] is not None else None
+				counts[i] = self._write(parts[i], cursor, end)
+			except BaseException as e:
+				errors.append(e)
+
+		try:
+			workers = [threading.Thread(target=run, args=(i, )) for i in range(len(starts))]
+			for worker in workers:
+				worker.start()
+			for worker in workers:
+				worker.join()
+			if errors:
+				raise errors[0]
+			for part in parts:
+				part.seek(0)
+				shutil.copyfileobj(part, output)
+		finally:
+			for part in parts:
+				part.close()
+		return sum(counts)
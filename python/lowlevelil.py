@@ -18,6 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import array
 import ctypes
 import struct
 from typing import Generator, List, Optional, Dict, Union, Tuple, NewType, ClassVar, Set, Callable, Any, Iterator, overload
@@ -40,7 +41,7 @@ from .interaction import show_graph_report
 from .commonil import (
     BaseILInstruction, Constant, BinaryOperation, Tailcall, UnaryOperation, Comparison, SSA, Phi, FloatingPoint,
     ControlFlow, Terminal, Syscall, Localcall, StackOperation, Return, Signed, Arithmetic, Carry, DoublePrecision,
-    Memory, Load, Store, RegisterStack, SetReg, Intrinsic
+    Memory, Load, Store, RegisterStack, SetReg, Intrinsic, BaseILFunction, traverse_il
 )
 
 ExpressionIndex = NewType('ExpressionIndex', int)
@@ -729,15 +730,7 @@ class LowLevelILInstruction(BaseILInstruction):
 			>>>
 			>>> list(inst.traverse(get_constant_less_than_value, 10))
 		"""
-		if (result := cb(self, *args, **kwargs)) is not None:
-			yield result
-		for _, op, _ in self.detailed_operands:
-			if isinstance(op, LowLevelILInstruction):
-				yield from op.traverse(cb, *args, **kwargs)
-			elif isinstance(op, list) and all(isinstance(i, LowLevelILInstruction) for i in op):
-				for i in op:
-					yield from i.traverse(cb, *args, **kwargs) # type: ignore
-
+		yield from traverse_il([self], cb, args=args, kwargs=kwargs)
 
 	@deprecation.deprecated(deprecated_in="4.0.4907", details="Use :py:func:`LowLevelILInstruction.traverse` instead.")
 	def visit_all(self, cb: LowLevelILVisitorCallback,
@@ -3151,6 +3144,246 @@ ILInstruction:Dict[LowLevelILOperation, LowLevelILInstruction] = {  # type: igno
 }
 
 
+# Raw operand slots taken by each ILOperations operand type, anything not listed takes a single slot
+_LLIL_OPERAND_SLOTS = {
+	"reg_ssa": 2, "flag_ssa": 2, "reg_stack_ssa": 2, "reg_stack_ssa_dest_and_src": 3, "expr_list": 2, "int_list": 2,
+	"reg_ssa_list": 2, "flag_ssa_list": 2, "reg_stack_ssa_list": 2, "reg_or_flag_list": 2, "reg_or_flag_ssa_list": 2,
+	"target_map": 2, "reg_stack_adjust": 2,
+}
+
+# Operations whose ILInstruction class decodes its expression operands differently from its ILOperations entry
+_LLIL_EXPR_OPERAND_OVERRIDES: Dict[LowLevelILOperation, Tuple[Tuple[int, bool], ...]] = {
+	LowLevelILOperation.LLIL_MEMORY_INTRINSIC_SSA: ((0, False), (2, False)),
+}
+
+
+def _llil_expr_operands() -> Dict[LowLevelILOperation, Tuple[Tuple[int, bool], ...]]:
+	# Slot positions of the expression operands of each operation. Entries are ``(operand_index, is_list)`` where list
+	# operands hold an expression list rather than a single expression.
+	result = {}
+	for operation, operands in LowLevelILInstruction.ILOperations.items():
+		layout = []
+		operand_index = 0
+		for _, operand_type in operands:
+			if operand_type in ("expr", "expr_list"):
+				layout.append((operand_index, operand_type == "expr_list"))
+			operand_index += _LLIL_OPERAND_SLOTS.get(operand_type, 1)
+		if layout:
+			result[operation] = tuple(layout)
+	result.update(_LLIL_EXPR_OPERAND_OVERRIDES)
+	return result
+
+
+_LLIL_EXPR_OPERANDS = _llil_expr_operands()
+
+
+class LowLevelILFlatExpr:
+	"""
+	``class LowLevelILFlatExpr`` is a lightweight cursor into a :py:class:`LowLevelILFlatView`. It only holds the view
+	and an expression index; every property reads from the view's flat arrays and operands are decoded on demand.
+	Use :py:attr:`instruction` to get the full :py:class:`LowLevelILInstruction` when richer decoding is needed.
+	"""
+	__slots__ = ("view", "expr_index")
+
+	def __init__(self, view: 'LowLevelILFlatView', expr_index: ExpressionIndex):
+		self.view = view
+		self.expr_index = expr_index
+
+	def __repr__(self):
+		return f"<LowLevelILFlatExpr {self.expr_index}: {self.operation.name} @ {self.address:#x}>"
+
+	def __eq__(self, other):
+		if not isinstance(other, LowLevelILFlatExpr):
+			return NotImplemented
+		return self.view is other.view and self.expr_index == other.expr_index
+
+	def __hash__(self):
+		return hash((id(self.view), self.expr_index))
+
+	@property
+	def operation(self) -> LowLevelILOperation:
+		return LowLevelILOperation(self.view.operation[self.expr_index])
+
+	@property
+	def size(self) -> int:
+		return self.view.size[self.expr_index]
+
+	@property
+	def flags(self) -> int:
+		"""Raw flag write type index of the expression"""
+		return self.view.flags[self.expr_index]
+
+	@property
+	def address(self) -> int:
+		return self.view.address[self.expr_index]
+
+	@property
+	def raw_operands(self) -> OperandsType:
+		base = self.expr_index * 4
+		operands = self.view.operands
+		return (operands[base], operands[base + 1], operands[base + 2], operands[base + 3])  # type: ignore
+
+	def raw_operand(self, operand_index: int) -> int:
+		return self.view.operands[self.expr_index * 4 + operand_index]
+
+	def get_int(self, operand_index: int) -> int:
+		"""Decodes operand ``operand_index`` as a signed 64 bit integer"""
+		value = self.raw_operand(operand_index)
+		return (value & ((1 << 63) - 1)) - (value & (1 << 63))
+
+	def get_reg(self, operand_index: int) -> ILRegister:
+		return ILRegister(self.view.function.arch, architecture.RegisterIndex(self.raw_operand(operand_index)))
+
+	def get_flag(self, operand_index: int) -> ILFlag:
+		return ILFlag(self.view.function.arch, architecture.FlagIndex(self.raw_operand(operand_index)))
+
+	@property
+	def child_indices(self) -> List[ExpressionIndex]:
+		"""Expression indices of the direct sub-expressions of this expression"""
+		return self.view.child_indices(self.expr_index)
+
+	@property
+	def children(self) -> List['LowLevelILFlatExpr']:
+		"""Cursors for the direct sub-expressions of this expression"""
+		return [LowLevelILFlatExpr(self.view, i) for i in self.view.child_indices(self.expr_index)]
+
+	@property
+	def instruction(self) -> LowLevelILInstruction:
+		"""The fully decoded :py:class:`LowLevelILInstruction` for this expression"""
+		return LowLevelILInstruction.create(self.view.function, self.expr_index)
+
+
+class LowLevelILFlatView:
+	"""
+	``class LowLevelILFlatView`` is a snapshot of the entire expression pool of a :py:class:`LowLevelILFunction` stored
+	as flat arrays indexed by expression index. It does not create a Python object per expression, which makes
+	whole-function passes (taint tracking, pattern matching) considerably cheaper than walking
+	:py:class:`LowLevelILInstruction` trees. Use :py:func:`LowLevelILFunction.flat_view` to create one.
+
+	.. note:: The view is a snapshot, it is not updated if the underlying function is modified.
+
+	.. note:: The core has no bulk accessor for the expression pool, so the arrays are filled with one \
+	``BNGetLowLevelILByIndex`` call per expression, and :py:func:`child_indices` reads expression list operands \
+	(call parameters) with one ``BNLowLevelILGetOperandList`` call each.
+
+	:Example:
+		>>> view = current_llil.flat_view()
+		>>> for expr in view.exprs_with_operation(LowLevelILOperation.LLIL_CALL):
+		...   print(hex(expr.address), expr.children[0].operation.name)
+		0x1000 LLIL_CONST_PTR
+	"""
+	def __init__(self, function: 'LowLevelILFunction'):
+		self.function = function
+		self.operation = array.array("H")
+		self.size = array.array("Q")
+		self.flags = array.array("I")
+		self.attributes = array.array("I")
+		self.operands = array.array("Q")
+		self.address = array.array("Q")
+		self.instructions = array.array("Q")
+
+		for i in range(0, core.BNGetLowLevelILExprCount(function.handle)):
+			instr = core.BNGetLowLevelILByIndex(function.handle, i)
+			self.operation.append(instr.operation)
+			self.size.append(instr.size)
+			self.flags.append(instr.flags)
+			self.attributes.append(instr.attributes)
+			self.operands.extend(instr.operands)
+			self.address.append(instr.address)
+		for i in range(0, core.BNGetLowLevelILInstructionCount(function.handle)):
+			self.instructions.append(core.BNGetLowLevelILIndexForInstruction(function.handle, i))
+
+	def __repr__(self):
+		return f"<LowLevelILFlatView {len(self)} expressions, {len(self.instructions)} instructions>"
+
+	def __len__(self) -> int:
+		return len(self.operation)
+
+	def __getitem__(self, expr_index: ExpressionIndex) -> LowLevelILFlatExpr:
+		if expr_index < 0 or expr_index >= len(self):
+			raise IndexError(f"expression index {expr_index} out of range (0, {len(self)})")
+		return LowLevelILFlatExpr(self, expr_index)
+
+	def __iter__(self) -> Iterator[LowLevelILFlatExpr]:
+		"""Iterates the root expression of every instruction in instruction order"""
+		for expr_index in self.instructions:
+			yield LowLevelILFlatExpr(self, ExpressionIndex(expr_index))
+
+	def child_indices(self, expr_index: ExpressionIndex) -> List[ExpressionIndex]:
+		"""
+		``child_indices`` returns the expression indices of the direct sub-expressions of ``expr_index``
+
+		:param int expr_index: expression index to decode
+		:rtype: list(int)
+		"""
+		layout = _LLIL_EXPR_OPERANDS.get(self.operation[expr_index])  # type: ignore
+		if layout is None:
+			return []
+		result: List[ExpressionIndex] = []
+		for operand_index, is_list in layout:
+			if not is_list:
+				result.append(ExpressionIndex(self.operands[expr_index * 4 + operand_index]))
+				continue
+			count = ctypes.c_ulonglong()
+			operand_list = core.BNLowLevelILGetOperandList(self.function.handle, expr_index, operand_index, count)
+			assert operand_list is not None, "core.BNLowLevelILGetOperandList returned None"
+			try:
+				for j in range(count.value):
+					result.append(ExpressionIndex(operand_list[j]))
+			finally:
+				core.BNLowLevelILFreeOperandList(operand_list)
+		return result
+
+	def walk(self, expr_index: Optional[ExpressionIndex] = None) -> Iterator[ExpressionIndex]:
+		"""
+		``walk`` yields expression indices in pre-order, starting at ``expr_index`` or at every instruction root
+		when ``expr_index`` is not given. The walk uses an explicit stack and creates no cursor objects.
+
+		:param int expr_index: optional root expression
+		:rtype: Iterator[int]
+		"""
+		if expr_index is None:
+			stack = list(reversed(self.instructions))
+		else:
+			stack = [expr_index]
+		while stack:
+			current = stack.pop()
+			yield ExpressionIndex(current)
+			stack.extend(reversed(self.child_indices(ExpressionIndex(current))))
+
+	def exprs_with_operation(self, *operations: LowLevelILOperation) -> Iterator[LowLevelILFlatExpr]:
+		"""
+		``exprs_with_operation`` yields a cursor for each expression reachable from an instruction whose operation
+		is one of ``operations``
+
+		:param LowLevelILOperation operations: operations to match
+		:rtype: Iterator[LowLevelILFlatExpr]
+		"""
+		wanted = set(int(op) for op in operations)
+		for expr_index in self.walk():
+			if self.operation[expr_index] in wanted:
+				yield LowLevelILFlatExpr(self, expr_index)
+
+	def to_numpy(self) -> Dict[str, Any]:
+		"""
+		``to_numpy`` wraps the flat arrays in NumPy arrays without copying them. ``operands`` is reshaped to
+		``(len(self), 4)``.
+
+		:rtype: dict
+		:raises ImportError: if NumPy is not installed
+		"""
+		import numpy
+		return {
+		    "operation": numpy.frombuffer(self.operation, dtype=numpy.uint16),
+		    "size": numpy.frombuffer(self.size, dtype=numpy.uint64),
+		    "flags": numpy.frombuffer(self.flags, dtype=numpy.uint32),
+		    "attributes": numpy.frombuffer(self.attributes, dtype=numpy.uint32),
+		    "operands": numpy.frombuffer(self.operands, dtype=numpy.uint64).reshape((len(self), 4)),
+		    "address": numpy.frombuffer(self.address, dtype=numpy.uint64),
+		    "instructions": numpy.frombuffer(self.instructions, dtype=numpy.uint64),
+		}
+
+
 class LowLevelILExpr:
 	"""
 	``class LowLevelILExpr`` hold the index of IL Expressions.
@@ -3168,7 +3401,7 @@ class LowLevelILExpr:
 		return self._index
 
 
-class LowLevelILFunction:
+class LowLevelILFunction(BaseILFunction):
 	"""
 	``class LowLevelILFunction`` contains the list of ExpressionIndex objects that make up a function. ExpressionIndex
 	objects can be added to the LowLevelILFunction by calling :func:`append` and passing the result of the various class
@@ -3370,8 +3603,23 @@ class LowLevelILFunction:
 			...         return instr.constant
 			>>> print(list(current_il_function.traverse(find_constants)))
 		"""
-		for instr in self.instructions:
-			yield from instr.traverse(cb, *args, **kwargs)
+		yield from traverse_il(self.instructions, cb, args=args, kwargs=kwargs)
+
+	def flat_view(self) -> LowLevelILFlatView:
+		"""
+		``flat_view`` snapshots every expression of the function into a :py:class:`LowLevelILFlatView`. The view
+		stores operation, size, flags, operands and address of each expression in flat arrays and hands out
+		lightweight :py:class:`LowLevelILFlatExpr` cursors instead of :py:class:`LowLevelILInstruction` objects.
+
+		:rtype: LowLevelILFlatView
+		:Example:
+			>>> view = current_llil.flat_view()
+			>>> len(view)
+			112
+			>>> [hex(e.address) for e in view.exprs_with_operation(LowLevelILOperation.LLIL_STORE)]
+			['0x8440', '0x8448']
+		"""
+		return LowLevelILFlatView(self)
 
 	@deprecation.deprecated(deprecated_in="4.0.4907", details="Use :py:func:`LowLevelILFunction.traverse` instead.")
 	def visit(self, cb: LowLevelILVisitorCallback) -> bool:
@@ -42,7 +42,8 @@ from .interaction import show_graph_report
 from .commonil import (
     BaseILInstruction, Constant, BinaryOperation, UnaryOperation, Comparison, SSA, Phi, FloatingPoint, ControlFlow,
     Terminal, Call, Localcall, Syscall, Tailcall, Return, Signed, Arithmetic, Carry, DoublePrecision, Memory, Load,
-    Store, RegisterStack, SetVar, Intrinsic, VariableInstruction, SSAVariableInstruction, AliasedVariableInstruction
+    Store, RegisterStack, SetVar, Intrinsic, VariableInstruction, SSAVariableInstruction, AliasedVariableInstruction,
+    BaseILFunction, traverse_il, SSADefUseGraph, build_ssa_def_use_graph, ssa_memory_versions
 )
 
 TokenList = List['function.InstructionTextToken']
@@ -482,14 +483,7 @@ class MediumLevelILInstruction(BaseILInstruction):
 			>>>
 			>>> list(inst.traverse(get_constant_less_than_value, 10))
 		"""
-		if (result := cb(self, *args, **kwargs)) is not None:
-			yield result
-		for _, op, _ in self.detailed_operands:
-			if isinstance(op, MediumLevelILInstruction):
-				yield from op.traverse(cb, *args, **kwargs)
-			elif isinstance(op, list) and all(isinstance(i, MediumLevelILInstruction) for i in op):
-				for i in op:
-					yield from i.traverse(cb, *args, **kwargs) # type: ignore
+		yield from traverse_il([self], cb, args=args, kwargs=kwargs)
 
 	@deprecation.deprecated(deprecated_in="4.0.4907", details="Use :py:func:`MediumLevelILInstruction.traverse` instead.")
 	def visit_all(self, cb: MediumLevelILVisitorCallback,
@@ -3138,6 +3132,24 @@ ILInstruction = {
 }
 
 
+# Operand indices of the memory versions of each SSA operation, as ``(operand_index, is_list)`` pairs. Memory versions
+# of calls are split between the call and its nested output and parameter expressions.
+_MLIL_MEMORY_OPERANDS: Dict[MediumLevelILOperation, Tuple[Tuple[int, bool], ...]] = {
+    MediumLevelILOperation.MLIL_CALL_OUTPUT_SSA: ((0, False), ),
+    MediumLevelILOperation.MLIL_CALL_PARAM_SSA: ((0, False), ),
+    MediumLevelILOperation.MLIL_CALL_SSA: ((4, False), ),
+    MediumLevelILOperation.MLIL_SYSCALL_SSA: ((3, False), ),
+    MediumLevelILOperation.MLIL_TAILCALL_SSA: ((4, False), ),
+    MediumLevelILOperation.MLIL_MEMORY_INTRINSIC_OUTPUT_SSA: ((0, False), ),
+    MediumLevelILOperation.MLIL_MEMORY_INTRINSIC_SSA: ((4, False), ),
+    MediumLevelILOperation.MLIL_LOAD_SSA: ((1, False), ),
+    MediumLevelILOperation.MLIL_LOAD_STRUCT_SSA: ((2, False), ),
+    MediumLevelILOperation.MLIL_STORE_SSA: ((1, False), (2, False)),
+    MediumLevelILOperation.MLIL_STORE_STRUCT_SSA: ((2, False), (3, False)),
+    MediumLevelILOperation.MLIL_MEM_PHI: ((0, False), (1, True)),
+}
+
+
 class MediumLevelILExpr:
 	"""
 	``class MediumLevelILExpr`` hold the index of IL Expressions.
@@ -3155,7 +3167,7 @@ class MediumLevelILExpr:
 		return self._index
 
 
-class MediumLevelILFunction:
+class MediumLevelILFunction(BaseILFunction):
 	"""
 	``class MediumLevelILFunction`` contains the list of ExpressionIndex objects that make up a function. ExpressionIndex
 	objects can be added to the MediumLevelILFunction by calling :func:`append` and passing the result of the various class
@@ -3316,8 +3328,7 @@ class MediumLevelILFunction:
 			...         return instr.constant
 			>>> print(list(current_il_function.traverse(find_constants)))
 		"""
-		for instr in self.instructions:
-			yield from instr.traverse(cb, *args, **kwargs)
+		yield from traverse_il(self.instructions, cb, args=args, kwargs=kwargs)
 
 	@deprecation.deprecated(deprecated_in="4.0.4907", details="Use :py:func:`MediumLevelILFunction.traverse` instead.")
 	def visit(self, cb: MediumLevelILVisitorCallback) -> bool:
@@ -3660,6 +3671,74 @@ class MediumLevelILFunction:
 		core.BNFreeILInstructionList(instrs)
 		return result
 
+	def ssa_def_use_graph(self) -> SSADefUseGraph:
+		"""
+		``ssa_def_use_graph`` collects the definition and uses of every SSA variable version and memory version of the
+		SSA form of this function in one pass. Definitions and uses are stored as raw instruction indices in flat arrays
+		rather than wrapped in instruction objects, so repeated data-flow queries can be answered without calling
+		:py:func:`get_ssa_var_definition` and :py:func:`get_ssa_var_uses` for each variable.
+
+		:return: def-use graph of the SSA form of this function
+		:rtype: SSADefUseGraph
+		:Example:
+
+			>>> graph = current_mlil.ssa_def_use_graph()
+			>>> i = graph.index_of(current_mlil.ssa_vars[0])
+			>>> graph.definition[i], list(graph.uses_of(i))
+		"""
+		ssa = self.ssa_form
+		assert ssa is not None, "MediumLevelILFunction.ssa_form is None"
+
+		def index_list(instrs, count: ctypes.c_ulonglong) -> List[int]:
+			assert instrs is not None, "core returned None for an SSA use list"
+			try:
+				return instrs[:count.value]
+			finally:
+				core.BNFreeILInstructionList(instrs)
+
+		def var_uses(core_var, version: int) -> List[int]:
+			count = ctypes.c_ulonglong()
+			return index_list(core.BNGetMediumLevelILSSAVarUses(ssa.handle, core_var, version, count), count)
+
+		def memory_uses(version: int) -> List[int]:
+			count = ctypes.c_ulonglong()
+			return index_list(core.BNGetMediumLevelILSSAMemoryUses(ssa.handle, version, count), count)
+
+		def raw_operands(expr_index: int) -> Tuple[int, Any]:
+			expr = core.BNGetMediumLevelILByIndex(ssa.handle, expr_index)
+			return expr.operation, expr.operands
+
+		def operand_list(expr_index: int, operand_index: int) -> List[int]:
+			count = ctypes.c_ulonglong()
+			operands = core.BNMediumLevelILGetOperandList(ssa.handle, expr_index, operand_index, count)
+			assert operands is not None, "core.BNMediumLevelILGetOperandList returned None"
+			try:
+				return operands[:count.value]
+			finally:
+				core.BNMediumLevelILFreeOperandList(operands)
+
+		variable_count = ctypes.c_ulonglong()
+		core_variables = core.BNGetMediumLevelILVariables(ssa.handle, variable_count)
+		assert core_variables is not None, "core.BNGetMediumLevelILVariables returned None"
+		try:
+			variables = []
+			for var_i in range(variable_count.value):
+				core_var = core_variables[var_i]
+				version_count = ctypes.c_ulonglong()
+				versions = core.BNGetMediumLevelILVariableSSAVersions(ssa.handle, core_var, version_count)
+				variables.append((
+				    variable.Variable(ssa, core_var.type, core_var.index, core_var.storage), core_var,
+				    index_list(versions, version_count)
+				))
+			return build_ssa_def_use_graph(
+			    ssa, variables, lambda core_var, version: core.BNGetMediumLevelILSSAVarDefinition(ssa.handle, core_var, version),
+			    var_uses, ssa_memory_versions(core.BNGetMediumLevelILExprCount(ssa.handle), raw_operands, operand_list, _MLIL_MEMORY_OPERANDS),
+			    lambda version: core.BNGetMediumLevelILSSAMemoryDefinition(ssa.handle, version), memory_uses,
+			    core.BNGetMediumLevelILInstructionCount(ssa.handle)
+			)
+		finally:
+			core.BNFreeVariableList(core_variables)
+
 	def is_ssa_var_live(self, ssa_var: SSAVariable) -> bool:
 		"""
 		``is_ssa_var_live`` determines if ``ssa_var`` is live at any point in the function
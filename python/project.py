@@ -19,10 +19,16 @@
 # IN THE SOFTWARE.
 
 import ctypes
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from os import PathLike
-from typing import Callable, List, Optional, Union
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import binaryninja
 from . import _binaryninjacore as core
@@ -31,6 +37,7 @@ from .metadata import Metadata, MetadataValueType
 
 
 ProgressFuncType = Callable[[int, int], bool]
+IngestProgressFuncType = Callable[[str, int, int], bool]
 AsPath = Union[PathLike, str]
 
 #TODO: notifications
@@ -55,6 +62,41 @@ def _wrap_progress(progress_func: ProgressFuncType):
 		lambda ctxt, cur, total: progress_func(cur, total))
 
 
+def _hash_file(path: AsPath) -> str:
+	digest = hashlib.sha256()
+	with open(path, "rb") as f:
+		for chunk in iter(lambda: f.read(1 << 20), b""):
+			digest.update(chunk)
+	return digest.hexdigest()
+
+
+def _ingest_summary(bv) -> Dict[str, Any]:
+	"""Default analysis callback of :py:func:`Project.ingest`, run in the analysis worker processes"""
+	return {"view_type": bv.view_type, "functions": len(bv.functions)}
+
+
+@dataclass
+class ProjectIngestResult:
+	"""
+	``ProjectIngestResult`` summarizes a call to :py:func:`Project.ingest`
+	"""
+	imported: List['ProjectFile'] = field(default_factory=list)
+	"""Files added to the project by this call"""
+
+	duplicates: Dict[str, str] = field(default_factory=dict)
+	"""Paths on disk that were not imported because their contents are already in the project (or earlier in the \
+	input), mapped to the id of the existing file"""
+
+	analyzed: List[str] = field(default_factory=list)
+	"""Ids of the files analyzed successfully by this call"""
+
+	failed: Dict[str, str] = field(default_factory=dict)
+	"""Ids of the files that failed to import or analyze, mapped to the error"""
+
+	elapsed: float = 0.0
+	"""Wall time in seconds of the whole ingest"""
+
+
 class ProjectFile:
 	"""
 	Class representing a file in a project
@@ -659,6 +701,217 @@ class Project:
 		"""
 		return core.BNProjectDeleteFile(self._handle, file._handle)
 
+	_ingest_hashes_key = "ingest_hashes"
+	_ingest_status_key = "ingest_status"
+
+	def _query_metadata_default(self, key: str) -> Dict[str, Any]:
+		try:
+			value = self.query_metadata(key)
+		except KeyError:
+			return {}
+		return dict(value) if isinstance(value, dict) else {}
+
+	def _ingest_folder(self, cache: Dict[Tuple[Optional[str], str], ProjectFolder], parent: Optional[ProjectFolder], name: str) -> ProjectFolder:
+		key = (parent.id if parent is not None else None, name)
+		folder = cache.get(key)
+		if folder is None:
+			folder = self.create_folder(parent, name)
+			cache[key] = folder
+		return folder
+
+	def ingest(
+	    self, paths: Union[AsPath, Iterable[AsPath]], folder: Optional[ProjectFolder] = None, analyze: bool = True,
+	    callback: Optional[Callable[['binaryninja.BinaryView'], Any]] = None, import_threads: Optional[int] = None,
+	    workers: Optional[int] = None, timeout: Optional[float] = None, retry_failed: bool = False,
+	    options: Optional[Dict[str, Any]] = None, progress_func: Optional[IngestProgressFuncType] = None
+	) -> ProjectIngestResult:
+		"""
+		``ingest`` adds many files to the project and optionally analyzes them, in three stages:
+
+			1. ``hash``: every input file is hashed with SHA-256 on ``import_threads`` threads. Files whose contents are
+			   already in the project, or appear earlier in the input, are skipped as duplicates.
+			2. ``import``: the remaining files are created one at a time with :py:func:`create_file_from_path` inside a
+			   single :py:func:`bulk_operation`. Directories are mirrored as folders under ``folder``.
+			3. ``analyze``: imported files that have not been analyzed yet are loaded and analyzed in a pool of
+			   ``workers`` processes with :py:func:`binaryninja.batch.analyze_files`, which runs ``callback`` on each view.
+
+		The content hashes and the status, timing and callback result of every file are recorded in the project
+		metadata (``ingest_hashes`` and ``ingest_status``) as the ingest progresses. Calling ``ingest`` again with the
+		same inputs after an interruption therefore skips files that were already imported and analyzed, and only
+		retries failed files when ``retry_failed`` is set.
+
+		``callback`` must be picklable (a module level function) and should return a value that can be stored as
+		:py:class:`~binaryninja.metadata.Metadata`; by default the view type and function count are recorded.
+
+		:param paths: file or directory, or list of files and directories, to ingest
+		:param folder: project folder to place the ingested files and folders in
+		:param bool analyze: whether to analyze the ingested files
+		:param callback: function run in the analysis workers with each loaded BinaryView
+		:param int import_threads: number of threads used to hash files, defaults to ``os.cpu_count()``
+		:param int workers: number of analysis processes, defaults to ``os.cpu_count()``
+		:param float timeout: per-file analysis timeout in seconds
+		:param bool retry_failed: analyze files that failed in a previous ingest again
+		:param dict options: load options passed to :py:func:`binaryninja.load`
+		:param progress_func: called with the stage name, the number of completed items and the total, return False to stop; hashing and analysis stop right away, importing stops after the current stage
+		:return: summary of the ingest
+		:rtype: ProjectIngestResult
+		:Example:
+			>>> result = project.ingest("/firmware/extracted", workers=8, timeout=600)
+			>>> len(result.imported), len(result.duplicates), len(result.failed)
+			(18231, 1804, 12)
+		"""
+		from .batch import analyze_files
+
+		start = time.perf_counter()
+		result = ProjectIngestResult()
+		if progress_func is None:
+			progress_func = _nop
+		if import_threads is None:
+			import_threads = os.cpu_count() or 1
+		if isinstance(paths, (str, PathLike)):
+			paths = [paths]
+
+		# Expand directories, remembering the folder path each file belongs in
+		inputs: List[Tuple[Path, Tuple[str, ...]]] = []
+		for path in paths:
+			path = Path(path)
+			if path.is_dir():
+				for root, dirs, files in os.walk(path):
+					dirs.sort()
+					relative = Path(root).relative_to(path.parent).parts
+					for name in sorted(files):
+						file_path = Path(root) / name
+						if file_path.is_file() and not file_path.is_symlink():
+							inputs.append((file_path, relative))
+			else:
+				inputs.append((path, ()))
+
+		hashes = self._query_metadata_default(self._ingest_hashes_key)
+		status = self._query_metadata_default(self._ingest_status_key)
+		existing = {f.id: f for f in self.files}
+		hashes = {digest: file_id for digest, file_id in hashes.items() if file_id in existing}
+		# Digests recorded by earlier ingests, as opposed to files only hashed here for de-duplication
+		recorded = set(hashes)
+
+		def save_metadata():
+			self.store_metadata(self._ingest_hashes_key, hashes)
+			self.store_metadata(self._ingest_status_key, status)
+
+		with ThreadPoolExecutor(import_threads) as pool:
+			# Files added to the project some other way are hashed once so they take part in de-duplication
+			known = set(hashes.values())
+			unhashed = [f for f in existing.values() if f.id not in known and f.exists_on_disk]
+			for f, digest in zip(unhashed, pool.map(lambda f: _hash_file(f.path_on_disk), unhashed)):
+				hashes.setdefault(digest, f.id)
+
+			digests = []
+			stop = False
+			futures = [pool.submit(_hash_file, path) for path, _ in inputs]
+			for i, future in enumerate(futures):
+				digests.append(future.result())
+				if progress_func("hash", i + 1, len(inputs)) is False:
+					stop = True
+					for pending_future in futures[i + 1:]:
+						pending_future.cancel()
+					break
+
+			to_import = []
+			duplicates = []
+			queued = set()
+			for (path, folder_parts), digest in zip(inputs, digests):
+				if digest in hashes or digest in queued:
+					duplicates.append((path, digest))
+				else:
+					queued.add(digest)
+					to_import.append((path, folder_parts, digest))
+
+			folders: Dict[Tuple[Optional[str], str], ProjectFolder] = {}
+			for f in self.folders:
+				parent = f.parent
+				folders[(parent.id if parent is not None else None, f.name)] = f
+
+		if not stop and to_import:
+			# Project modifications are not safe to run concurrently, so files are created one at a time
+			with self.bulk_operation():
+				for i, (path, folder_parts, digest) in enumerate(to_import):
+					target = folder
+					for part in folder_parts:
+						target = self._ingest_folder(folders, target, part)
+					began = time.perf_counter()
+					try:
+						file = self.create_file_from_path(path, target, path.name)
+					except ProjectException as e:
+						result.failed[str(path)] = str(e)
+					else:
+						hashes[digest] = file.id
+						status[file.id] = {
+						    "path": str(path), "sha256": digest, "status": "imported",
+						    "import_seconds": time.perf_counter() - began
+						}
+						result.imported.append(file)
+						existing[file.id] = file
+					stop = progress_func("import", i + 1, len(to_import)) is False or stop
+			save_metadata()
+
+		for path, digest in duplicates:
+			if digest in hashes:
+				file_id = hashes[digest]
+				result.duplicates[str(path)] = file_id
+				if file_id not in status and digest in recorded:
+					# Imported by an ingest that was interrupted before it recorded its status
+					status[file_id] = {"path": str(path), "sha256": digest, "status": "imported"}
+
+		if not analyze:
+			result.elapsed = time.perf_counter() - start
+			return result
+
+		# Anything imported but not analyzed, from this or an interrupted earlier ingest, is analyzed now
+		retry = ("imported", "failed", "timed_out") if retry_failed else ("imported", )
+		pending = {
+		    existing[file_id].path_on_disk: file_id for file_id, entry in status.items()
+		    if entry.get("status") in retry and file_id in existing and existing[file_id].exists_on_disk
+		}
+		if stop or not pending:
+			result.elapsed = time.perf_counter() - start
+			return result
+
+		done = 0
+		results = analyze_files(
+		    pending.keys(), callback if callback is not None else _ingest_summary, workers=workers, timeout=timeout,
+		    options=options
+		)
+		try:
+			for batch_result in results:
+				file_id = pending[batch_result.path]
+				entry = dict(status[file_id])
+				entry["analysis_seconds"] = batch_result.elapsed
+				if batch_result.ok:
+					entry["status"] = "analyzed"
+					entry.pop("error", None)
+					if batch_result.result is not None:
+						try:
+							Metadata(batch_result.result)
+							entry["result"] = batch_result.result
+						except ValueError:
+							entry["result"] = repr(batch_result.result)
+					result.analyzed.append(file_id)
+				else:
+					entry["status"] = "timed_out" if batch_result.timed_out else "failed"
+					entry["error"] = batch_result.error if batch_result.error is not None else "timed out"
+					result.failed[file_id] = entry["error"]
+				status[file_id] = entry
+				done += 1
+				# Persist regularly so an interrupted ingest can resume
+				if done % 64 == 0:
+					save_metadata()
+				if progress_func("analyze", done, len(pending)) is False:
+					break
+		finally:
+			results.close()
+			save_metadata()
+		result.elapsed = time.perf_counter() - start
+		return result
+
 	@contextmanager
 	def bulk_operation(self):
 		"""
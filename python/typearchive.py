@@ -19,8 +19,9 @@
 # IN THE SOFTWARE.
 
 import ctypes
+import threading
 import traceback
-from typing import Optional, List, Dict, Union, Tuple
+from typing import Optional, List, Dict, Union, Tuple, Callable, Iterable, Set, Mapping
 
 # Binary Ninja components
 import binaryninja
@@ -748,6 +749,257 @@ class TypeArchiveNotification:
 		pass
 
 
+class TypeArchiveSync(TypeArchiveNotification):
+	"""
+	``TypeArchiveSync`` keeps a set of open views in sync with a shared :py:class:`TypeArchive`.
+
+	* Dependency closures are computed from cached direct references, so each archive type costs one core query no
+	  matter how many requested types depend on it. Cached references are dropped when the type changes.
+	* :py:func:`pull_types` and :py:func:`push_types` batch their work into a few
+	  :py:func:`BinaryView.pull_types_from_archive_by_id` / :py:func:`BinaryView.push_types_to_archive_by_id` calls
+	  per view.
+	* Changes to the archive are received as :py:class:`TypeArchiveNotification` events and recorded per view, so
+	  :py:func:`pull` only pulls the changed types each view uses instead of comparing snapshots. Callbacks added with
+	  :py:func:`subscribe` receive the same events as they happen.
+
+	Call :py:func:`close` (or use the object as a context manager) to stop receiving notifications.
+
+	:param archive: archive to synchronize with
+	:param views: views to keep in sync; more can be added with :py:func:`add_view`
+
+	:Example:
+
+		>>> sync = TypeArchiveSync(archive, [bv1, bv2])
+		>>> sync.subscribe(lambda archive, event, id: print(event, archive.get_type_name_by_id(id)))
+		>>> sync.push_types(bv1, list(bv1.type_container.type_ids))
+		>>> sync.pull()  # bring bv2 up to date with the types pushed from bv1 that it uses
+	"""
+	def __init__(self, archive: 'TypeArchive', views: Iterable['binaryview.BinaryView'] = ()):
+		super(TypeArchiveSync, self).__init__()
+		self.archive = archive
+		self._lock = threading.RLock()
+		self._references: Dict[str, List[str]] = {}
+		self._pending: Dict['binaryview.BinaryView', Set[str]] = {}
+		self._subscribers: List[Callable[['TypeArchive', str, str], None]] = []
+		# One entry per push in progress: the pushing view and the ids changed in the archive while it runs
+		self._pushing: List[Tuple['binaryview.BinaryView', Set[str]]] = []
+		for view in views:
+			self.add_view(view)
+		archive.register_notification(self)
+
+	def __repr__(self):
+		return f"<TypeArchiveSync {self.archive.path}: {len(self._pending)} views>"
+
+	def __enter__(self) -> 'TypeArchiveSync':
+		return self
+
+	def __exit__(self, type, value, traceback):
+		self.close()
+
+	def close(self) -> None:
+		"""Stop receiving notifications from the archive"""
+		self.archive.unregister_notification(self)
+
+	def add_view(self, view: 'binaryview.BinaryView') -> None:
+		"""
+		``add_view`` adds a view to keep in sync, attaching the archive to it if needed. Only changes made after the
+		view was added are pulled by :py:func:`pull`.
+
+		:param view: view to add
+		"""
+		if self.archive.id not in view.attached_type_archives:
+			view.attach_type_archive(self.archive)
+		with self._lock:
+			self._pending.setdefault(view, set())
+
+	def remove_view(self, view: 'binaryview.BinaryView') -> None:
+		"""
+		``remove_view`` stops tracking changes for ``view``
+
+		:param view: view to remove
+		"""
+		with self._lock:
+			self._pending.pop(view, None)
+
+	@property
+	def views(self) -> List['binaryview.BinaryView']:
+		"""Views kept in sync (read-only)"""
+		with self._lock:
+			return list(self._pending)
+
+	def subscribe(self, callback: Callable[['TypeArchive', str, str], None]) -> None:
+		"""
+		``subscribe`` registers ``callback`` to be called with ``(archive, event, type id)`` for every change to the
+		archive, where ``event`` is one of ``"added"``, ``"updated"``, ``"renamed"`` or ``"deleted"``. Callbacks run
+		on the thread that changed the archive and should return quickly.
+
+		:param callback: function to call
+		"""
+		with self._lock:
+			self._subscribers.append(callback)
+
+	def unsubscribe(self, callback: Callable[['TypeArchive', str, str], None]) -> None:
+		"""
+		``unsubscribe`` removes a callback added with :py:func:`subscribe`
+
+		:param callback: function to remove
+		"""
+		with self._lock:
+			if callback in self._subscribers:
+				self._subscribers.remove(callback)
+
+	def _changed(self, event: str, id: str) -> None:
+		with self._lock:
+			self._references.pop(id, None)
+			for view, pending in self._pending.items():
+				if event == "deleted":
+					pending.discard(id)
+					continue
+				pushes = [seen for pushing, seen in self._pushing if pushing == view]
+				if not pushes:
+					pending.add(id)
+				for seen in pushes:
+					seen.add(id)
+			subscribers = list(self._subscribers)
+		for callback in subscribers:
+			try:
+				callback(self.archive, event, id)
+			except:
+				log.log_error(traceback.format_exc())
+
+	def type_added(self, archive: 'TypeArchive', id: str, definition: '_types.Type') -> None:
+		self._changed("added", id)
+
+	def type_updated(self, archive: 'TypeArchive', id: str, old_definition: '_types.Type', new_definition: '_types.Type') -> None:
+		self._changed("updated", id)
+
+	def type_renamed(self, archive: 'TypeArchive', id: str, old_name: '_types.QualifiedName', new_name: '_types.QualifiedName') -> None:
+		self._changed("renamed", id)
+
+	def type_deleted(self, archive: 'TypeArchive', id: str, definition: '_types.Type') -> None:
+		self._changed("deleted", id)
+
+	def _direct_references(self, id: str) -> List[str]:
+		with self._lock:
+			references = self._references.get(id)
+		if references is None:
+			references = self.archive.get_outgoing_direct_references(id)
+			with self._lock:
+				self._references[id] = references
+		return references
+
+	def closure(self, ids: Iterable[str]) -> List[str]:
+		"""
+		``closure`` returns ``ids`` followed by every archive type they reference, directly or indirectly, each once
+
+		:param ids: archive type ids
+		:return: archive type ids of the types and their dependencies
+		"""
+		result = list(dict.fromkeys(ids))
+		seen = set(result)
+		i = 0
+		while i < len(result):
+			for reference in self._direct_references(result[i]):
+				if reference not in seen:
+					seen.add(reference)
+					result.append(reference)
+			i += 1
+		return result
+
+	def pending(self, view: 'binaryview.BinaryView') -> Set[str]:
+		"""
+		``pending`` returns the ids of the archive types changed since ``view`` was last synchronized
+
+		:param view: view added with :py:func:`add_view`
+		:rtype: set(str)
+		"""
+		with self._lock:
+			return set(self._pending[view])
+
+	def pull_types(
+	    self, ids: Iterable[str], views: Optional[Iterable['binaryview.BinaryView']] = None
+	) -> Dict['binaryview.BinaryView', Optional[Mapping[str, str]]]:
+		"""
+		``pull_types`` pulls archive types and their dependencies into several views, computing the dependency
+		closure once and issuing one pull per view
+
+		:param ids: archive type ids to pull
+		:param views: views to pull into, all views added to this object if None
+		:return: for each view, the mapping of archive type id to analysis type id, or None if the pull failed
+		"""
+		ids = self.closure(ids)
+		results = {}
+		for view in (self.views if views is None else views):
+			results[view] = view.pull_types_from_archive_by_id(self.archive.id, ids) if ids else {}
+			if results[view] is not None:
+				with self._lock:
+					if view in self._pending:
+						self._pending[view].difference_update(results[view])
+		return results
+
+	def pull(self) -> Dict['binaryview.BinaryView', Optional[Mapping[str, str]]]:
+		"""
+		``pull`` brings every view up to date by pulling the archive types that changed since its last
+		synchronization and that it has associated, in a single pull per view. Changes to types a view does not use
+		are dropped.
+
+		:return: for each view, the mapping of archive type id to analysis type id, or None if the pull failed
+		"""
+		results = {}
+		for view in self.views:
+			with self._lock:
+				pending = self._pending.get(view)
+				if pending is None:
+					continue
+				changed = set(pending)
+			used = set(view.get_associated_types_from_archive_by_id(self.archive.id).values())
+			ids = sorted(changed & used)
+			results[view] = view.pull_types_from_archive_by_id(self.archive.id, ids) if ids else {}
+			if results[view] is not None:
+				with self._lock:
+					if view in self._pending:
+						self._pending[view].difference_update(changed)
+		return results
+
+	def push_types(
+	    self, view: 'binaryview.BinaryView', type_ids: Iterable[str], batch_size: int = 1024
+	) -> Optional[Dict[str, str]]:
+		"""
+		``push_types`` pushes analysis types and their dependencies from ``view`` into the archive in batches of
+		``batch_size`` requested types. Types already pushed as a dependency of an earlier batch are not requested
+		again. The changes are recorded as pending for the other views, but not for ``view`` itself.
+
+		:param view: view to push from
+		:param type_ids: analysis type ids to push
+		:param int batch_size: number of requested types per push
+		:return: mapping of analysis type id to archive type id, or None if a push failed
+		"""
+		remaining = list(dict.fromkeys(type_ids))
+		results: Dict[str, str] = {}
+		push = (view, set())
+		with self._lock:
+			self._pushing.append(push)
+		try:
+			while remaining:
+				batch, remaining = remaining[:batch_size], remaining[batch_size:]
+				result = view.push_types_to_archive_by_id(self.archive.id, batch)
+				if result is None:
+					return None
+				results.update(result)
+				remaining = [id for id in remaining if id not in results]
+		finally:
+			with self._lock:
+				self._pushing = [entry for entry in self._pushing if entry is not push]
+				# Changes made by other threads during the push are still pending for the pushing view
+				changed = push[1] - set(results.values())
+				others = [seen for pushing, seen in self._pushing if pushing == view]
+				for seen in others:
+					seen.update(changed)
+				if not others and view in self._pending:
+					self._pending[view].update(changed)
+		return results
+
+
 class TypeArchiveNotificationCallbacks:
 	def __init__(self, archive: 'TypeArchive', notify: 'TypeArchiveNotification'):
 		self._archive = archive
@@ -19,7 +19,8 @@
 # IN THE SOFTWARE.
 
 import ctypes
-from typing import Optional, Mapping, Callable, List, Tuple
+import hashlib
+from typing import Optional, Mapping, Callable, List, Tuple, Union
 
 # Binary Ninja components
 import binaryninja
@@ -410,3 +411,211 @@ class TypeContainer:
 		return result, errors
 
 
+class TypeIndex:
+	"""
+	``TypeIndex`` is a structural hash index over the types of a :py:class:`TypeContainer`. Each type is reduced to a
+	canonical fingerprint once, cached by type id, so finding duplicate or matching types becomes a dictionary lookup
+	instead of pairwise comparisons through the core.
+
+	Two kinds of fingerprint are kept:
+
+	* *exact* fingerprints cover the full layout of a type including member, parameter and enumerator names. Types
+	  with the same exact fingerprint are structurally equal, regardless of their own names.
+	* *similar* fingerprints ignore member, parameter and enumerator names, so only the shape of the type (widths,
+	  offsets, signedness, member types) has to match.
+
+	Named type references are followed through the container, so two structures pointing to equal but differently
+	named structures still match. Recursive types are handled by replacing references to a type that is already
+	being fingerprinted with its depth on the stack of types being visited.
+
+	The index does not track changes to the container; call :py:func:`invalidate` after types are added, changed or
+	removed.
+
+	:param container: container to index, or any object with a ``type_container`` property such as a \
+	:py:class:`~binaryninja.binaryview.BinaryView`, :py:class:`~binaryninja.typelibrary.TypeLibrary` or \
+	:py:class:`~binaryninja.platform.Platform`
+
+	:Example:
+
+		>>> index = TypeIndex(bv)
+		>>> index.find_equal(lib.get_named_type("_GUID"))
+		['3f2d2a49-...']
+		>>> [[bv.get_type_name_by_id(i) for i in group] for group in index.duplicates()]
+		[[<QualifiedName: tagPOINT>, <QualifiedName: POINT>], ...]
+	"""
+	def __init__(self, container):
+		if not isinstance(container, TypeContainer):
+			container = container.type_container
+		self.container = container
+		self._fingerprints = ({}, {})
+		self._buckets: Optional[Tuple[Mapping[str, List[str]], Mapping[str, List[str]]]] = None
+
+	def __repr__(self):
+		return f"<TypeIndex: {self.container.name}>"
+
+	def __len__(self):
+		return len(self._fingerprints[0])
+
+	def invalidate(self, type_id: Optional[str] = None) -> None:
+		"""
+		``invalidate`` drops cached fingerprints. Fingerprints include the types they refer to, so a change to one type
+		can change the fingerprints of others; everything is dropped unless ``type_id`` was never fingerprinted.
+
+		:param type_id: id of the changed type, or None to drop everything
+		"""
+		if type_id is not None and all(type_id not in cache for cache in self._fingerprints):
+			return
+		self._fingerprints = ({}, {})
+		self._buckets = None
+
+	def _resolve(self, ref: '_types.NamedTypeReferenceType') -> Tuple[Optional[str], Optional['_types.Type']]:
+		type_id = ref.type_id
+		if type_id:
+			target = self.container.get_type_by_id(type_id)
+			if target is not None:
+				return type_id, target
+		type_id = self.container.get_type_id(ref.name)
+		if type_id is None:
+			return None, None
+		return type_id, self.container.get_type_by_id(type_id)
+
+	def _canonical(self, type: '_types.Type', similar: bool, stack: List[str]) -> Tuple[tuple, int]:
+		# Returns the canonical form and the lowest stack depth it refers back to, which tells whether the result
+		# depends on the types being visited and therefore must not be cached
+		low = len(stack)
+
+		def visit(child: Optional['_types.Type']):
+			nonlocal low
+			if child is None:
+				return None
+			form, child_low = self._canonical(child, similar, stack)
+			low = min(low, child_low)
+			return form
+
+		def name(value):
+			return None if similar else value
+
+		type_class = type.type_class
+		if isinstance(type, _types.NamedTypeReferenceType):
+			type_id, target = self._resolve(type)
+			if target is None:
+				return ("unresolved", type.named_type_class, str(type.name)), low
+			if type_id in stack:
+				depth = stack.index(type_id)
+				return ("recursive", len(stack) - depth), depth
+			digest, child_low = self._fingerprint_id(type_id, target, similar, stack)
+			return ("ref", digest), min(low, child_low)
+		elif isinstance(type, _types.StructureType):
+			members = tuple((m.offset, name(m.name), visit(m.type)) for m in type.members)
+			bases = tuple((b.offset, b.width, visit(b.type)) for b in type.base_structures)
+			form = (type_class, type.type, type.packed, type.width, type.alignment, members, bases)
+		elif isinstance(type, _types.EnumerationType):
+			members = tuple((name(m.name), m.value) for m in type.members)
+			form = (type_class, type.width, bool(type.signed), members)
+		elif isinstance(type, _types.PointerType):
+			form = (type_class, type.width, type.ref_type, bool(type.const), bool(type.volatile), visit(type.target))
+		elif isinstance(type, _types.ArrayType):
+			form = (type_class, type.count, visit(type.element_type))
+		elif isinstance(type, _types.FunctionType):
+			convention = type.calling_convention
+			params = tuple((name(p.name), visit(p.type)) for p in type.parameters)
+			form = (
+			    type_class, visit(type.return_value), params, bool(type.has_variable_arguments),
+			    bool(type.can_return), None if convention is None else convention.name
+			)
+		elif isinstance(type, _types.IntegerType):
+			form = (type_class, type.width, bool(type.signed))
+		else:
+			form = (type_class, type.width)
+		return form, low
+
+	def _fingerprint_id(self, type_id: str, type: '_types.Type', similar: bool, stack: List[str]) -> Tuple[str, int]:
+		cache = self._fingerprints[similar]
+		digest = cache.get(type_id)
+		if digest is not None:
+			return digest, len(stack)
+		stack.append(type_id)
+		try:
+			form, low = self._canonical(type, similar, stack)
+		finally:
+			stack.pop()
+		digest = hashlib.sha256(repr(form).encode("utf-8")).hexdigest()
+		if low >= len(stack):
+			cache[type_id] = digest
+		return digest, low
+
+	def fingerprint(self, type: Union[str, '_types.Type'], similar: bool = False) -> str:
+		"""
+		``fingerprint`` returns the structural fingerprint of a type
+
+		:param type: type id of a type in the container, or a type whose named references are resolved in the container
+		:param bool similar: ignore member, parameter and enumerator names
+		:return: hex digest of the canonical form of the type
+		"""
+		if isinstance(type, _types.NamedTypeReferenceType):
+			type_id, target = self._resolve(type)
+			if type_id is not None and target is not None:
+				type = type_id
+		if isinstance(type, str):
+			target = self.container.get_type_by_id(type)
+			if target is None:
+				raise KeyError(f"No type with id {type} in {self.container.name}")
+			return self._fingerprint_id(type, target, similar, [])[0]
+		form, _ = self._canonical(type, similar, [])
+		return hashlib.sha256(repr(form).encode("utf-8")).hexdigest()
+
+	def build(self, progress_func: Optional[ProgressFuncType] = None) -> None:
+		"""
+		``build`` fingerprints every type in the container. Lookups build the index on first use, so calling this is
+		only needed to control when the work happens or to report progress.
+
+		:param progress_func: optional function called with the number of types processed and the total, return False to stop
+		"""
+		all_types = self.container.types
+		if all_types is None:
+			all_types = {}
+		buckets = ({}, {})
+		for i, (type_id, (_, type)) in enumerate(all_types.items()):
+			for similar in (False, True):
+				digest = self._fingerprint_id(type_id, type, similar, [])[0]
+				buckets[similar].setdefault(digest, []).append(type_id)
+			if progress_func is not None and progress_func(i + 1, len(all_types)) is False:
+				return
+		self._buckets = buckets
+
+	def _lookup(self, type: Union[str, '_types.Type'], similar: bool) -> List[str]:
+		if self._buckets is None:
+			self.build()
+		assert self._buckets is not None
+		return list(self._buckets[similar].get(self.fingerprint(type, similar), []))
+
+	def find_equal(self, type: Union[str, '_types.Type']) -> List[str]:
+		"""
+		``find_equal`` returns the ids of the types in the container that are structurally equal to ``type``
+
+		:param type: type id or type to look up
+		:rtype: list(str)
+		"""
+		return self._lookup(type, False)
+
+	def find_similar(self, type: Union[str, '_types.Type']) -> List[str]:
+		"""
+		``find_similar`` returns the ids of the types in the container with the same shape as ``type``, ignoring
+		member, parameter and enumerator names
+
+		:param type: type id or type to look up
+		:rtype: list(str)
+		"""
+		return self._lookup(type, True)
+
+	def duplicates(self, similar: bool = False) -> List[List[str]]:
+		"""
+		``duplicates`` returns groups of ids of types that are structurally equal (or similar) to each other
+
+		:param bool similar: group by similar instead of exact fingerprints
+		:rtype: list(list(str))
+		"""
+		if self._buckets is None:
+			self.build()
+		assert self._buckets is not None
+		return [list(ids) for ids in self._buckets[similar].values() if len(ids) > 1]
@@ -18,8 +18,12 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import bisect
+import collections
+import collections.abc
 import ctypes
-from typing import Optional, List, Dict, Union
+import threading
+from typing import Optional, List, Dict, Union, Iterator
 import uuid
 
 # Binary Ninja components
@@ -32,6 +36,132 @@ from . import architecture
 from . import typecontainer
 
 
+class TypeLibraryMapping(collections.abc.Mapping):  # type: ignore
+	"""
+	``TypeLibraryMapping`` is a lazy, read-only mapping of the named types or named objects of a
+	:py:class:`TypeLibrary`. Only the names are read when the mapping is created; :py:class:`~binaryninja.types.Type`
+	objects are created on lookup and the most recently used ``cache_size`` of them are kept. Prefix and namespace
+	queries work on the name index alone. Use :py:func:`TypeLibrary.lazy_named_types` or
+	:py:func:`TypeLibrary.lazy_named_objects` rather than constructing this class directly.
+
+	The name index is a snapshot; create a new mapping after adding types to the library.
+
+	.. note:: For named objects the mapping is only lazy on the Python side. The core has no names-only listing of \
+	library objects, so creating the name index makes the core build every object's type once, although no Python \
+	:py:class:`~binaryninja.types.Type` objects are created for them. Named types are read by name alone.
+
+	:Example:
+
+		>>> protos = lib.lazy_named_objects()
+		>>> protos["CreateFileW"]
+		<type: immutable:FunctionTypeClass 'HANDLE(LPCWSTR lpFileName, ...)'>
+		>>> protos.names_with_prefix("CreateFile")
+		['CreateFileA', 'CreateFileW', ...]
+	"""
+	def __init__(self, library: 'TypeLibrary', objects: bool = False, cache_size: int = 1024):
+		self._library = library
+		self._objects = objects
+		self._cache_size = cache_size
+		self._cache: 'collections.OrderedDict[types.QualifiedName, types.Type]' = collections.OrderedDict()
+		self._lock = threading.Lock()
+		self.hits = 0
+		self.misses = 0
+		if objects:
+			names = self._object_names()
+		else:
+			names = library.type_container.type_names or []
+		self._by_string: Dict[str, types.QualifiedName] = {str(name): name for name in names}
+		self._sorted_names = sorted(self._by_string)
+
+	def _object_names(self) -> List['types.QualifiedName']:
+		# The core only lists objects together with their types, so this builds every object type once; only the
+		# names are kept and no Python Type objects are created
+		count = ctypes.c_ulonglong(0)
+		named_objects = core.BNGetTypeLibraryNamedObjects(self._library.handle, count)
+		assert named_objects is not None, "core.BNGetTypeLibraryNamedObjects returned None"
+		try:
+			return [types.QualifiedName._from_core_struct(named_objects[i].name) for i in range(count.value)]
+		finally:
+			core.BNFreeQualifiedNameAndTypeArray(named_objects, count.value)
+
+	def __repr__(self):
+		kind = "objects" if self._objects else "types"
+		return f"<TypeLibraryMapping {self._library.name}: {len(self)} {kind}, {len(self._cache)} resolved>"
+
+	def __len__(self) -> int:
+		return len(self._sorted_names)
+
+	def __iter__(self) -> Iterator['types.QualifiedName']:
+		for name in self._sorted_names:
+			yield self._by_string[name]
+
+	def __contains__(self, name) -> bool:
+		return str(types.QualifiedName(name)) in self._by_string
+
+	def __getitem__(self, name: 'types.QualifiedNameType') -> 'types.Type':
+		name = types.QualifiedName(name)
+		with self._lock:
+			result = self._cache.get(name)
+			if result is not None:
+				self._cache.move_to_end(name)
+				self.hits += 1
+				return result
+		if str(name) not in self._by_string:
+			raise KeyError(f"'{name}': not found in type library {self._library.name}")
+		if self._objects:
+			result = self._library.get_named_object(name)
+		else:
+			result = self._library.get_named_type(name)
+		if result is None:
+			raise KeyError(f"'{name}': not found in type library {self._library.name}")
+		with self._lock:
+			self.misses += 1
+			self._cache[name] = result
+			while len(self._cache) > self._cache_size:
+				self._cache.popitem(last=False)
+		return result
+
+	def names_with_prefix(self, prefix: str) -> List['types.QualifiedName']:
+		"""
+		``names_with_prefix`` returns the names whose string form starts with ``prefix``, in sorted order, without
+		resolving any types.
+
+		:param str prefix: prefix of the full name, for example ``"std::vec"``
+		:rtype: list(QualifiedName)
+		"""
+		start = bisect.bisect_left(self._sorted_names, prefix)
+		result = []
+		for name in self._sorted_names[start:]:
+			if not name.startswith(prefix):
+				break
+			result.append(self._by_string[name])
+		return result
+
+	def names_in_namespace(self, namespace: 'types.QualifiedNameType', recursive: bool = False) -> List['types.QualifiedName']:
+		"""
+		``names_in_namespace`` returns the names declared directly in ``namespace`` (or anywhere below it with
+		``recursive``), without resolving any types.
+
+		:param namespace: namespace, for example ``"std"`` or ``["std", "chrono"]``
+		:param bool recursive: include names in nested namespaces
+		:rtype: list(QualifiedName)
+		"""
+		components = list(types.QualifiedName(namespace).name)
+		depth = len(components)
+		result = []
+		for name in self.names_with_prefix(str(types.QualifiedName(components + [""]))):
+			if list(name.name[:depth]) != components:
+				continue
+			if recursive or len(name) == depth + 1:
+				result.append(name)
+		return result
+
+	def clear_cache(self) -> None:
+		"""``clear_cache`` drops all resolved types"""
+		with self._lock:
+			self._cache.clear()
+
+
 class TypeLibrary:
 	def __init__(self, handle: core.BNTypeLibraryHandle):
 		binaryninja._init_plugins()
@@ -393,6 +523,29 @@ class TypeLibrary:
 			return None
 		return types.Type.create(t)
 
+	def lazy_named_objects(self, cache_size: int = 1024) -> TypeLibraryMapping:
+		"""
+		``lazy_named_objects`` returns a mapping of the named objects of the library which creates
+		:py:class:`~binaryninja.types.Type` objects on lookup. Listing the names still makes the core build every
+		object type once, as there is no names-only listing of objects, but no Python objects are created for them.
+		Prefer it over :py:attr:`named_objects` when only a few objects of a large library are needed.
+
+		:param int cache_size: number of resolved types to keep
+		:rtype: TypeLibraryMapping
+		"""
+		return TypeLibraryMapping(self, True, cache_size)
+
+	def lazy_named_types(self, cache_size: int = 1024) -> TypeLibraryMapping:
+		"""
+		``lazy_named_types`` returns a lazy mapping of the named types of the library, which only reads the names up
+		front and creates :py:class:`~binaryninja.types.Type` objects on lookup. Prefer it over :py:attr:`named_types`
+		when only a few types of a large library are needed.
+
+		:param int cache_size: number of resolved types to keep
+		:rtype: TypeLibraryMapping
+		"""
+		return TypeLibraryMapping(self, False, cache_size)
+
 	@property
 	def named_objects(self) -> Dict[types.QualifiedName, types.Type]:
 		"""
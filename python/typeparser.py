@@ -21,8 +21,14 @@
 import abc
 import ctypes
 import dataclasses
+import hashlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from json import dumps
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Callable, Iterable, Union
 
 import sys
 import traceback
@@ -643,6 +649,225 @@ class CoreTypeParser(TypeParser):
 
 		return result, errors
 
+@dataclasses.dataclass
+class HeaderImportResult:
+	"""
+	``HeaderImportResult`` holds the de-duplicated output of :py:func:`HeaderImporter.parse`
+	"""
+	types: Dict['types.QualifiedName', 'types.Type'] = dataclasses.field(default_factory=dict)
+	variables: Dict['types.QualifiedName', 'types.Type'] = dataclasses.field(default_factory=dict)
+	functions: Dict['types.QualifiedName', 'types.Type'] = dataclasses.field(default_factory=dict)
+	duplicates: int = 0
+	"""Number of definitions dropped because an identical definition with the same name was already seen"""
+	conflicts: Dict['types.QualifiedName', List['types.Type']] = dataclasses.field(default_factory=dict)
+	"""Names defined differently by different translation units, mapped to the definitions that were not kept"""
+	errors: Dict[str, List[TypeParserError]] = dataclasses.field(default_factory=dict)
+	"""Errors and warnings of each translation unit that reported any, keyed by file name"""
+
+	def __repr__(self):
+		return f"<HeaderImportResult: {len(self.types)} types, {len(self.variables)} variables, {len(self.functions)} functions, {self.duplicates} duplicates, {len(self.conflicts)} conflicts>"
+
+
+class HeaderImporter:
+	"""
+	``HeaderImporter`` imports the types of many C translation units (for example one per SDK header) at once:
+
+		1. every unit is preprocessed with :py:func:`TypeParser.preprocess_source` on ``threads`` threads. The output
+		   is cached, keyed by the hash of the source, file name, platform, options and include directories, and is
+		   reused as long as none of the headers it included (taken from its ``#line`` markers) changed on disk. With
+		   ``cache_dir`` the cache is also kept on disk between runs.
+		2. the preprocessed units are parsed concurrently with :py:func:`TypeParser.parse_types_from_source`.
+		3. types, variables and functions are merged by name, dropping definitions identical to one already seen, so
+		   declarations shared by many units are only defined once.
+		4. :py:func:`define` adds the merged types to a view in batches with :py:func:`BinaryView.define_types`, or to a
+		   type library.
+
+	:Example:
+
+		>>> importer = HeaderImporter(Platform["windows-x86_64"], include_dirs=[sdk_include], threads=16)
+		>>> result = importer.parse([(h, f'#include "{h}"\\n') for h in headers])
+		>>> result
+		<HeaderImportResult: 48211 types, 312 variables, 21004 functions, 1290345 duplicates, 3 conflicts>
+		>>> importer.define(bv, result, progress_func=lambda done, total: print(done, total) or True)
+	"""
+
+	_line_marker = re.compile(r'^#\s*(?:line\s+)?\d+\s+"((?:[^"\\\\]|\\\\.)*)"', re.MULTILINE)
+
+	def __init__(
+	    self, platform: 'platform.Platform', parser: Optional[TypeParser] = None,
+	    existing_types: Optional['types.TypeContainerType'] = None, options: Optional[List[str]] = None,
+	    include_dirs: Optional[List[str]] = None, threads: Optional[int] = None, cache_dir: Optional[str] = None
+	):
+		self.platform = platform
+		self.parser = parser if parser is not None else TypeParser.default
+		self.existing_types = existing_types
+		self.options = list(options) if options is not None else []
+		self.include_dirs = list(include_dirs) if include_dirs is not None else []
+		self.threads = threads if threads is not None else (os.cpu_count() or 1)
+		self.cache_dir = cache_dir
+		if cache_dir is not None:
+			os.makedirs(cache_dir, exist_ok=True)
+		self._cache: Dict[str, Tuple[str, Dict[str, Tuple[int, int]]]] = {}
+		self._lock = threading.Lock()
+
+	def _key(self, source: str, file_name: str) -> str:
+		settings = dumps([self.platform.name, self.parser.name, self.options, self.include_dirs, file_name])
+		return hashlib.sha256(f"{settings}\n{source}".encode("utf-8")).hexdigest()
+
+	@staticmethod
+	def _signature(path: str) -> Optional[Tuple[int, int]]:
+		try:
+			stat = os.stat(path)
+		except OSError:
+			return None
+		return stat.st_mtime_ns, stat.st_size
+
+	def _cached(self, key: str) -> Optional[str]:
+		with self._lock:
+			entry = self._cache.get(key)
+		if entry is None and self.cache_dir is not None:
+			try:
+				with open(os.path.join(self.cache_dir, key + ".json"), "r", encoding="utf-8") as f:
+					data = json.load(f)
+				entry = (data["output"], {path: tuple(sig) for path, sig in data["files"].items()})
+			except (OSError, ValueError, KeyError):
+				entry = None
+		if entry is None:
+			return None
+		output, files = entry
+		if any(self._signature(path) != signature for path, signature in files.items()):
+			return None
+		with self._lock:
+			self._cache[key] = entry
+		return output
+
+	def _store(self, key: str, output: str) -> None:
+		files = {}
+		for path in set(self._line_marker.findall(output)):
+			path = path.replace("\\\\", "\\")
+			signature = self._signature(path)
+			if signature is not None:
+				files[path] = signature
+		with self._lock:
+			self._cache[key] = (output, files)
+		if self.cache_dir is not None:
+			with open(os.path.join(self.cache_dir, key + ".json"), "w", encoding="utf-8") as f:
+				json.dump({"output": output, "files": files}, f)
+
+	def preprocess(self, source: str, file_name: str) -> Tuple[Optional[str], List[TypeParserError]]:
+		"""
+		``preprocess`` preprocesses one translation unit, using the cache when possible
+
+		:param source: source of the unit
+		:param file_name: name of the unit, used for relative includes and error messages
+		:return: A tuple of (preprocessed source, errors), where the preprocessed source is None if there was a fatal error
+		"""
+		key = self._key(source, file_name)
+		output = self._cached(key)
+		if output is not None:
+			return output, []
+		output, errors = self.parser.preprocess_source(
+		    source, file_name, self.platform, self.existing_types, self.options, self.include_dirs
+		)
+		if output is not None:
+			self._store(key, output)
+		return output, errors
+
+	def _parse_unit(self, unit: Tuple[str, str]) -> Tuple[str, Optional[TypeParserResult], List[TypeParserError]]:
+		file_name, source = unit
+		preprocessed, errors = self.preprocess(source, file_name)
+		if preprocessed is None:
+			return file_name, None, errors
+		result, parse_errors = self.parser.parse_types_from_source(
+		    preprocessed, file_name, self.platform, self.existing_types, self.options, self.include_dirs
+		)
+		return file_name, result, errors + parse_errors
+
+	@staticmethod
+	def _merge(target: Dict['types.QualifiedName', 'types.Type'], parsed: List[ParsedType], result: HeaderImportResult) -> None:
+		for entry in parsed:
+			name = types.QualifiedName(entry.name)
+			existing = target.get(name)
+			if existing is None:
+				target[name] = entry.type
+			elif existing == entry.type:
+				result.duplicates += 1
+			else:
+				conflicts = result.conflicts.setdefault(name, [])
+				if all(conflict != entry.type for conflict in conflicts):
+					conflicts.append(entry.type)
+				else:
+					result.duplicates += 1
+
+	def parse(
+	    self, units: Iterable[Tuple[str, str]], progress_func: Optional[Callable[[int, int], bool]] = None
+	) -> HeaderImportResult:
+		"""
+		``parse`` preprocesses and parses all ``units`` concurrently and merges their results. Units are
+		``(file name, source)`` pairs; to import a header file use its path as the file name and an ``#include`` of it
+		as the source. When a name is defined differently by several units the first definition, in ``units`` order,
+		is kept.
+
+		:param units: translation units to parse
+		:param progress_func: optional function called with the number of units parsed and the total, return False to stop early
+		:rtype: HeaderImportResult
+		"""
+		units = list(units)
+		result = HeaderImportResult()
+		with ThreadPoolExecutor(self.threads) as pool:
+			for i, (file_name, parsed, errors) in enumerate(pool.map(self._parse_unit, units)):
+				if errors:
+					result.errors[file_name] = errors
+				if parsed is not None:
+					self._merge(result.types, parsed.types, result)
+					self._merge(result.variables, parsed.variables, result)
+					self._merge(result.functions, parsed.functions, result)
+				if progress_func is not None and progress_func(i + 1, len(units)) is False:
+					break
+		return result
+
+	def define(
+	    self, target: Union['binaryview.BinaryView', 'typelibrary.TypeLibrary'], result: HeaderImportResult,
+	    batch_size: int = 4096, auto_type_source: str = "HeaderImporter",
+	    progress_func: Optional[Callable[[int, int], bool]] = None
+	) -> None:
+		"""
+		``define`` adds the types of ``result`` to ``target``. For a :py:class:`~binaryninja.binaryview.BinaryView` the
+		types are passed to :py:func:`BinaryView.define_types` in batches of ``batch_size``; for a
+		:py:class:`~binaryninja.typelibrary.TypeLibrary` the types are added as named types and the variables and
+		functions as named objects.
+
+		:param target: view or type library to add the types to
+		:param result: merged parse result
+		:param int batch_size: number of types per call to :py:func:`BinaryView.define_types`
+		:param str auto_type_source: source used to generate the ids of the types defined in a view
+		:param progress_func: optional function called with the number of types defined and the total, return False to stop early
+		"""
+		total = len(result.types)
+		if isinstance(target, binaryview.BinaryView):
+			items = list(result.types.items())
+			for start in range(0, total, batch_size):
+				batch = [
+				    (types.Type.generate_auto_type_id(auto_type_source, name), name, type)
+				    for name, type in items[start:start + batch_size]
+				]
+				target.define_types(batch, None)
+				if progress_func is not None and progress_func(min(start + batch_size, total), total) is False:
+					return
+			return
+
+		done = 0
+		for name, type in result.types.items():
+			target.add_named_type(name, type)
+			done += 1
+			if progress_func is not None and done % batch_size == 0 and progress_func(done, total) is False:
+				return
+		for name, type in list(result.variables.items()) + list(result.functions.items()):
+			target.add_named_object(name, type)
+		if progress_func is not None:
+			progress_func(total, total)
+
+
 @deprecation.deprecated(deprecated_in="3.4.4271", details="Use TypeParser.preprocess_source instead.")
 def preprocess_source(source: str, filename: str = None,
 					  include_dirs: Optional[List[str]] = None) -> Tuple[Optional[str], str]:
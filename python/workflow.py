@@ -22,8 +22,13 @@ import argparse
 import cmd
 import ctypes
 import json
+import queue
+import threading
+import time
 import traceback
-from typing import List, Union, Callable, Optional, Any
+import tracemalloc
+import weakref
+from typing import List, Union, Callable, Optional, Any, Dict, Tuple
 
 # Binary Ninja components
 import binaryninja
@@ -147,7 +152,11 @@ class Activity(object):
 	def _action(self, ac: Any):
 		try:
 			if self.action is not None:
-				self.action(AnalysisContext(ac))
+				profiler = ActivityProfiler._active
+				if profiler is None:
+					self.action(AnalysisContext(ac))
+				else:
+					profiler._record(self, AnalysisContext(ac))
 		except:
 			log_error(traceback.format_exc())
 
@@ -180,6 +189,375 @@ class Activity(object):
 		return core.BNActivityGetName(self.handle)
 
 
+class BatchedActivity(Activity):
+	"""
+	:class:`BatchedActivity` is an :class:`Activity` whose expensive work runs outside of the analysis callback. When
+	the core runs the activity for a function, ``extract`` is called with the :class:`AnalysisContext` and must quickly
+	copy out the (picklable, if ``processes`` is used) data needed later, since the context is only valid during the
+	callback. The extracted items are queued and a Python worker thread drains the queue in batches of up to
+	``batch_size`` items, waiting at most ``max_delay`` seconds to fill a batch, and passes each batch to ``process``.
+	``process`` returns a list with one result per item (or None), and ``complete`` is then called with each item and
+	its result on the worker thread.
+
+	Because analysis threads only pay for ``extract``, Python work no longer serializes every analysis thread on the
+	GIL. This suits activities that collect information or annotate results after the fact; activities that must
+	modify IL in place still need a regular :class:`Activity`. With ``processes`` greater than zero, ``process`` runs in
+	a pool of that many subprocesses, in which case ``process`` must be a module-level function and must not use the
+	Binary Ninja API.
+
+	Queue depth and latency are reported by :py:func:`metrics` and included in :py:func:`WorkflowMachine.metrics`.
+
+	The worker thread and process pool are stopped by :py:func:`close` or when leaving a ``with`` block, and at the
+	latest at interpreter exit.
+
+	:Example:
+
+		>>> def extract(ac):
+		... 	return (ac.function.start, [i.operation.name for i in ac.mlil.instructions])
+		>>> def process(batch):
+		... 	return [collections.Counter(ops).most_common(1) for _, ops in batch]
+		>>> activity = BatchedActivity('{"name": "extension.opstats", "title": "Op Stats"}', extract, process, batch_size=256)
+		>>> workflow.register_activity(activity)
+	"""
+
+	_instances: 'weakref.WeakSet[BatchedActivity]' = weakref.WeakSet()
+
+	def __init__(
+	    self, configuration: str, extract: Callable[[AnalysisContext], Any], process: Callable[[List[Any]], Optional[List[Any]]],
+	    complete: Optional[Callable[[Any, Any], None]] = None, batch_size: int = 64, max_delay: float = 0.05,
+	    processes: int = 0
+	):
+		if batch_size <= 0:
+			raise ValueError("batch_size must be positive")
+		super(BatchedActivity, self).__init__(configuration, action=self._enqueue)
+		self.extract = extract
+		self.process = process
+		self.complete = complete
+		self.batch_size = batch_size
+		self.max_delay = max_delay
+		self._name: Optional[str] = None
+		self._queue: 'queue.Queue[Optional[Tuple[float, Any]]]' = queue.Queue()
+		self._lock = threading.Lock()
+		self._stats: Dict[str, Union[int, float]] = {
+		    "items": 0, "batches": 0, "errors": 0, "maxQueueDepth": 0, "extractSeconds": 0.0, "processSeconds": 0.0,
+		    "totalLatency": 0.0, "maxLatency": 0.0
+		}
+		self._executor = None
+		if processes > 0:
+			import concurrent.futures
+			import multiprocessing
+			self._executor = concurrent.futures.ProcessPoolExecutor(processes, mp_context=multiprocessing.get_context("spawn"))
+		# The worker only holds a weak reference, so it does not keep the activity alive
+		self._worker: Optional[threading.Thread] = threading.Thread(
+		    target=BatchedActivity._drain, args=(weakref.ref(self), self._queue), daemon=True
+		)
+		self._worker.start()
+		self._finalizer = weakref.finalize(self, BatchedActivity._shutdown, self._queue, self._worker, self._executor)
+		BatchedActivity._instances.add(self)
+
+	def __enter__(self) -> 'BatchedActivity':
+		return self
+
+	def __exit__(self, type, value, traceback) -> None:
+		self.close()
+
+	@property
+	def name(self) -> str:
+		"""Activity name (read-only)"""
+		if self._name is None:
+			self._name = core.BNActivityGetName(self.handle)
+		return self._name
+
+	def _enqueue(self, ac: AnalysisContext) -> None:
+		start = time.perf_counter()
+		item = self.extract(ac)
+		now = time.perf_counter()
+		self._queue.put((now, item))
+		depth = self._queue.qsize()
+		with self._lock:
+			self._stats["extractSeconds"] += now - start
+			if depth > self._stats["maxQueueDepth"]:
+				self._stats["maxQueueDepth"] = depth
+
+	@staticmethod
+	def _drain(ref: 'weakref.ref[BatchedActivity]', pending: 'queue.Queue[Optional[Tuple[float, Any]]]') -> None:
+		stopping = False
+		while not stopping:
+			entry = pending.get()
+			activity = ref()
+			if entry is None or activity is None:
+				pending.task_done()
+				break
+			batch = [entry]
+			deadline = time.perf_counter() + activity.max_delay
+			while len(batch) < activity.batch_size:
+				timeout = deadline - time.perf_counter()
+				try:
+					entry = pending.get(timeout=timeout) if timeout > 0 else pending.get_nowait()
+				except queue.Empty:
+					break
+				if entry is None:
+					pending.task_done()
+					stopping = True
+					break
+				batch.append(entry)
+			try:
+				activity._run_batch(batch)
+			finally:
+				for _ in batch:
+					pending.task_done()
+				# Drop the strong reference while waiting for the next item
+				activity = None
+
+	@staticmethod
+	def _shutdown(pending: 'queue.Queue[Optional[Tuple[float, Any]]]', worker: threading.Thread, executor: Any) -> None:
+		pending.put(None)
+		# The last reference may be dropped on the worker itself, which then exits on its own
+		if worker is not threading.current_thread():
+			worker.join()
+		if executor is not None:
+			executor.shutdown()
+
+	def _run_batch(self, batch: List[Tuple[float, Any]]) -> None:
+		items = [item for _, item in batch]
+		start = time.perf_counter()
+		errors = 0
+		try:
+			if self._executor is not None:
+				results = self._executor.submit(self.process, items).result()
+			else:
+				results = self.process(items)
+			if results is None:
+				results = [None] * len(items)
+			elif len(results) != len(items):
+				raise ValueError(f"process returned {len(results)} results for a batch of {len(items)} items")
+		except:
+			log_error(traceback.format_exc())
+			errors += 1
+			results = None
+		process_seconds = time.perf_counter() - start
+		if results is not None and self.complete is not None:
+			for item, result in zip(items, results):
+				try:
+					self.complete(item, result)
+				except:
+					log_error(traceback.format_exc())
+					errors += 1
+		now = time.perf_counter()
+		with self._lock:
+			self._stats["items"] += len(batch)
+			self._stats["batches"] += 1
+			self._stats["errors"] += errors
+			self._stats["processSeconds"] += process_seconds
+			for queued, _ in batch:
+				latency = now - queued
+				self._stats["totalLatency"] += latency
+				if latency > self._stats["maxLatency"]:
+					self._stats["maxLatency"] = latency
+
+	def flush(self) -> None:
+		"""``flush`` blocks until every queued item has been processed"""
+		self._queue.join()
+
+	def close(self) -> None:
+		"""``close`` processes the remaining queued items and stops the worker thread and process pool"""
+		self._finalizer()
+		self._worker = None
+		self._executor = None
+
+	def metrics(self) -> Dict[str, Union[int, float]]:
+		"""
+		``metrics`` returns the queue and latency statistics of this activity: the current and maximum queue depth, the
+		number of items, batches and errors, the total seconds spent in ``extract`` and ``process``, and the mean and
+		maximum seconds from an item being queued until its batch completed.
+
+		:rtype: dict
+		"""
+		with self._lock:
+			result = dict(self._stats)
+		total_latency = result.pop("totalLatency")
+		result["queueDepth"] = self._queue.qsize()
+		result["meanLatency"] = total_latency / result["items"] if result["items"] else 0.0
+		result["meanBatchSize"] = result["items"] / result["batches"] if result["batches"] else 0.0
+		return result
+
+	@classmethod
+	def all_metrics(cls) -> Dict[str, Dict[str, Union[int, float]]]:
+		"""``all_metrics`` returns :py:func:`metrics` for every live :class:`BatchedActivity`, keyed by activity name"""
+		return {activity.name: activity.metrics() for activity in list(cls._instances)}
+
+
+class ActivityProfiler:
+	"""
+	:class:`ActivityProfiler` records the wall time, call count, Python allocations and exceptions of every Python
+	:class:`Activity` while it is active, both per activity and per activity and function. Only one profiler can be
+	active at a time; it is also available through :py:func:`WorkflowMachine.profile`.
+
+	When ``trace_allocations`` is set, :py:mod:`tracemalloc` is started (if it is not already tracing) and the change
+	in traced memory across each activity call is recorded. ``tracemalloc`` counts allocations of all threads, so
+	allocation numbers are only exact when analysis runs on a single thread (``analysis.limits.workerThreadCount``).
+	When ``record_events`` is set, each call is also kept as an event for :py:func:`to_chrome_trace`.
+
+	:Example:
+
+		>>> with ActivityProfiler(trace_allocations=True) as profiler:
+		... 	bv.reanalyze()
+		... 	bv.update_analysis_and_wait()
+		>>> sorted(profiler.results()["activities"].items(), key=lambda i: i[1]["seconds"])[-1]
+		>>> profiler.to_chrome_trace("/tmp/activities.json")
+	"""
+
+	_active: Optional['ActivityProfiler'] = None
+	_start_lock = threading.Lock()
+
+	def __init__(self, trace_allocations: bool = False, record_events: bool = True):
+		self.trace_allocations = trace_allocations
+		self.record_events = record_events
+		self._lock = threading.Lock()
+		self._started_tracemalloc = False
+		self._origin = time.perf_counter_ns()
+		self.reset()
+
+	def __enter__(self) -> 'ActivityProfiler':
+		self.start()
+		return self
+
+	def __exit__(self, type, value, traceback) -> None:
+		self.stop()
+
+	@property
+	def active(self) -> bool:
+		"""Whether this profiler is currently recording (read-only)"""
+		return ActivityProfiler._active is self
+
+	def start(self) -> None:
+		"""``start`` makes this the active profiler, replacing any other active profiler"""
+		with ActivityProfiler._start_lock:
+			if self.trace_allocations and not tracemalloc.is_tracing():
+				tracemalloc.start()
+				self._started_tracemalloc = True
+			ActivityProfiler._active = self
+
+	def stop(self) -> None:
+		"""``stop`` stops recording; collected results are kept until :py:func:`reset`"""
+		with ActivityProfiler._start_lock:
+			if ActivityProfiler._active is self:
+				ActivityProfiler._active = None
+			if self._started_tracemalloc:
+				tracemalloc.stop()
+				self._started_tracemalloc = False
+
+	def reset(self) -> None:
+		"""``reset`` discards all collected results"""
+		with self._lock:
+			self._activities: Dict[str, Dict[str, Union[int, float]]] = {}
+			self._functions: Dict[str, Dict[int, Dict[str, Union[int, float]]]] = {}
+			self._events: List[Tuple[str, int, int, int, int]] = []
+
+	@staticmethod
+	def _new_stats() -> Dict[str, Union[int, float]]:
+		return {"calls": 0, "seconds": 0.0, "maxSeconds": 0.0, "allocatedBytes": 0, "peakBytes": 0, "exceptions": 0}
+
+	@staticmethod
+	def _update(stats: Dict[str, Union[int, float]], seconds: float, allocated: int, peak: int, failed: bool) -> None:
+		stats["calls"] += 1
+		stats["seconds"] += seconds
+		if seconds > stats["maxSeconds"]:
+			stats["maxSeconds"] = seconds
+		stats["allocatedBytes"] += allocated
+		if peak > stats["peakBytes"]:
+			stats["peakBytes"] = peak
+		if failed:
+			stats["exceptions"] += 1
+
+	def _record(self, activity: Activity, context: AnalysisContext) -> None:
+		name = activity.name
+		func = context.function
+		address = func.start if func is not None else -1
+		tracing = self.trace_allocations and tracemalloc.is_tracing()
+		if tracing:
+			before, _ = tracemalloc.get_traced_memory()
+			if hasattr(tracemalloc, "reset_peak"):
+				tracemalloc.reset_peak()
+		failed = True
+		start = time.perf_counter_ns()
+		try:
+			activity.action(context)
+			failed = False
+		finally:
+			end = time.perf_counter_ns()
+			allocated = peak = 0
+			if tracing:
+				after, peak_memory = tracemalloc.get_traced_memory()
+				allocated = after - before
+				peak = peak_memory - before
+			seconds = (end - start) / 1e9
+			with self._lock:
+				self._update(self._activities.setdefault(name, self._new_stats()), seconds, allocated, peak, failed)
+				functions = self._functions.setdefault(name, {})
+				self._update(functions.setdefault(address, self._new_stats()), seconds, allocated, peak, failed)
+				if self.record_events:
+					self._events.append((name, address, threading.get_ident(), start, end))
+
+	def results(self) -> Dict[str, Any]:
+		"""
+		``results`` returns the collected statistics as a dict with two keys: ``activities`` maps each activity name to
+		its statistics, and ``functions`` maps each activity name to a dict of function start address (-1 for activities
+		not run on a function) to statistics. Statistics are ``calls``, ``seconds``, ``maxSeconds``, ``allocatedBytes``,
+		``peakBytes`` and ``exceptions``.
+
+		:rtype: dict
+		"""
+		with self._lock:
+			return {
+			    "activities": {name: dict(stats) for name, stats in self._activities.items()},
+			    "functions": {
+			        name: {address: dict(stats) for address, stats in functions.items()}
+			        for name, functions in self._functions.items()
+			    }
+			}
+
+	def to_json(self, path: Optional[str] = None) -> str:
+		"""
+		``to_json`` serializes :py:func:`results` as JSON, with function addresses written as hex strings
+
+		:param str path: optional file to also write the JSON to
+		:rtype: str
+		"""
+		results = self.results()
+		results["functions"] = {
+		    name: {hex(address) if address >= 0 else "": stats for address, stats in functions.items()}
+		    for name, functions in results["functions"].items()
+		}
+		data = json.dumps(results, indent=1)
+		if path is not None:
+			with open(path, "w") as f:
+				f.write(data)
+		return data
+
+	def to_chrome_trace(self, path: Optional[str] = None) -> str:
+		"""
+		``to_chrome_trace`` serializes the recorded events in the Chrome trace event format, which can be loaded in
+		``chrome://tracing`` or Perfetto. Each analysis thread becomes a track.
+
+		:param str path: optional file to also write the trace to
+		:rtype: str
+		"""
+		with self._lock:
+			events = list(self._events)
+		trace = []
+		for name, address, tid, start, end in events:
+			trace.append({
+			    "name": name, "cat": "activity", "ph": "X", "pid": 0, "tid": tid, "ts": (start - self._origin) / 1000,
+			    "dur": (end - start) / 1000, "args": {"function": hex(address) if address >= 0 else None}
+			})
+		data = json.dumps({"traceEvents": trace, "displayTimeUnit": "ms"})
+		if path is not None:
+			with open(path, "w") as f:
+				f.write(data)
+		return data
+
+
 class _WorkflowMetaclass(type):
 	@property
 	def list(self) -> List['Workflow']:
@@ -540,7 +918,36 @@ class WorkflowMachine:
 
 	def metrics(self, enable: bool = True, is_global: bool = False):
 		request = json.dumps({"command": "metrics", "enable": enable, "global": is_global})
-		return json.loads(core.BNPostWorkflowRequestForFunction(self.handle, request))
+		result = json.loads(core.BNPostWorkflowRequestForFunction(self.handle, request))
+		if isinstance(result, dict):
+			python_metrics = BatchedActivity.all_metrics()
+			if python_metrics:
+				result["pythonActivities"] = python_metrics
+			profiler = ActivityProfiler._active
+			if profiler is not None:
+				result["pythonProfile"] = profiler.results()
+		return result
+
+	def profile(self, enable: bool = True, trace_allocations: bool = False) -> Optional[ActivityProfiler]:
+		"""
+		``profile`` starts or stops the :class:`ActivityProfiler` for Python activities. Profiling is global, it is not
+		limited to the function of this machine.
+
+		:param bool enable: start a new profiler if True, stop the active one if False
+		:param bool trace_allocations: also record Python allocations with ``tracemalloc``
+		:return: the started or stopped profiler, or None if stopping while no profiler was active
+		:rtype: ActivityProfiler
+		"""
+		profiler = ActivityProfiler._active
+		if not enable:
+			if profiler is not None:
+				profiler.stop()
+			return profiler
+		if profiler is not None:
+			profiler.stop()
+		profiler = ActivityProfiler(trace_allocations=trace_allocations)
+		profiler.start()
+		return profiler
 
 	def dump(self):
 		request = json.dumps({"command": "dump"})
@@ -1,5 +1,10 @@
 import unittest
 import os
+import sys
+import json
+import io
+import tempfile
+import time
 
 import binaryninja as bn
 from binaryninja.binaryview import BinaryView, BinaryViewType
@@ -26,6 +31,15 @@ from binaryninja.binaryview import *
 from binaryninja.lowlevelil import *
 from binaryninja.mediumlevelil import *
 from binaryninja.highlevelil import *
+from binaryninja.commonil import ILTraverseAction
+from binaryninja.flowsummary import FlowSummaryCache
+from binaryninja.flowgraph import export_function_graphs
+from binaryninja.lineardisassembly import LinearDisassemblyExporter
+from binaryninja.analysiscache import AnalysisCache
+from binaryninja.batch import analyze_files
+from binaryninja.debuginfo import (
+    DebugInfoParser, DebugFunctionInfo, parse_debug_info_parallel, merge_debug_info, apply_debug_info_parallel
+)
 from binaryninja.variable import *
 from binaryninja.typecontainer import *
 from binaryninja.typeparser import *
@@ -919,6 +933,101 @@ class TypeParserTest(unittest.TestCase):
 		assert errors[0].line == 1
 		assert errors[0].column == 1
 
+	def test_header_importer(self):
+		with tempfile.TemporaryDirectory() as cache_dir:
+			units = [
+			    ("a.h", "struct shared { int32_t x; }; struct conflict { int32_t a; }; int f(int);"),
+			    ("b.h", "struct shared { int32_t x; }; struct conflict { int64_t b; }; int g(int);"),
+			]
+			importer = HeaderImporter(self.p, parser=self.parser, threads=2, cache_dir=cache_dir)
+			result = importer.parse(units)
+			assert not result.errors, result.errors
+			assert set(str(name) for name in result.functions) == {"f", "g"}
+			assert "shared" in [str(name) for name in result.types]
+			assert [str(name) for name in result.conflicts] == ["conflict"]
+			assert result.duplicates >= 1
+			assert len(os.listdir(cache_dir)) == 2
+
+			cached = HeaderImporter(self.p, parser=self.parser, cache_dir=cache_dir)
+			assert cached.preprocess(units[0][1], units[0][0]) == importer.preprocess(units[0][1], units[0][0])
+
+			bv = BinaryView.new(b"\x00" * 16)
+			bv.platform = self.p
+			importer.define(bv, result, batch_size=1)
+			assert bv.get_type_by_name("shared") is not None
+
+	def test_type_index(self):
+		bv = BinaryView.new(b"\x00" * 16)
+		bv.platform = self.p
+		source = """
+			struct node { struct node* next; int32_t value; };
+			struct link { struct link* next; int32_t value; };
+			struct item { struct item* next; int32_t count; };
+			struct pair { int64_t a; int64_t b; };
+		"""
+		result = self.parse_types_from_source(source)
+		bv.define_user_types([(name, type) for name, type in result.types.items()], None)
+		index = TypeIndex(bv)
+		node, link, item, pair = (bv.get_type_id(name) for name in ("node", "link", "item", "pair"))
+
+		assert sorted(index.find_equal(node)) == sorted([node, link])
+		assert sorted(index.find_similar(node)) == sorted([node, link, item])
+		assert index.find_equal(bv.get_type_by_name("pair")) == [pair]
+		assert sorted(index.duplicates()[0]) == sorted([node, link])
+		assert index.fingerprint(node) == index.fingerprint(Type.named_type_from_registered_type(bv, "link"))
+		assert index.fingerprint(node) != index.fingerprint(item)
+
+	def test_type_library_mapping(self):
+		lib = bn.TypeLibrary.new(self.p.arch, "test_lazy")
+		lib.add_platform(self.p)
+		for name in ["std::vector", "std::chrono::duration", "stdio", "other"]:
+			lib.add_named_type(name, Type.int(4))
+		lib.add_named_object("f", Type.function(Type.void(), []))
+
+		lazy = lib.lazy_named_types(cache_size=1)
+		assert len(lazy) == 4
+		assert "stdio" in lazy and "missing" not in lazy
+		assert [str(name) for name in lazy.names_with_prefix("std")] == ["std::chrono::duration", "std::vector", "stdio"]
+		assert [str(name) for name in lazy.names_in_namespace("std")] == ["std::vector"]
+		assert len(lazy.names_in_namespace("std", recursive=True)) == 2
+		assert lazy["other"] == Type.int(4)
+		assert lazy["other"] == Type.int(4)
+		assert lazy.hits == 1 and lazy.misses == 1
+		with self.assertRaises(KeyError):
+			lazy["missing"]
+
+		objects = lib.lazy_named_objects()
+		assert list(objects) == [QualifiedName("f")]
+		assert objects["f"].type_class == bn.TypeClass.FunctionTypeClass
+
+	def test_type_archive_sync(self):
+		with tempfile.TemporaryDirectory() as directory:
+			archive = bn.TypeArchive.create(os.path.join(directory, "sync.bnta"), self.p)
+			views = [BinaryView.new(b"\x00" * 16) for _ in range(2)]
+			for view in views:
+				view.platform = self.p
+			result = self.parse_types_from_source("struct inner { int32_t a; }; struct outer { struct inner i; };")
+			views[0].define_user_types([(name, type) for name, type in result.types.items()], None)
+
+			events = []
+			with bn.TypeArchiveSync(archive, views) as sync:
+				sync.subscribe(lambda archive, event, id: events.append((event, id)))
+				pushed = sync.push_types(views[0], [views[0].get_type_id("outer")], batch_size=1)
+				assert pushed is not None and len(pushed) == 2
+				assert ("added", archive.get_type_id("inner")) in events
+				assert not sync.pending(views[0])
+
+				outer = archive.get_type_id("outer")
+				assert set(sync.closure([outer])) == {outer, archive.get_type_id("inner")}
+				assert sync.pull_types([outer], [views[1]])[views[1]] is not None
+				assert views[1].get_type_by_name("inner") is not None
+
+				archive.add_type("inner", Type.structure([(Type.int(8), "b")]))
+				assert archive.get_type_id("inner") in sync.pending(views[1])
+				sync.pull()
+				assert not sync.pending(views[1])
+				assert views[1].get_type_by_name("inner").width == 8
+
 
 class TestTypePrinter(unittest.TestCase):
 	def test_getlines(self):
@@ -2339,6 +2448,53 @@ class TestWithFunction(TestWithBinaryView):
 		dtr.add_integer_token(line.tokens, itt, 0)
 		dtr.wrap_comment(line.tokens, line, "beans", False)
 
+	def test_ssa_def_use_graph(self):
+		for il in (self.func.mlil, self.func.hlil):
+			ssa = il.ssa_form
+			graph = il.ssa_def_use_graph()
+			ssa_vars = ssa.ssa_vars
+			assert len(graph) == len(ssa_vars)
+			for ssa_var in ssa_vars:
+				i = graph.index_of(ssa_var)
+				assert graph.ssa_var(i) == ssa_var
+				definition = ssa.get_ssa_var_definition(ssa_var)
+				if definition is None:
+					assert graph.definition[i] == -1
+				else:
+					assert graph.definition[i] == (definition.instr_index if il is self.func.mlil else definition.expr_index)
+				assert len(graph.uses_of(i)) == len(ssa.get_ssa_var_uses(ssa_var))
+			assert list(graph.memory_version) == sorted(set(graph.memory_version))
+			for i, version in enumerate(graph.memory_version):
+				assert len(graph.memory_uses_of(i)) == len(ssa.get_ssa_memory_uses(version))
+				definition = ssa.get_ssa_memory_definition(version)
+				if definition is None:
+					assert graph.memory_definition[i] == -1
+				else:
+					assert graph.memory_definition[i] == (definition.instr_index if il is self.func.mlil else definition.expr_index)
+			adjacency = graph.adjacency()
+			for i in range(len(graph)):
+				for use in graph.uses_of(i):
+					if graph.definition[i] >= 0:
+						assert i in adjacency[graph.definition[i]][use]["vars"]
+
+	def test_flow_summary_cache(self):
+		cache = FlowSummaryCache.for_view(self.bv)
+		assert FlowSummaryCache.for_view(self.bv) is cache
+		summary = cache.get(self.func)
+		assert summary.start == self.func.start
+		assert summary.parameter_count == len(self.func.parameter_vars)
+		assert summary.returns <= set(range(summary.parameter_count))
+		assert cache.get(self.func) is summary
+		assert self.func in cache
+		for callee in self.func.callees:
+			assert callee in cache
+		cache.invalidate(self.func)
+		assert self.func not in cache
+		assert cache.get(self.func) == summary
+		cache.close()
+		assert FlowSummaryCache.for_view(self.bv) is not cache
+		FlowSummaryCache.for_view(self.bv).close()
+
 
 class TestBinaryView(TestWithBinaryView):
 	def setUp(self):
@@ -3079,6 +3235,251 @@ class TestBinaryView(TestWithBinaryView):
 		assert self.bv.is_offset_writable_semantics(writable_semantics)
 		assert not self.bv.is_offset_writable_semantics(extern_seg)
 
+	def test_function_table(self):
+		table = self.bv.function_table()
+		funcs = list(self.bv.functions)
+		assert len(table) == len(funcs)
+		assert repr(table) == f"<FunctionTable {len(funcs)} functions>"
+		for i, func in enumerate(funcs):
+			assert table.start[i] == func.start
+			assert table.lowest_address[i] == func.lowest_address
+			assert table.highest_address[i] == func.highest_address
+			assert table.size[i] == func.total_bytes
+			assert table.basic_block_count[i] == len(func.basic_blocks)
+			assert table.name[i] == func.name
+			assert table.arch_names[table.arch_id[i]] == func.arch.name
+			assert bool(table.analysis_skipped[i]) == func.analysis_skipped
+
+	def test_iter_strings(self):
+		expected = [(s.start, s.length, s.type, s.value) for s in self.bv.get_strings()]
+		for chunk_size in (0x10, 0x1000, 0x100000):
+			for prefetch in (False, True):
+				result = [(s.start, s.length, s.type, s.value) for s in self.bv.iter_strings(chunk_size=chunk_size, prefetch=prefetch)]
+				assert sorted(result) == sorted(expected)
+		first = next(self.bv.iter_strings())
+		assert (first.start, first.length) == (expected[0][0], expected[0][1])
+		self.assertRaises(ValueError, lambda: next(self.bv.iter_strings(chunk_size=0)))
+
+	def test_symbol_index(self):
+		# bv.symbols takes a one-shot snapshot and must not start tracking symbols
+		assert len(self.bv.symbols) == len(self.bv.get_symbols())
+		assert SymbolIndex._session_key not in self.bv.session_data
+		index = self.bv.symbol_index
+		assert index is self.bv.symbol_index
+		assert self.bv.file.get_view_of_type(self.bv.view_type).symbol_index is index
+		expected = self.bv.get_symbols()
+		assert len(index) == len(expected)
+		for sym in expected:
+			assert sym in index[sym.raw_name]
+			assert sym in index.get_symbols_at(sym.address)
+		start = min(s.address for s in expected)
+		in_range = index.get_symbols_in_range(start, start + 0x100)
+		assert sorted(in_range, key=lambda s: s.address) == in_range
+		assert all(start <= s.address < start + 0x100 for s in in_range)
+		name = expected[0].raw_name
+		assert all(s.raw_name.startswith(name[:2]) for s in index.get_symbols_with_prefix(name[:2]))
+		assert expected[0] in index.get_symbols_with_prefix(name)
+
+		addr = self.bv.entry_point
+		sym = Symbol(SymbolType.DataSymbol, addr, "symbol_index_test")
+		self.bv.define_user_symbol(sym)
+		assert [s.address for s in index["symbol_index_test"]] == [addr]
+		assert "symbol_index_test" in self.bv.symbols
+		assert len(index.get_symbols_with_prefix("symbol_index_")) == 1
+		self.bv.undefine_user_symbol(sym)
+		assert "symbol_index_test" not in index
+		assert index.get("symbol_index_test") is None
+		index.close()
+		assert SymbolIndex._session_key not in self.bv.session_data
+		assert self.bv.symbol_index is not index
+
+	def test_find_all_patterns(self):
+		needle = self.bv.read(self.bv.entry_point, 3)
+		expected = [addr for addr, _ in self.bv.find_all_data(self.bv.start, self.bv.end, needle)]
+		masked = "".join(f"{b:02x}" for b in needle[:2]) + " ??"
+		matches = [m for batch in self.bv.find_all_patterns([needle, masked, (needle, b"\xff\xff\xff")], batch_size=2) for m in batch]
+		assert all(len(batch) <= 2 for batch in self.bv.find_all_patterns([needle], batch_size=2))
+		assert sorted(addr for addr, index, _ in matches if index == 0) == sorted(expected)
+		assert sorted(addr for addr, index, _ in matches if index == 2) == sorted(expected)
+		assert set(expected) <= {addr for addr, index, _ in matches if index == 1}
+		assert all(data == self.bv.read(addr, 3) for addr, _, data in matches)
+		# Tiny windows force matches to straddle window boundaries
+		windowed = [m for batch in self.bv.find_all_patterns([needle, masked, (needle, b"\xff\xff\xff")], chunk_size=5) for m in batch]
+		assert windowed == matches
+		self.assertRaises(ValueError, lambda: list(self.bv.find_all_patterns(["e8 ?"])))
+
+	def test_get_block_statistics(self):
+		start = self.bv.start
+		length = min(self.bv.length, 0x4000)
+		stats = self.bv.get_block_statistics(start, length, 0x400)
+		entropy = self.bv.get_entropy(start, length, 0x400)
+		assert len(stats) == len(entropy)
+		assert repr(stats) == f"<BlockStatistics {len(stats)} blocks>"
+		for i in range(len(stats)):
+			block = self.bv.read(stats.address[i], stats.length[i])
+			assert stats.address[i] == start + i * 0x400
+			assert abs(stats.entropy[i] - entropy[i]) < 0.0001
+			assert list(stats.block_histogram(i)) == [block.count(bytes([b])) for b in range(256)]
+			assert stats.zero_count[i] == block.count(b"\x00")
+			assert 0.0 <= stats.printable_ratio[i] <= 1.0
+			assert stats.longest_zero_run[i] <= stats.zero_count[i]
+		whole = self.bv.get_block_statistics(start, length)
+		assert len(whole) == 1 and whole.length[0] == length
+		assert len(self.bv.get_block_statistics(start, 0)) == 0
+
+	def test_read_into(self):
+		expected = self.bv.read(self.bv.start, 0x100)
+		buf = bytearray(0x100)
+		assert self.bv.read_into(self.bv.start, buf) == len(expected)
+		assert bytes(buf[:len(expected)]) == expected
+		view = memoryview(buf)[0x10:0x20]
+		assert self.bv.read_into(self.bv.start, view) == 0x10
+		assert bytes(view) == expected[:0x10]
+		assert self.bv.read_into(self.bv.start, bytearray()) == 0
+		self.assertRaises(TypeError, lambda: self.bv.read_into(self.bv.start, b"\x00" * 4))
+
+	def test_databuffer_memoryview(self):
+		buf = bn.DataBuffer(b"\x7fELF")
+		view = buf.memoryview()
+		assert bytes(view) == b"\x7fELF"
+		assert buf[1:] == b"ELF"
+		view[0] = 0x41
+		assert bytes(buf) == b"AELF"
+		del buf
+		assert bytes(view) == b"AELF"
+		buf = bn.DataBuffer(b"abcd")
+		view = buf.memoryview()
+		with self.assertRaises(BufferError):
+			buf[0:2] = b"x"
+		del view
+		buf[0:2] = b"x"
+		assert bytes(buf) == b"xcd"
+		assert bytes(bn.DataBuffer(b"").memoryview()) == b""
+		if sys.version_info >= (3, 12):
+			assert bytes(memoryview(buf)) == b"xcd"
+		else:
+			self.assertRaises(TypeError, lambda: memoryview(buf))
+		target = bn.DataBuffer(b"\x00" * 4)
+		assert self.bv.read_into(self.bv.start, target) == 4
+		assert bytes(target) == self.bv.read(self.bv.start, 4)
+
+	def test_typed_records(self):
+		record = self.bv.parse_type_string("struct { uint32_t a; uint16_t b; char c[2]; int64_t d; void* p; }")[0]
+		accessor = self.bv.typed_data_accessor(self.bv.start, Type.array(record, 16))
+		records = accessor.records()
+		assert len(records) == 16
+		assert list(records) == [accessor[i].value for i in range(16)]
+		assert records[-1] == accessor[15].value
+		assert records[2:4] == [accessor[2].value, accessor[3].value]
+		ints = self.bv.typed_data_accessor(self.bv.start, Type.int(2, False)).records(8)
+		assert list(ints) == [self.bv.typed_data_accessor(self.bv.start + i * 2, Type.int(2, False)).value for i in range(8)]
+		self.assertRaises(ValueError, lambda: self.bv.typed_data_accessor(self.bv.start, Type.int(4)).records())
+		self.assertRaises(IndexError, lambda: records[16])
+
+	def test_typed_records_enum(self):
+		enum = Type.enumeration_type(self.bv.arch, EnumerationBuilder.create([("zero", 0), ("one", 1)], 2, sign=False))
+		record = Type.structure([(enum, "kind"), (Type.int(2, False), "value")])
+		accessor = self.bv.typed_data_accessor(self.bv.start, Type.array(record, 8))
+		records = accessor.records()
+		assert list(records) == [accessor[i].value for i in range(8)]
+		try:
+			import numpy
+		except ImportError:
+			return
+		table = records.to_numpy()
+		assert table.dtype["kind"] == numpy.dtype("<u2" if self.bv.endianness == Endianness.LittleEndian else ">u2")
+		assert [int(kind) for kind in table["kind"]] == [int(record["kind"]) for record in records]
+
+	def test_call_graph(self):
+		graph = self.bv.call_graph()
+		assert repr(graph) == f"<CallGraph {len(graph)} edges>"
+		assert len(graph.caller) == len(graph.callee) == len(graph.call_site) == len(graph.arch_id)
+		for func in self.bv.functions:
+			assert sorted(graph.callees_of(func.start)) == sorted(func.callee_addresses)
+			for i in range(len(graph)):
+				if graph.caller[i] == func.start:
+					assert graph.arch_names[graph.arch_id[i]] in [site.arch.name for site in func.call_sites if site.address == graph.call_site[i]]
+		for func in self.bv.functions:
+			expected = [ref.function.start for ref in self.bv.get_code_refs(func.start) if ref.function is not None and func.start in self.bv.get_callees(ref.address, ref.function, ref.arch)]
+			assert sorted(graph.callers_of(func.start)) == sorted(expected)
+
+		tracked = self.bv.call_graph(track=True)
+		func = next(f for f in self.bv.functions if len(tracked.callees_of(f.start)) > 0)
+		self.bv.remove_user_function(func)
+		self.bv.update_analysis_and_wait()
+		assert tracked.callees_of(func.start) == []
+		self.bv.add_user_function(func.start)
+		self.bv.update_analysis_and_wait()
+		assert sorted(tracked.callees_of(func.start)) == sorted(self.bv.get_function_at(func.start).callee_addresses)
+		assert all(arch_id < len(tracked.arch_names) for arch_id in tracked.arch_id)
+		tracked.close()
+
+	def test_dirty_function_tracker(self):
+		self.assertRaises(ValueError, lambda: self.bv.reanalyze_dirty())
+		tracker = self.bv.track_dirty_functions()
+		assert self.bv.track_dirty_functions() is tracker
+		assert tracker.dirty_functions() == []
+		func = next(f for f in self.bv.functions if len(f.callers) > 0)
+		self.bv.write(func.start, self.bv.read(func.start, 1))
+		dirty = tracker.dirty_functions(caller_depth=0)
+		assert func in dirty
+		with_callers = tracker.dirty_functions()
+		assert all(caller in with_callers for caller in func.callers)
+		assert self.bv.reanalyze_dirty() == with_callers
+		assert tracker.dirty_functions() == []
+		self.bv.update_analysis_and_wait()
+		tracker.close()
+		tracker.close()
+		self.assertRaises(ValueError, lambda: self.bv.reanalyze_dirty())
+
+	def test_exit_closes_session_helpers(self):
+		with FileApparatus(self.file_name) as path:
+			with bn.load(os.path.relpath(path)) as bv:
+				bv.track_dirty_functions()
+				bv.symbol_index
+				FlowSummaryCache.for_view(bv)
+				assert FlowSummaryCache._session_key in bv.session_data
+				assert DirtyFunctionTracker._session_key in bv.session_data
+				assert SymbolIndex._session_key in bv.session_data
+			assert DirtyFunctionTracker._session_key not in bv.session_data
+			assert SymbolIndex._session_key not in bv.session_data
+			assert FlowSummaryCache._session_key not in bv.session_data
+
+	def test_flow_graph_export(self):
+		func = max(self.bv.functions, key=lambda f: len(f.basic_blocks))
+		graph = func.create_graph()
+		graph.layout_and_wait()
+		data = graph.export(tokens=True)
+		json.dumps(data)
+		nodes = list(graph)
+		assert (data["width"], data["height"]) == (graph.width, graph.height)
+		assert len(data["nodes"]) == len(nodes)
+		for exported, node in zip(data["nodes"], nodes):
+			assert (exported["x"], exported["y"], exported["width"], exported["height"]) == (node.x, node.y, node.width, node.height)
+			assert [line["text"] for line in exported["lines"]] == [str(line) for line in node.lines]
+			assert ["".join(text for _, text in line["tokens"]) for line in exported["lines"]] == [line["text"] for line in exported["lines"]]
+		assert len(data["edges"]) == sum(len(node.outgoing_edges) for node in nodes)
+
+		functions = list(self.bv.functions)[:8]
+		results = dict(export_function_graphs(functions, max_pending=3))
+		assert sorted(f.start for f in results) == sorted(f.start for f in functions)
+		assert all(len(graph["nodes"]) > 0 for graph in results.values())
+
+	def test_linear_disassembly_exporter(self):
+		expected = "".join(str(line) + "\n" for line in self.bv.get_linear_disassembly())
+		for threads in (1, 4):
+			output = io.StringIO()
+			count = LinearDisassemblyExporter(self.bv, batch_size=100).export(output, threads=threads)
+			assert output.getvalue() == expected
+			assert count == expected.count("\n")
+
+		output = io.StringIO()
+		LinearDisassemblyExporter(self.bv, format="jsonl", text_only=False).export(output)
+		records = [json.loads(line) for line in output.getvalue().splitlines()]
+		assert "".join(record["text"] + "\n" for record in records) == expected
+		assert all("".join(token[1] for token in record["tokens"]) == record["text"] for record in records)
+		self.assertRaises(ValueError, lambda: LinearDisassemblyExporter(self.bv, format="xml"))
+
 
 class TestBinaryViewType(unittest.TestCase):
 	def test_binaryviewtype(self):
@@ -3099,6 +3500,277 @@ class TestBinaryViewType(unittest.TestCase):
 				assert bvt2.is_valid_for_data(bv.parent_view)
 				assert isinstance(bvt2.parse(bv.parent_view), BinaryView)
 
+	def test_analysis_cache(self):
+		with tempfile.TemporaryDirectory() as directory, FileApparatus("helloworld") as filename:
+			cache = AnalysisCache(directory)
+			key = cache.key(filename)
+			assert key == cache.key(filename, {})
+			assert key != cache.key(filename, {"analysis.mode": "basic"})
+			assert cache.entries() == []
+			with bn.load(filename, cache=cache) as bv:
+				functions = len(bv.functions)
+			assert [path for path, _, _ in cache.entries()] == [cache.path_for_key(key)]
+			with bn.load(filename, cache=cache) as bv:
+				assert bv.file.filename == cache.path_for_key(key)
+				assert len(bv.functions) == functions
+			cache.max_size = 0
+			assert cache.evict() > 0
+			assert cache.size == 0
+
+
+def _batch_function_count(bv):
+	return len(bv.functions)
+
+
+class TestBatch(unittest.TestCase):
+	def test_analyze_files(self):
+		with FileApparatus("helloworld") as filename:
+			with bn.load(filename) as bv:
+				expected = len(bv.functions)
+			results = list(analyze_files([filename], _batch_function_count, workers=1, timeout=600, max_core_objects=1 << 30))
+		assert len(results) == 1
+		assert results[0].path == filename
+		assert results[0].ok, results[0].error
+		assert results[0].result == expected
+		assert results[0].elapsed > 0
+		assert isinstance(results[0].memory_usage, dict)
+
+	def test_analyze_files_missing(self):
+		with tempfile.TemporaryDirectory() as directory:
+			missing = os.path.join(directory, "does_not_exist")
+			results = list(analyze_files([missing], _batch_function_count, workers=1, timeout=600))
+		assert len(results) == 1
+		assert results[0].path == missing
+		assert not results[0].ok
+		assert not results[0].timed_out
+		assert results[0].result is None
+		assert results[0].error
+
+
+class TestBatchedActivity(unittest.TestCase):
+	@staticmethod
+	def configuration(name):
+		return json.dumps({"name": f"test.batched.{name}", "title": name, "description": ""})
+
+	def test_batching(self):
+		batches = []
+		completed = []
+
+		def process(batch):
+			batches.append(list(batch))
+			return [item * 2 for item in batch]
+
+		with bn.BatchedActivity(
+		    self.configuration("batching"), lambda item: item, process, lambda item, result: completed.append((item, result)),
+		    batch_size=4, max_delay=1.0
+		) as activity:
+			for i in range(10):
+				activity._enqueue(i)
+			activity.flush()
+			metrics = activity.metrics()
+		assert sorted(completed) == [(i, i * 2) for i in range(10)]
+		assert all(len(batch) <= 4 for batch in batches)
+		assert sorted(item for batch in batches for item in batch) == list(range(10))
+		assert metrics["items"] == 10
+		assert metrics["batches"] == len(batches)
+		assert metrics["queueDepth"] == 0
+		assert metrics["errors"] == 0
+		assert 0 < metrics["meanBatchSize"] <= 4
+
+	def test_flush_and_errors(self):
+		def process(batch):
+			if 3 in batch:
+				raise ValueError("bad batch")
+			return None
+
+		with bn.BatchedActivity(self.configuration("errors"), lambda item: item, process, batch_size=1) as activity:
+			for i in range(5):
+				activity._enqueue(i)
+			activity.flush()
+			assert activity.metrics()["items"] == 5
+			assert activity.metrics()["errors"] == 1
+
+	def test_close(self):
+		completed = []
+		activity = bn.BatchedActivity(
+		    self.configuration("close"), lambda item: item, lambda batch: batch, lambda item, result: completed.append(item),
+		    batch_size=2, max_delay=5.0
+		)
+		worker = activity._worker
+		for i in range(3):
+			activity._enqueue(i)
+		# close processes what is still queued before stopping the worker
+		activity.close()
+		assert sorted(completed) == [0, 1, 2]
+		assert not worker.is_alive()
+		assert activity._worker is None
+		activity.close()
+
+
+class TestActivityProfiler(unittest.TestCase):
+	class Context:
+		# Stand-in for an AnalysisContext of an activity that does not run on a function
+		function = None
+
+	def setUp(self):
+		self.calls = 0
+
+		def action(context):
+			self.calls += 1
+			if getattr(context, "fail", False):
+				raise ValueError("activity failed")
+			time.sleep(0.01)
+
+		self.activity = bn.Activity(json.dumps({"name": "test.profiler", "title": "Profiler", "description": ""}), action=action)
+
+	def tearDown(self):
+		assert bn.ActivityProfiler._active is None
+
+	def test_timings(self):
+		with bn.ActivityProfiler(record_events=True) as profiler:
+			assert profiler.active
+			profiler._record(self.activity, self.Context())
+			profiler._record(self.activity, self.Context())
+		assert not profiler.active
+		stats = profiler.results()["activities"]["test.profiler"]
+		assert stats["calls"] == 2 and self.calls == 2
+		assert stats["seconds"] >= 0.02
+		assert 0.01 <= stats["maxSeconds"] <= stats["seconds"]
+		assert stats["exceptions"] == 0
+		assert profiler.results()["functions"]["test.profiler"][-1]["calls"] == 2
+		assert len(json.loads(profiler.to_chrome_trace())["traceEvents"]) == 2
+		profiler.reset()
+		assert profiler.results() == {"activities": {}, "functions": {}}
+
+	def test_disabled(self):
+		profiler = bn.ActivityProfiler()
+		# The callback only takes the profiling path while a profiler is active
+		self.activity._action(1)
+		assert self.calls == 1
+		assert profiler.results() == {"activities": {}, "functions": {}}
+		profiler.start()
+		profiler.stop()
+		self.activity._action(1)
+		assert self.calls == 2
+		assert profiler.results() == {"activities": {}, "functions": {}}
+
+	def test_exception(self):
+		context = self.Context()
+		context.fail = True
+		with bn.ActivityProfiler() as profiler:
+			self.assertRaises(ValueError, lambda: profiler._record(self.activity, context))
+		stats = profiler.results()["activities"]["test.profiler"]
+		assert stats["calls"] == 1
+		assert stats["exceptions"] == 1
+
+	def test_workflow_machine_profile(self):
+		machine = bn.WorkflowMachine()
+		assert machine.profile(enable=False) is None
+		profiler = machine.profile()
+		assert profiler.active
+		replacement = machine.profile()
+		assert replacement is not profiler and replacement.active and not profiler.active
+		assert machine.profile(enable=False) is replacement
+		assert not replacement.active
+
+
+class TestProject(unittest.TestCase):
+	def test_ingest(self):
+		with tempfile.TemporaryDirectory() as directory:
+			inputs = os.path.join(directory, "inputs")
+			os.makedirs(os.path.join(inputs, "nested"))
+			for name, data in (("a.bin", b"first"), ("b.bin", b"second"), (os.path.join("nested", "c.bin"), b"first")):
+				with open(os.path.join(inputs, name), "wb") as f:
+					f.write(data)
+
+			project = bn.Project.create_project(os.path.join(directory, "test.bnpr"), "ingest")
+			try:
+				stages = []
+				result = project.ingest(inputs, analyze=False, progress_func=lambda stage, done, total: stages.append((stage, done, total)))
+				assert sorted(f.name for f in result.imported) == ["a.bin", "b.bin"]
+				assert list(result.duplicates) == [os.path.join(inputs, "nested", "c.bin")]
+				assert result.duplicates[os.path.join(inputs, "nested", "c.bin")] in [f.id for f in result.imported]
+				assert result.failed == {}
+				assert ("hash", 3, 3) in stages and ("import", 2, 2) in stages
+				assert sorted(f.name for f in project.folders) == ["inputs", "nested"]
+				assert len(project.files) == 2
+
+				again = project.ingest(inputs, analyze=False)
+				assert again.imported == []
+				assert len(again.duplicates) == 3
+				assert len(project.files) == 2
+			finally:
+				project.close()
+
+			project = bn.Project.create_project(os.path.join(directory, "manual.bnpr"), "manual")
+			try:
+				# Files that were only hashed for de-duplication are not picked up for analysis
+				manual = project.create_file_from_path(os.path.join(inputs, "a.bin"), None, "manual.bin")
+				nested = os.path.join(inputs, "nested", "c.bin")
+				result = project.ingest(nested)
+				assert result.duplicates == {nested: manual.id}
+				assert result.analyzed == []
+
+				stages = []
+				stopped = project.ingest(inputs, progress_func=lambda stage, done, total: stages.append((stage, done, total)) or False)
+				assert stages == [("hash", 1, 3)]
+				assert stopped.imported == []
+				assert len(project.files) == 1
+			finally:
+				project.close()
+
+
+class TestDebugInfo(TestWithBinaryView):
+	def register_parser(self, name, size, enabled):
+		address = self.bv.entry_point
+
+		def parse(debug_info, view, debug_view, progress):
+			debug_info.add_type("shared_t", Type.int(size))
+			debug_info.add_type(f"{name}_t", Type.int(size))
+			debug_info.add_function(DebugFunctionInfo(address=address, short_name=f"{name}_function"))
+			debug_info.add_data_variable(address + 0x10, Type.int(size), f"{name}_var")
+			return True
+
+		# Only valid while the test runs so the parsers do not leak into other tests
+		return DebugInfoParser.register(name, lambda view: enabled[0], parse)
+
+	def test_merge_priority(self):
+		enabled = [True]
+		try:
+			high = self.register_parser("test.debuginfo.high", 4, enabled)
+			low = self.register_parser("test.debuginfo.low", 2, enabled)
+			results = parse_debug_info_parallel(self.bv, parsers=[low, high])
+			assert [result.parser.name for result in results] == [low.name, high.name]
+			assert all(result.error is None for result in results)
+
+			merged = merge_debug_info(results, priority=[high.name, low.name])
+			assert [result.parser.name for result in merged] == [high.name, low.name]
+			high_result, low_result = merged
+			assert high_result.removed == 0
+			assert low_result.removed == 3
+
+			high_types = dict(high_result.debug_info.types_from_parser(high.name))
+			low_types = dict(low_result.debug_info.types_from_parser(low.name))
+			assert high_types["shared_t"].width == 4
+			assert "shared_t" not in low_types and f"{low.name}_t" in low_types
+			assert [f.short_name for f in high_result.debug_info.functions_from_parser(high.name)] == [f"{high.name}_function"]
+			assert list(low_result.debug_info.functions_from_parser(low.name)) == []
+			assert [v.name for v in high_result.debug_info.data_variables_from_parser(high.name)] == [f"{high.name}_var"]
+			assert list(low_result.debug_info.data_variables_from_parser(low.name)) == []
+
+			# Without a priority the order of the results decides
+			reversed_results = merge_debug_info(parse_debug_info_parallel(self.bv, parsers=[low, high]))
+			assert [result.removed for result in reversed_results] == [0, 3]
+		finally:
+			enabled[0] = False
+
+	def test_empty_parser_list(self):
+		assert parse_debug_info_parallel(self.bv, parsers=[]) == []
+		assert merge_debug_info([]) == []
+		type_names = [name for name, _ in self.bv.debug_info.types]
+		assert apply_debug_info_parallel(self.bv, parsers=[]) == []
+		assert [name for name, _ in self.bv.debug_info.types] == type_names
+
 
 class TestArchitecture(TestWithBinaryView):
 	def test_available_patches_x86(self):
@@ -3278,6 +3950,50 @@ class LowLevelILTests(TestWithBinaryView):
 		for item in reg_or_flag_ssa_list:
 			self.assertIsInstance(item, SSARegisterOrFlag)
 
+	def test_LLILFlatView(self):
+		view = self.llil.flat_view()
+		self.assertEqual(len(view), self.llil.get_expr_count())
+		self.assertEqual(len(view.instructions), len(self.llil))
+		for flat, instr in zip(view, self.llil.instructions):
+			self.assertEqual(flat.expr_index, instr.expr_index)
+			self.assertEqual(flat.operation, instr.operation)
+			self.assertEqual(flat.size, instr.size)
+			self.assertEqual(flat.address, instr.address)
+			self.assertEqual(flat.raw_operands, instr.raw_operands)
+			self.assertEqual(flat.instruction, instr)
+
+		expected = [i.expr_index for i in self.llil.traverse(lambda i: i)]
+		self.assertEqual(list(view.walk()), expected)
+
+		stores = list(view.exprs_with_operation(LowLevelILOperation.LLIL_STORE))
+		self.assertEqual(len(stores), len([i for i in self.llil.traverse(lambda i: i if isinstance(i, LowLevelILStore) else None)]))
+		for store in stores:
+			self.assertEqual(store.child_indices, [store.instruction.dest.expr_index, store.instruction.src.expr_index])
+
+		# Every operand decoded by the LowLevelILInstruction classes must be reachable through the operand slot table.
+		# Wrapper expressions (call parameter lists, SSA outputs) are unwrapped by the classes, so compare subtrees.
+		for expr_index in view.walk():
+			instr = view[expr_index].instruction
+			reachable = set(view.walk(expr_index))
+			for name, value, _ in instr.detailed_operands:
+				values = value if isinstance(value, list) else [value]
+				for operand in values:
+					if isinstance(operand, LowLevelILInstruction):
+						self.assertIn(operand.expr_index, reachable, f"{instr.operation.name}.{name}")
+
+	def test_LLILWalk(self):
+		everything = list(self.llil.traverse(lambda i: i))
+		self.assertEqual(list(self.llil.walk(lambda i: i)), everything)
+
+		loads = {LowLevelILOperation.LLIL_LOAD}
+		expected = [i for i in everything if i.operation == LowLevelILOperation.LLIL_LOAD]
+		self.assertEqual(list(self.llil.walk(lambda i: i, operations=loads)), expected)
+
+		roots = list(self.llil.instructions)
+		self.assertEqual(list(self.llil.walk(lambda i: ILTraverseAction.PruneChildren if i in roots else i)), [])
+		self.assertEqual(list(self.llil.walk(lambda i: i, skip_operations=set(LowLevelILOperation))), roots)
+		self.assertEqual(list(self.llil.walk(post_cb=lambda i: i))[-1], roots[-1])
+
 	def test_LLILFunction(self):
 		arch = self.bv.arch
 		source_func = self.func